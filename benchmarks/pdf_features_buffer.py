@@ -0,0 +1,72 @@
+import argparse
+import pickle
+import time
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFeaturesBuffer import PdfFeaturesBuffer
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
+
+
+def get_xml(pages_count: int, lines_count: int) -> bytes:
+    xml_pages = list()
+    for page_number in range(1, pages_count + 1):
+        fontspecs = [
+            '<fontspec id="0" size="12" family="Times" color="#000000"/>',
+            '<fontspec id="1" size="18" family="Times-Bold" color="#000000"/>',
+        ]
+        texts = list()
+        for line_index in range(lines_count):
+            top = 50 + 15 * line_index
+            for column_index in range(line_index % 3 + 1):
+                left = 72 + 160 * column_index
+                content = " ".join(WORDS[(line_index + column_index + offset) % len(WORDS)] for offset in range(3))
+                if line_index % 10 == 0:
+                    content = f'<a href="http://example.com/{page_number}/{line_index}">{content}</a>'
+                font = 1 if line_index % 25 == 0 else 0
+                texts.append(f'<text top="{top}" left="{left}" width="150" height="12" font="{font}">{content}</text>')
+        xml_pages.append(
+            f'<page number="{page_number}" position="absolute" top="0" left="0" height="842" width="595">'
+            + "".join(fontspecs if page_number == 1 else [])
+            + "".join(texts)
+            + "</page>"
+        )
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n<pdf2xml>' + "".join(xml_pages) + "</pdf2xml>").encode()
+
+
+def get_best_seconds(function, repeats: int) -> float:
+    best_seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+    return best_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare pickle with PdfFeaturesBuffer on a synthetic document.")
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=15)
+    arguments = parser.parse_args()
+
+    pdf_features = PdfFeatures.from_poppler_etree(get_xml(arguments.pages, arguments.lines))
+    pdf_features.set_token_styles()
+    tokens_count = sum(len(page.tokens) for page in pdf_features.pages)
+    pickled = pickle.dumps(pdf_features)
+    packed = PdfFeaturesBuffer.pack(pdf_features)
+    assert PdfFeaturesBuffer.unpack(packed) == pdf_features
+
+    results = [
+        ("pickle dumps", len(pickled), lambda: pickle.dumps(pdf_features)),
+        ("pickle loads", len(pickled), lambda: pickle.loads(pickled)),
+        ("buffer pack", len(packed), lambda: PdfFeaturesBuffer.pack(pdf_features)),
+        ("buffer unpack", len(packed), lambda: PdfFeaturesBuffer.unpack(packed)),
+    ]
+    print(f"{arguments.pages} pages, {tokens_count} tokens, best of {arguments.repeats}")
+    for name, bytes_count, function in results:
+        print(f"{name:15} {get_best_seconds(function, arguments.repeats) * 1000:8.1f} ms {bytes_count / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+import time
+
+ADJUST_INTERVAL_SECONDS = 5
+HIGH_LOAD_PER_CORE = 1.25
+LOW_LOAD_PER_CORE = 0.75
+MIN_AVAILABLE_MEMORY_FRACTION = 0.1
+
+
+class AdaptiveConcurrency:
+    def __init__(self, max_jobs: int, cores: int | None = None):
+        self.max_jobs = max(1, max_jobs)
+        self.jobs = self.max_jobs
+        self.cores = cores if cores else os.cpu_count() or 1
+        self.last_update = time.monotonic()
+
+    def update(self) -> int:
+        if time.monotonic() - self.last_update < ADJUST_INTERVAL_SECONDS:
+            return self.jobs
+
+        self.last_update = time.monotonic()
+        return self.adjust(self.get_load_per_core(), self.get_available_memory_fraction())
+
+    def adjust(self, load_per_core: float, available_memory_fraction: float) -> int:
+        if available_memory_fraction < MIN_AVAILABLE_MEMORY_FRACTION or load_per_core > HIGH_LOAD_PER_CORE:
+            self.jobs = max(1, self.jobs - 1)
+        elif load_per_core < LOW_LOAD_PER_CORE:
+            self.jobs = min(self.max_jobs, self.jobs + 1)
+        return self.jobs
+
+    def get_load_per_core(self) -> float:
+        try:
+            return os.getloadavg()[0] / self.cores
+        except (AttributeError, OSError):
+            return 0
+
+    @staticmethod
+    def get_available_memory_fraction() -> float:
+        try:
+            with open("/proc/meminfo") as meminfo:
+                values = {line.split(":")[0]: int(line.split()[1]) for line in meminfo if len(line.split()) > 1}
+        except (OSError, ValueError):
+            return 1
+
+        if not values.get("MemTotal") or "MemAvailable" not in values:
+            return 1
+        return values["MemAvailable"] / values["MemTotal"]
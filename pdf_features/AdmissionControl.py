@@ -0,0 +1,81 @@
+import threading
+from enum import StrEnum
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pdf_features.ExtractionCost import ExtractionCost, DEFAULT_COST_MODEL
+from pdf_features.ExtractionCostModel import ExtractionCostModel
+
+
+class AdmissionDecision(StrEnum):
+    ACCEPT = "Accept"
+    QUEUE = "Queue"
+    REJECT = "Reject"
+
+
+class Admission(BaseModel):
+    decision: AdmissionDecision
+    reason: str = ""
+    cost: ExtractionCost
+    seconds: float
+    peak_memory_bytes: int
+
+    @property
+    def accepted(self) -> bool:
+        return self.decision == AdmissionDecision.ACCEPT
+
+
+class AdmissionControl:
+    def __init__(
+        self,
+        workers: int = 1,
+        max_seconds: float | None = None,
+        max_memory_bytes: int | None = None,
+        max_pages: int | None = None,
+        cost_model: ExtractionCostModel = DEFAULT_COST_MODEL,
+    ):
+        self.workers = max(1, workers)
+        self.max_seconds = max_seconds
+        self.max_memory_bytes = max_memory_bytes
+        self.max_pages = max_pages
+        self.cost_model = cost_model
+        self.running = 0
+        self.lock = threading.Lock()
+
+    def get_rejection_reason(self, cost: ExtractionCost, seconds: float, peak_memory_bytes: int) -> str:
+        if self.max_pages and cost.get_pages_count() > self.max_pages:
+            return f"{cost.get_pages_count()} pages exceed the {self.max_pages} pages budget"
+        if self.max_memory_bytes and peak_memory_bytes > self.max_memory_bytes:
+            return f"{peak_memory_bytes} bytes exceed the {self.max_memory_bytes} bytes memory budget"
+        if self.max_seconds and seconds > self.max_seconds:
+            return f"{seconds:.1f} seconds exceed the {self.max_seconds} seconds budget"
+        return ""
+
+    def check(self, cost: ExtractionCost) -> Admission:
+        seconds = cost.get_seconds(self.cost_model)
+        peak_memory_bytes = cost.get_peak_memory_bytes(self.cost_model)
+        reason = self.get_rejection_reason(cost, seconds, peak_memory_bytes)
+        decision = AdmissionDecision.REJECT if reason else AdmissionDecision.ACCEPT
+        return Admission(decision=decision, reason=reason, cost=cost, seconds=seconds, peak_memory_bytes=peak_memory_bytes)
+
+    def acquire(self, cost: ExtractionCost) -> Admission:
+        admission = self.check(cost)
+        if not admission.accepted:
+            return admission
+
+        with self.lock:
+            if self.running >= self.workers:
+                return admission.model_copy(update={"decision": AdmissionDecision.QUEUE, "reason": "All workers are busy"})
+            self.running += 1
+        return admission
+
+    def release(self, admission: Admission):
+        if not admission.accepted:
+            return
+
+        with self.lock:
+            self.running = max(0, self.running - 1)
+
+    def admit(self, path: str | Path) -> Admission:
+        return self.acquire(ExtractionCost.from_path(path))
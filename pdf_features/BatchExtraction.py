@@ -0,0 +1,406 @@
+import hashlib
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from enum import StrEnum
+from os.path import join
+from pathlib import Path
+
+from pdf_features.AdaptiveConcurrency import AdaptiveConcurrency
+from pdf_features.AdmissionControl import AdmissionControl
+from pdf_features.CompressedXml import CompressedXml
+from pdf_features.ConversionLimits import ConversionLimits, FallbackPolicy
+from pdf_features.ConversionReport import ConversionReport
+from pdf_features.ExtractionCost import ExtractionCost
+from pdf_features.ExtractionJob import ExtractionJob
+from pdf_features.ExtractionManifest import ExtractionManifest
+from pdf_features.ExtractionResult import ExtractionResult
+from pdf_features.ExtractionSummary import ExtractionSummary
+from pdf_features.ExtractionTask import ExtractionTask
+from pdf_features.ParallelPdfFeatures import ParallelPdfFeatures
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFeaturesBuffer import PdfFeaturesBuffer
+from pdf_features.PdfFeaturesJsonl import PdfFeaturesJsonl
+from pdf_features.ProfileCapture import ProfileCapture
+
+HASH_CHUNK_SIZE = 1 << 20
+MANIFEST_NAME = "manifest.jsonl"
+SMALL_JOB_SECONDS = 0.5
+BUNDLE_SECONDS = 2
+
+
+class ExtractionFormat(StrEnum):
+    JSONL = "jsonl"
+    MARKDOWN = "markdown"
+    HTML = "html"
+    BINARY = "binary"
+
+    @property
+    def suffix(self) -> str:
+        return {
+            ExtractionFormat.JSONL: ".jsonl",
+            ExtractionFormat.MARKDOWN: ".md",
+            ExtractionFormat.HTML: ".html",
+            ExtractionFormat.BINARY: ".pdff",
+        }[self]
+
+
+class BatchExtraction:
+    def __init__(
+        self,
+        output_path: str | Path,
+        output_format: ExtractionFormat = ExtractionFormat.JSONL,
+        jobs: int = 1,
+        manifest_path: str | Path | None = None,
+        force: bool = False,
+        limits: ConversionLimits | None = None,
+        split_pages: int | None = None,
+        admission_control: AdmissionControl | None = None,
+        use_threads: bool = False,
+        profile_capture: ProfileCapture | None = None,
+    ):
+        self.output_path = Path(output_path)
+        self.output_format = ExtractionFormat(output_format)
+        self.jobs = max(1, jobs)
+        self.manifest = ExtractionManifest.from_path(manifest_path if manifest_path else self.output_path / MANIFEST_NAME)
+        self.force = force
+        self.limits = limits
+        self.split_pages = split_pages
+        self.admission_control = admission_control
+        self.use_threads = use_threads
+        self.profile_capture = profile_capture
+
+    @staticmethod
+    def get_source_paths(inputs: list[str | Path]) -> dict[Path, Path]:
+        roots_and_relative_paths: dict[Path, tuple[Path, Path]] = dict()
+        for input_path in map(Path, inputs):
+            if not input_path.is_dir():
+                root_and_relative_path = (input_path.absolute().parent, Path(input_path.name))
+                roots_and_relative_paths.setdefault(input_path.absolute(), root_and_relative_path)
+                continue
+
+            for path in sorted(input_path.rglob("*")):
+                if path.suffix.lower() == ".pdf":
+                    root_and_relative_path = (input_path.absolute(), path.relative_to(input_path))
+                    roots_and_relative_paths.setdefault(path.absolute(), root_and_relative_path)
+        return BatchExtraction.get_unique_relative_paths(roots_and_relative_paths)
+
+    @staticmethod
+    def get_unique_relative_paths(roots_and_relative_paths: dict[Path, tuple[Path, Path]]) -> dict[Path, Path]:
+        relative_paths = {source_path: relative_path for source_path, (_, relative_path) in roots_and_relative_paths.items()}
+        source_paths_by_output: dict[Path, list[Path]] = dict()
+        for source_path, relative_path in relative_paths.items():
+            source_paths_by_output.setdefault(relative_path.with_suffix(""), []).append(source_path)
+
+        for source_paths in [source_paths for source_paths in source_paths_by_output.values() if len(source_paths) > 1]:
+            relative_paths.update(BatchExtraction.get_disambiguated_paths(source_paths, roots_and_relative_paths))
+
+        outputs = [relative_path.with_suffix("") for relative_path in relative_paths.values()]
+        if len(set(outputs)) != len(outputs):
+            colliding_outputs = sorted({str(output) for output in outputs if outputs.count(output) > 1})
+            raise ValueError(f"Inputs map to the same output file: {', '.join(colliding_outputs)}")
+
+        return relative_paths
+
+    @staticmethod
+    def get_disambiguated_paths(
+        source_paths: list[Path], roots_and_relative_paths: dict[Path, tuple[Path, Path]]
+    ) -> dict[Path, Path]:
+        root_parts = {source_path: roots_and_relative_paths[source_path][0].parts[1:] for source_path in source_paths}
+        disambiguated_paths: dict[Path, Path] = dict()
+        for parents_count in range(1, max(len(parts) for parts in root_parts.values()) + 1):
+            disambiguated_paths = {
+                source_path: Path(*root_parts[source_path][-parents_count:]) / roots_and_relative_paths[source_path][1]
+                for source_path in source_paths
+            }
+            if len({path.with_suffix("") for path in disambiguated_paths.values()}) == len(source_paths):
+                break
+        return disambiguated_paths
+
+    @staticmethod
+    def get_content_hash(path: Path) -> str:
+        content_hash = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                content_hash.update(chunk)
+        return content_hash.hexdigest()
+
+    def get_output_file_path(self, relative_path: Path) -> Path:
+        return self.output_path / relative_path.with_suffix(self.output_format.suffix)
+
+    def run(self, inputs: list[str | Path]) -> ExtractionSummary:
+        start = time.perf_counter()
+        summary = ExtractionSummary()
+        jobs: list[ExtractionJob] = list()
+
+        for source_path, relative_path in self.get_source_paths(inputs).items():
+            try:
+                content_hash = self.get_content_hash(source_path)
+                cost = ExtractionCost.from_path(source_path)
+            except OSError as error:
+                self.add_result(summary, ExtractionResult(source_path=str(source_path), error=str(error)))
+                continue
+
+            if not self.force and self.manifest.is_up_to_date(str(source_path), content_hash):
+                summary.add_result(ExtractionResult(source_path=str(source_path), content_hash=content_hash, skipped=True))
+                continue
+
+            admission = self.admission_control.check(cost) if self.admission_control else None
+            if admission and not admission.accepted:
+                error = f"Rejected: {admission.reason}"
+                self.add_result(
+                    summary, ExtractionResult(source_path=str(source_path), content_hash=content_hash, error=error)
+                )
+                continue
+
+            output_file_path = self.get_output_file_path(relative_path)
+            jobs.append(
+                ExtractionJob(
+                    source_path=source_path, output_file_path=output_file_path, content_hash=content_hash, cost=cost
+                )
+            )
+
+        if self.jobs == 1:
+            for job in jobs:
+                result = self.extract(
+                    job.source_path,
+                    job.output_file_path,
+                    self.output_format,
+                    job.content_hash,
+                    self.limits,
+                    self.profile_capture,
+                )
+                self.add_result(summary, result)
+        else:
+            with tempfile.TemporaryDirectory() as decrypted_directory:
+                self.run_tasks(self.get_tasks(jobs, Path(decrypted_directory)), summary)
+
+        if self.profile_capture:
+            self.profile_capture.profile_pending()
+
+        summary.seconds = time.perf_counter() - start
+        return summary
+
+    def get_tasks(self, jobs: list[ExtractionJob], decrypted_directory: Path) -> list[ExtractionTask]:
+        tasks: list[ExtractionTask] = list()
+        small_jobs: list[ExtractionJob] = list()
+        for job_index, job in enumerate(jobs):
+            page_ranges = job.get_page_ranges(self.split_pages)
+            if page_ranges:
+                job.decrypted_path = self.decrypt_pdf(job.source_path, decrypted_directory / f"{job_index}.pdf")
+                seconds_per_page = job.cost.seconds / job.cost.get_pages_count()
+                for range_index, (first_page, last_page) in enumerate(page_ranges):
+                    seconds = ((last_page or job.cost.get_pages_count()) - first_page + 1) * seconds_per_page
+                    tasks.append(
+                        ExtractionTask(
+                            jobs=[job], seconds=seconds, page_range=(first_page, last_page), range_index=range_index
+                        )
+                    )
+            elif job.cost.seconds < SMALL_JOB_SECONDS:
+                small_jobs.append(job)
+            else:
+                tasks.append(ExtractionTask(jobs=[job], seconds=job.cost.seconds))
+
+        bundles: list[ExtractionTask] = list()
+        for job in small_jobs:
+            if not bundles or bundles[-1].seconds >= BUNDLE_SECONDS:
+                bundles.append(ExtractionTask(jobs=[]))
+            bundles[-1].add_job(job)
+
+        return sorted(tasks + bundles, key=lambda task: task.seconds, reverse=True)
+
+    def decrypt_pdf(self, source_path: Path, decrypted_path: Path) -> Path | None:
+        try:
+            limits = self.limits or ConversionLimits()
+            conversion_path = PdfFeatures.decrypt_pdf(str(source_path), str(decrypted_path), limits, ConversionReport())
+        except OSError:
+            return None
+        return decrypted_path if conversion_path == str(decrypted_path) else None
+
+    def run_tasks(self, tasks: list[ExtractionTask], summary: ExtractionSummary):
+        concurrency = AdaptiveConcurrency(self.jobs)
+        pending_tasks: deque[ExtractionTask] = deque(tasks)
+        page_ranges: dict[Path, list] = dict()
+        running: dict[Future, ExtractionTask] = dict()
+        executor_class = ThreadPoolExecutor if self.use_threads else ProcessPoolExecutor
+        with executor_class(max_workers=self.jobs) as executor:
+            while pending_tasks or running:
+                while pending_tasks and len(running) < concurrency.jobs:
+                    task = pending_tasks.popleft()
+                    task_page_ranges = page_ranges.pop(task.jobs[0].source_path) if task.merge else None
+                    future = executor.submit(
+                        self.run_task, task, self.output_format, self.limits, task_page_ranges, self.profile_capture
+                    )
+                    running[future] = task
+
+                done_futures, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    self.add_task_result(summary, running.pop(future), future, page_ranges, pending_tasks)
+                concurrency.update()
+
+    def add_task_result(
+        self,
+        summary: ExtractionSummary,
+        task: ExtractionTask,
+        future: Future,
+        page_ranges: dict[Path, list],
+        pending_tasks: deque[ExtractionTask],
+    ):
+        try:
+            output = future.result()
+        except Exception as error:
+            output = error
+
+        if task.page_range:
+            job = task.jobs[0]
+            job_page_ranges = page_ranges.setdefault(job.source_path, [None] * len(job.get_page_ranges(self.split_pages)))
+            job_page_ranges[task.range_index] = output
+            if any(page_range is None for page_range in job_page_ranges):
+                return
+
+            errors = [repr(page_range) for page_range in job_page_ranges if isinstance(page_range, Exception)]
+            if not errors:
+                pending_tasks.appendleft(ExtractionTask(jobs=[job], merge=True))
+                return
+
+            del page_ranges[job.source_path]
+            output = errors[0]
+
+        if isinstance(output, (Exception, str)):
+            error = output if isinstance(output, str) else repr(output)
+            output = [
+                ExtractionResult(source_path=str(job.source_path), content_hash=job.content_hash, error=error)
+                for job in task.jobs
+            ]
+
+        for result in output:
+            self.add_result(summary, result)
+
+    @staticmethod
+    def run_task(
+        task: ExtractionTask,
+        output_format: ExtractionFormat,
+        limits: ConversionLimits | None = None,
+        page_ranges: list | None = None,
+        profile_capture: ProfileCapture | None = None,
+    ):
+        if task.page_range:
+            return ParallelPdfFeatures.convert_page_range(task.jobs[0].get_conversion_path(), task.page_range, limits)
+
+        if task.merge:
+            return [BatchExtraction.merge_page_ranges(task.jobs[0], page_ranges, output_format)]
+
+        return [
+            BatchExtraction.extract(
+                job.source_path, job.output_file_path, output_format, job.content_hash, limits, profile_capture
+            )
+            for job in task.jobs
+        ]
+
+    def add_result(self, summary: ExtractionSummary, result: ExtractionResult):
+        self.manifest.add_result(result)
+        summary.add_result(result)
+
+    @staticmethod
+    def extract(
+        source_path: Path,
+        output_file_path: Path,
+        output_format: ExtractionFormat,
+        content_hash: str = "",
+        limits: ConversionLimits | None = None,
+        profile_capture: ProfileCapture | None = None,
+    ) -> ExtractionResult:
+        start = time.perf_counter()
+        result = ExtractionResult(source_path=str(source_path), content_hash=content_hash, output_path=str(output_file_path))
+        try:
+            pdf_features = BatchExtraction.get_pdf_features(source_path, limits, profile_capture)
+            BatchExtraction.write_result(pdf_features, output_file_path, output_format, result)
+        except Exception as error:
+            result.error = repr(error)
+        finally:
+            result.seconds = time.perf_counter() - start
+
+        return result
+
+    @staticmethod
+    def merge_page_ranges(job: ExtractionJob, page_ranges: list, output_format: ExtractionFormat) -> ExtractionResult:
+        start = time.perf_counter()
+        result = ExtractionResult(
+            source_path=str(job.source_path), content_hash=job.content_hash, output_path=str(job.output_file_path)
+        )
+        try:
+            pdf_features = ParallelPdfFeatures.merge_page_ranges(
+                page_ranges, job.source_path.name, job.source_path.parent.name
+            )
+            BatchExtraction.write_result(pdf_features, job.output_file_path, output_format, result)
+        except Exception as error:
+            result.error = repr(error)
+        finally:
+            result.seconds = time.perf_counter() - start + sum(page_range[2].seconds for page_range in page_ranges)
+
+        return result
+
+    @staticmethod
+    def write_result(
+        pdf_features: PdfFeatures | None, output_file_path: Path, output_format: ExtractionFormat, result: ExtractionResult
+    ):
+        if not pdf_features:
+            result.error = "No PDF features extracted"
+            return
+
+        result.conversion_report = pdf_features.conversion_report()
+        if result.conversion_report.fallback == FallbackPolicy.EMPTY:
+            result.error = f"Conversion stopped: {result.conversion_report.reason}"
+            return
+
+        pdf_features.set_token_styles()
+        BatchExtraction.write_output(pdf_features, output_file_path, output_format)
+        result.pages_count = len(pdf_features.pages)
+        result.tokens_count = sum(len(page.tokens) for page in pdf_features.pages)
+
+    @staticmethod
+    def get_pdf_features(
+        source_path: Path, limits: ConversionLimits | None = None, profile_capture: ProfileCapture | None = None
+    ) -> PdfFeatures | None:
+        if profile_capture and CompressedXml.is_xml_path(source_path):
+            return profile_capture.from_poppler_etree(source_path, file_name=source_path.name)
+
+        if profile_capture:
+            return profile_capture.from_pdf_path(str(source_path), limits)
+
+        if CompressedXml.is_xml_path(source_path):
+            return PdfFeatures.from_poppler_etree(source_path, file_name=source_path.name)
+
+        with tempfile.TemporaryDirectory() as xml_directory:
+            return PdfFeatures.from_pdf_path(str(source_path), join(xml_directory, "pdf_etree.xml"), limits=limits)
+
+    @staticmethod
+    def write_output(pdf_features: PdfFeatures, output_file_path: Path, output_format: ExtractionFormat):
+        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = output_file_path.with_name(output_file_path.name + ".tmp")
+        with open(temporary_path, "wb") as output_file:
+            if output_format == ExtractionFormat.JSONL:
+                PdfFeaturesJsonl.write_pdf_features(pdf_features, output_file)
+            elif output_format == ExtractionFormat.MARKDOWN:
+                output_file.write(BatchExtraction.get_markdown(pdf_features).encode("utf-8"))
+            elif output_format == ExtractionFormat.HTML:
+                output_file.write(BatchExtraction.get_html(pdf_features).encode("utf-8"))
+            else:
+                output_file.write(PdfFeaturesBuffer.pack(pdf_features))
+        os.replace(temporary_path, output_file_path)
+
+    @staticmethod
+    def get_markdown(pdf_features: PdfFeatures) -> str:
+        return "\n\n".join("\n".join(token.content_markdown for token in page.tokens) for page in pdf_features.pages)
+
+    @staticmethod
+    def get_html(pdf_features: PdfFeatures) -> str:
+        pages_html = [
+            f'<div class="page" data-page-number="{page.page_number}">\n'
+            + "".join(f"{token.content_html}<br>\n" for token in page.tokens)
+            + "</div>\n"
+            for page in pdf_features.pages
+        ]
+        return "<html>\n<body>\n" + "".join(pages_html) + "</body>\n</html>\n"
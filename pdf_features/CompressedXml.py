@@ -0,0 +1,136 @@
+import gzip
+import os
+import shutil
+import zlib
+from enum import StrEnum
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pdf_features.configuration import XML_NAME
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+class Compression(StrEnum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffix(self) -> str:
+        return {Compression.GZIP: ".gz", Compression.ZSTD: ".zst"}[self]
+
+    @property
+    def magic(self) -> bytes:
+        return {Compression.GZIP: b"\x1f\x8b", Compression.ZSTD: b"\x28\xb5\x2f\xfd"}[self]
+
+    @staticmethod
+    def from_header(header: bytes) -> "Compression | None":
+        for compression in Compression:
+            if header.startswith(compression.magic):
+                return compression
+        return None
+
+    @staticmethod
+    def get_default() -> "Compression":
+        return Compression.ZSTD if CompressedXml.get_zstd_module() else Compression.GZIP
+
+
+class CompressedXml:
+    @staticmethod
+    def get_zstd_module():
+        try:
+            from compression import zstd
+
+            return zstd
+        except ImportError:
+            pass
+
+        try:
+            import zstandard
+
+            return zstandard
+        except ImportError:
+            return None
+
+    @staticmethod
+    def get_decompressor(compression: Compression):
+        if compression == Compression.GZIP:
+            return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+
+        zstd = CompressedXml.get_zstd_module()
+        if zstd is None:
+            raise ImportError("Reading zstd compressed XML requires Python 3.14 or the zstandard package")
+        if zstd.__name__ == "zstandard":
+            return zstd.ZstdDecompressor().decompressobj()
+        return zstd.ZstdDecompressor()
+
+    @staticmethod
+    def decompress_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        chunks = iter(chunks)
+        first_chunk = next(chunks, b"")
+        compression = Compression.from_header(bytes(first_chunk[:4]))
+        if not compression:
+            yield from chain([first_chunk], chunks) if first_chunk else chunks
+            return
+
+        decompressor = CompressedXml.get_decompressor(compression)
+        for chunk in chain([first_chunk], chunks):
+            while chunk:
+                decompressed_chunk = decompressor.decompress(chunk)
+                if decompressed_chunk:
+                    yield decompressed_chunk
+                if not getattr(decompressor, "eof", False):
+                    break
+                chunk = decompressor.unused_data
+                decompressor = CompressedXml.get_decompressor(compression)
+
+    @staticmethod
+    def is_xml_path(path: str | Path) -> bool:
+        name = Path(path).name.lower()
+        return any(name.endswith(".xml" + suffix) for suffix in ["", *[compression.suffix for compression in Compression]])
+
+    @staticmethod
+    def get_existing_path(xml_path: str | Path) -> str:
+        for compression in [None, *Compression]:
+            path = str(xml_path) + (compression.suffix if compression else "")
+            if os.path.exists(path):
+                return path
+        return str(xml_path)
+
+    @staticmethod
+    def compress_file(xml_path: str | Path, compression: Compression | None = None) -> Path:
+        compression = Compression(compression) if compression else Compression.get_default()
+        xml_path = Path(xml_path)
+        compressed_path = xml_path.with_name(xml_path.name + compression.suffix)
+        temporary_path = compressed_path.with_name(compressed_path.name + ".tmp")
+        with open(xml_path, "rb") as xml_file:
+            if compression == Compression.GZIP:
+                with gzip.open(temporary_path, "wb", compresslevel=GZIP_LEVEL) as compressed_file:
+                    shutil.copyfileobj(xml_file, compressed_file)
+            else:
+                CompressedXml.write_zstd(xml_file, temporary_path)
+
+        shutil.copystat(xml_path, temporary_path)
+        os.replace(temporary_path, compressed_path)
+        os.remove(xml_path)
+        return compressed_path
+
+    @staticmethod
+    def write_zstd(xml_file, compressed_path: Path):
+        zstd = CompressedXml.get_zstd_module()
+        if zstd is None:
+            raise ImportError("Writing zstd compressed XML requires Python 3.14 or the zstandard package")
+
+        if zstd.__name__ == "zstandard":
+            with open(compressed_path, "wb") as compressed_file:
+                zstd.ZstdCompressor(level=ZSTD_LEVEL).copy_stream(xml_file, compressed_file)
+            return
+
+        with zstd.open(compressed_path, "wb", level=ZSTD_LEVEL) as compressed_file:
+            shutil.copyfileobj(xml_file, compressed_file)
+
+    @staticmethod
+    def compress_tree(root_path: str | Path, compression: Compression | None = None, xml_name: str = XML_NAME) -> list[Path]:
+        return [CompressedXml.compress_file(xml_path, compression) for xml_path in sorted(Path(root_path).rglob(xml_name))]
@@ -0,0 +1,72 @@
+import logging
+import os
+import signal
+import subprocess
+import sys
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+from pdf_features.ConversionReport import ConversionReason
+
+logger = logging.getLogger(__name__)
+MEMORY_ERROR_MESSAGES = ("out of memory", "bad_alloc", "memoryerror", "cannot allocate")
+RLIMITS_WRAPPER = """
+import os, resource, sys
+memory_bytes, cpu_seconds = int(sys.argv[1]), int(sys.argv[2])
+if memory_bytes:
+    resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+if cpu_seconds:
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+os.execvp(sys.argv[3], sys.argv[3:])
+"""
+
+
+class FallbackPolicy(StrEnum):
+    RETRY_WITHOUT_HIDDEN = "retry_without_hidden"
+    PARTIAL = "partial"
+    EMPTY = "empty"
+
+
+class ConversionLimits(BaseModel):
+    timeout_seconds: float | None = None
+    memory_bytes: int | None = None
+    cpu_seconds: int | None = None
+    fallback_policy: FallbackPolicy = FallbackPolicy.RETRY_WITHOUT_HIDDEN
+
+    def has_rlimits(self) -> bool:
+        return bool(self.memory_bytes or self.cpu_seconds) and os.name == "posix"
+
+    def get_limited_command(self, command: list[str]) -> list[str]:
+        if not self.has_rlimits():
+            return command
+
+        limits = [str(self.memory_bytes or 0), str(self.cpu_seconds or 0)]
+        return [sys.executable, "-c", RLIMITS_WRAPPER, *limits, *command]
+
+    def run(self, command: list[str]) -> ConversionReason:
+        try:
+            process = subprocess.run(self.get_limited_command(command), stderr=subprocess.PIPE, timeout=self.timeout_seconds)
+        except subprocess.TimeoutExpired:
+            return ConversionReason.TIMEOUT
+
+        stderr = process.stderr.decode("utf-8", errors="ignore")
+        if stderr:
+            logger.warning("%s: %s", command[0], stderr.rstrip())
+
+        if process.returncode == 0:
+            return ConversionReason.OK
+
+        return self.get_failure_reason(process.returncode, stderr)
+
+    def get_failure_reason(self, return_code: int, stderr: str) -> ConversionReason:
+        if self.cpu_seconds and return_code in (-signal.SIGXCPU, -signal.SIGKILL):
+            return ConversionReason.CPU_LIMIT
+
+        if self.memory_bytes and (
+            return_code in (-signal.SIGABRT, -signal.SIGSEGV)
+            or any(message in stderr.lower() for message in MEMORY_ERROR_MESSAGES)
+        ):
+            return ConversionReason.MEMORY_LIMIT
+
+        return ConversionReason.FAILED
@@ -0,0 +1,54 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class ConversionReason(StrEnum):
+    OK = "ok"
+    TIMEOUT = "timeout"
+    MEMORY_LIMIT = "memory_limit"
+    CPU_LIMIT = "cpu_limit"
+    FAILED = "failed"
+
+    @property
+    def limit_fired(self) -> bool:
+        return self in {ConversionReason.TIMEOUT, ConversionReason.MEMORY_LIMIT, ConversionReason.CPU_LIMIT}
+
+
+class ConversionReport(BaseModel):
+    reason: ConversionReason = ConversionReason.OK
+    fallback: str = ""
+    partial: bool = False
+    timeouts_count: int = 0
+    memory_limits_count: int = 0
+    cpu_limits_count: int = 0
+    commands_count: int = 0
+    seconds: float = 0
+
+    def add_reason(self, reason: ConversionReason):
+        self.commands_count += 1
+        if reason == ConversionReason.TIMEOUT:
+            self.timeouts_count += 1
+        elif reason == ConversionReason.MEMORY_LIMIT:
+            self.memory_limits_count += 1
+        elif reason == ConversionReason.CPU_LIMIT:
+            self.cpu_limits_count += 1
+
+        if reason != ConversionReason.OK:
+            self.reason = reason
+
+    @property
+    def limits_count(self) -> int:
+        return self.timeouts_count + self.memory_limits_count + self.cpu_limits_count
+
+    def merge(self, other: "ConversionReport") -> "ConversionReport":
+        return ConversionReport(
+            reason=other.reason if other.reason != ConversionReason.OK else self.reason,
+            fallback=other.fallback if other.fallback else self.fallback,
+            partial=self.partial or other.partial,
+            timeouts_count=self.timeouts_count + other.timeouts_count,
+            memory_limits_count=self.memory_limits_count + other.memory_limits_count,
+            cpu_limits_count=self.cpu_limits_count + other.cpu_limits_count,
+            commands_count=self.commands_count + other.commands_count,
+            seconds=self.seconds + other.seconds,
+        )
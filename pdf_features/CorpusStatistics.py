@@ -0,0 +1,75 @@
+from collections import Counter
+
+from pydantic import BaseModel
+
+from pdf_features.PdfStatistics import PdfStatistics
+
+
+class CorpusStatistics(BaseModel):
+    documents_count: int = 0
+    tokens_count: int = 0
+    text_heights: dict[int, int] = dict()
+    font_sizes: dict[float, int] = dict()
+    line_spaces: dict[int, int] = dict()
+    prior_weight: float = 100
+
+    def add_statistics(self, pdf_statistics: PdfStatistics):
+        font_sizes: Counter = Counter(self.font_sizes)
+        for font_id, count in pdf_statistics.font_ids.items():
+            font_sizes[pdf_statistics.font_sizes_by_font_id[font_id]] += count
+
+        self.documents_count += 1
+        self.tokens_count += pdf_statistics.tokens_count
+        self.text_heights = dict(Counter(self.text_heights) + Counter(pdf_statistics.text_heights))
+        self.font_sizes = dict(font_sizes)
+        self.line_spaces = dict(Counter(self.line_spaces) + Counter(pdf_statistics.line_spaces))
+
+    def add_pdf_features(self, pdf_features):
+        pdf_statistics = pdf_features.get_statistics()
+        pdf_statistics.reset_text_heights([token for _, token in pdf_features.loop_tokens()])
+        self.add_statistics(pdf_statistics)
+
+    def merge(self, other: "CorpusStatistics") -> "CorpusStatistics":
+        return CorpusStatistics(
+            documents_count=self.documents_count + other.documents_count,
+            tokens_count=self.tokens_count + other.tokens_count,
+            text_heights=dict(Counter(self.text_heights) + Counter(other.text_heights)),
+            font_sizes=dict(Counter(self.font_sizes) + Counter(other.font_sizes)),
+            line_spaces=dict(Counter(self.line_spaces) + Counter(other.line_spaces)),
+            prior_weight=self.prior_weight,
+        )
+
+    @staticmethod
+    def reduce(corpus_statistics_list: list["CorpusStatistics"]) -> "CorpusStatistics":
+        if not corpus_statistics_list:
+            return CorpusStatistics()
+
+        reduced = corpus_statistics_list[0].model_copy(deep=True)
+        for corpus_statistics in corpus_statistics_list[1:]:
+            reduced = reduced.merge(corpus_statistics)
+        return reduced
+
+    def get_prior(self, histogram: dict) -> dict:
+        total = sum(histogram.values())
+        if not total:
+            return dict()
+        return {value: self.prior_weight * count / total for value, count in histogram.items()}
+
+    def get_common_text_height(self, pdf_statistics: PdfStatistics | None = None) -> int | None:
+        text_heights = Counter(pdf_statistics.text_heights if pdf_statistics else dict())
+        text_heights.update(self.get_prior(self.text_heights))
+        return PdfStatistics.get_mode(text_heights)
+
+    def get_font_size_mode(self, pdf_statistics: PdfStatistics | None = None) -> float | None:
+        font_sizes: Counter = Counter()
+        if pdf_statistics:
+            for font_id, count in pdf_statistics.font_ids.items():
+                font_sizes[pdf_statistics.font_sizes_by_font_id[font_id]] += count
+        font_sizes.update(self.get_prior(self.font_sizes))
+        font_size_mode = PdfStatistics.get_mode(font_sizes)
+        return None if font_size_mode is None else float(font_size_mode)
+
+    def get_lines_space_mode(self, pdf_statistics: PdfStatistics | None = None) -> float:
+        line_spaces = Counter(pdf_statistics.line_spaces if pdf_statistics else dict())
+        line_spaces.update(self.get_prior(self.line_spaces))
+        return PdfStatistics.get_mode(line_spaces, initial_value=0)
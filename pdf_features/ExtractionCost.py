@@ -0,0 +1,85 @@
+import mmap
+import re
+import zlib
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pdf_features.CompressedXml import CompressedXml
+from pdf_features.configuration import XML_CHUNK_SIZE
+from pdf_features.ExtractionCostModel import ExtractionCostModel
+
+PDF_PAGE_PATTERN = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+XML_TAG_PATTERN = re.compile(rb"<(page|text)\b")
+BYTES_PER_PAGE = 50_000
+DEFAULT_COST_MODEL = ExtractionCostModel()
+
+
+class ExtractionCost(BaseModel):
+    bytes_count: int = 0
+    pages_count: int | None = None
+    tokens_count: int | None = None
+    is_xml: bool = False
+
+    @staticmethod
+    def from_path(path: str | Path) -> "ExtractionCost":
+        path = Path(path)
+        bytes_count = path.stat().st_size
+        if not CompressedXml.is_xml_path(path):
+            return ExtractionCost(bytes_count=bytes_count, pages_count=ExtractionCost.count_pages(path))
+
+        pages_count, tokens_count = ExtractionCost.count_xml_tags(path)
+        return ExtractionCost(bytes_count=bytes_count, pages_count=pages_count, tokens_count=tokens_count, is_xml=True)
+
+    @staticmethod
+    def count_pages(path: Path) -> int | None:
+        try:
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                pages_count = sum(1 for _ in PDF_PAGE_PATTERN.finditer(mapped_file))
+        except (OSError, ValueError):
+            return None
+        return pages_count if pages_count else None
+
+    @staticmethod
+    def count_xml_tags(path: Path) -> tuple[int | None, int | None]:
+        tags_count = {b"page": 0, b"text": 0}
+        rest = b""
+        try:
+            with open(path, "rb") as file:
+                for chunk in CompressedXml.decompress_chunks(iter(lambda: file.read(XML_CHUNK_SIZE), b"")):
+                    content = rest + bytes(chunk)
+                    last_tag_start = content.rfind(b"<")
+                    for match in XML_TAG_PATTERN.finditer(content, 0, max(0, last_tag_start)):
+                        tags_count[match.group(1)] += 1
+                    rest = content[max(0, last_tag_start) :]
+        except (OSError, EOFError, ValueError, ImportError, zlib.error):
+            return None, None
+
+        for match in XML_TAG_PATTERN.finditer(rest):
+            tags_count[match.group(1)] += 1
+        return (tags_count[b"page"], tags_count[b"text"]) if tags_count[b"page"] else (None, None)
+
+    def get_pages_count(self) -> int:
+        return self.pages_count if self.pages_count else max(1, self.bytes_count // BYTES_PER_PAGE)
+
+    def get_tokens_count(self, cost_model: ExtractionCostModel = DEFAULT_COST_MODEL) -> int:
+        if self.tokens_count is not None:
+            return self.tokens_count
+        if self.is_xml:
+            return int(self.bytes_count / cost_model.xml_bytes_per_token)
+        return int(self.get_pages_count() * cost_model.tokens_per_page)
+
+    def get_seconds(self, cost_model: ExtractionCostModel = DEFAULT_COST_MODEL) -> float:
+        seconds = cost_model.startup_seconds + self.get_tokens_count(cost_model) * cost_model.seconds_per_token
+        if self.is_xml:
+            return seconds
+        return (
+            seconds + self.get_pages_count() * cost_model.seconds_per_page + self.bytes_count * cost_model.seconds_per_byte
+        )
+
+    def get_peak_memory_bytes(self, cost_model: ExtractionCostModel = DEFAULT_COST_MODEL) -> int:
+        return int(cost_model.base_memory_bytes + self.get_tokens_count(cost_model) * cost_model.peak_bytes_per_token)
+
+    @property
+    def seconds(self) -> float:
+        return self.get_seconds()
@@ -0,0 +1,89 @@
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pdf_features.CompressedXml import CompressedXml
+from pdf_features.PdfFeatures import PdfFeatures
+
+
+class ExtractionCostModel(BaseModel):
+    startup_seconds: float = 0.05
+    seconds_per_page: float = 0.02
+    seconds_per_byte: float = 2e-8
+    seconds_per_token: float = 1.3e-4
+    tokens_per_page: float = 80
+    xml_bytes_per_token: float = 95
+    base_memory_bytes: int = 1 << 20
+    peak_bytes_per_token: float = 5300
+
+    @staticmethod
+    def extract(path: str | Path) -> PdfFeatures | None:
+        if CompressedXml.is_xml_path(path):
+            return PdfFeatures.from_poppler_etree(path)
+        return PdfFeatures.from_pdf_path(path)
+
+    @staticmethod
+    def get_max_rss_bytes(who: int) -> int:
+        import resource
+
+        max_rss = resource.getrusage(who).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    @staticmethod
+    def measure(path: str | Path) -> tuple[int, int, float, int]:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return executor.submit(ExtractionCostModel.measure_in_process, str(path)).result()
+
+    @staticmethod
+    def measure_in_process(path: str) -> tuple[int, int, float, int]:
+        import resource
+
+        start_rss_bytes = ExtractionCostModel.get_max_rss_bytes(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        pdf_features = ExtractionCostModel.extract(path)
+        if pdf_features:
+            pdf_features.set_token_styles()
+        seconds = time.perf_counter() - start
+
+        rss_bytes = ExtractionCostModel.get_max_rss_bytes(resource.RUSAGE_SELF) - start_rss_bytes
+        peak_memory_bytes = max(0, rss_bytes) + ExtractionCostModel.get_max_rss_bytes(resource.RUSAGE_CHILDREN)
+        pages = pdf_features.pages if pdf_features else []
+        return len(pages), sum(len(page.tokens) for page in pages), seconds, peak_memory_bytes
+
+    @staticmethod
+    def calibrate(paths: list[str | Path], cost_model: "ExtractionCostModel | None" = None) -> "ExtractionCostModel":
+        cost_model = cost_model if cost_model else ExtractionCostModel()
+        xml_bytes, xml_tokens, tokens, token_seconds, peak_memory_bytes = 0, 0, 0, 0.0, 0
+        pdf_pages, pdf_tokens, pdf_seconds = 0, 0, 0.0
+        for path in paths:
+            bytes_count = Path(path).stat().st_size
+            pages_count, tokens_count, seconds, peak_bytes = ExtractionCostModel.measure(path)
+            if not tokens_count:
+                continue
+
+            tokens += tokens_count
+            peak_memory_bytes += max(0, peak_bytes - cost_model.base_memory_bytes)
+            if CompressedXml.is_xml_path(path):
+                xml_bytes += bytes_count
+                xml_tokens += tokens_count
+                token_seconds += max(0.0, seconds - cost_model.startup_seconds)
+            else:
+                pdf_pages += pages_count
+                pdf_tokens += tokens_count
+                pdf_seconds += max(0.0, seconds - cost_model.startup_seconds - bytes_count * cost_model.seconds_per_byte)
+
+        changes = dict()
+        if tokens:
+            changes["peak_bytes_per_token"] = peak_memory_bytes / tokens
+        if xml_tokens:
+            changes["xml_bytes_per_token"] = xml_bytes / xml_tokens
+            changes["seconds_per_token"] = token_seconds / xml_tokens
+        if pdf_pages:
+            seconds_per_token = changes.get("seconds_per_token", cost_model.seconds_per_token)
+            changes["tokens_per_page"] = pdf_tokens / pdf_pages
+            changes["seconds_per_page"] = max(0.0, pdf_seconds - pdf_tokens * seconds_per_token) / pdf_pages
+        return cost_model.model_copy(update=changes)
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pdf_features.CompressedXml import CompressedXml
+from pdf_features.ExtractionCost import ExtractionCost
+
+
+class ExtractionJob(BaseModel):
+    source_path: Path
+    output_file_path: Path
+    content_hash: str = ""
+    cost: ExtractionCost = ExtractionCost()
+    decrypted_path: Path | None = None
+
+    def get_conversion_path(self) -> Path:
+        return self.decrypted_path if self.decrypted_path else self.source_path
+
+    def get_page_ranges(self, split_pages: int | None) -> list[tuple[int, int | None]]:
+        pages_count = self.cost.pages_count
+        if not split_pages or not pages_count or pages_count <= split_pages or CompressedXml.is_xml_path(self.source_path):
+            return []
+
+        first_pages = list(range(1, pages_count + 1, split_pages))
+        return [(first_page, first_page + split_pages - 1) for first_page in first_pages[:-1]] + [(first_pages[-1], None)]
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pdf_features.ExtractionResult import ExtractionResult
+
+
+class ExtractionManifest(BaseModel):
+    path: str
+    results: dict[str, ExtractionResult] = dict()
+
+    @staticmethod
+    def from_path(path: str | Path) -> "ExtractionManifest":
+        manifest = ExtractionManifest(path=str(path))
+        if not Path(path).exists():
+            return manifest
+
+        with open(path, "rb") as manifest_file:
+            for line in manifest_file:
+                if not line.strip():
+                    continue
+                try:
+                    result = ExtractionResult.model_validate_json(line)
+                except ValueError:
+                    continue
+                manifest.results[result.source_path] = result
+
+        return manifest
+
+    def is_up_to_date(self, source_path: str, content_hash: str) -> bool:
+        result = self.results.get(source_path)
+        if not result or result.failed or result.content_hash != content_hash:
+            return False
+        return Path(result.output_path).exists()
+
+    def add_result(self, result: ExtractionResult):
+        self.results[result.source_path] = result
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as manifest_file:
+            manifest_file.write(result.model_dump_json() + "\n")
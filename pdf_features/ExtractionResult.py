@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from pdf_features.ConversionReport import ConversionReport
+
+
+class ExtractionResult(BaseModel):
+    source_path: str
+    content_hash: str = ""
+    output_path: str = ""
+    pages_count: int = 0
+    tokens_count: int = 0
+    seconds: float = 0
+    skipped: bool = False
+    error: str = ""
+    conversion_report: ConversionReport = ConversionReport()
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.error)
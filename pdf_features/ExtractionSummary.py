@@ -0,0 +1,58 @@
+from pydantic import BaseModel
+
+from pdf_features.ExtractionResult import ExtractionResult
+
+
+class ExtractionSummary(BaseModel):
+    files_count: int = 0
+    extracted_count: int = 0
+    skipped_count: int = 0
+    failed_count: int = 0
+    pages_count: int = 0
+    tokens_count: int = 0
+    timeouts_count: int = 0
+    memory_limits_count: int = 0
+    cpu_limits_count: int = 0
+    partial_count: int = 0
+    seconds: float = 0
+
+    def add_result(self, result: ExtractionResult):
+        self.files_count += 1
+        if result.skipped:
+            self.skipped_count += 1
+            return
+
+        self.timeouts_count += result.conversion_report.timeouts_count
+        self.memory_limits_count += result.conversion_report.memory_limits_count
+        self.cpu_limits_count += result.conversion_report.cpu_limits_count
+        if result.failed:
+            self.failed_count += 1
+            return
+
+        self.extracted_count += 1
+        self.partial_count += result.conversion_report.partial
+        self.pages_count += result.pages_count
+        self.tokens_count += result.tokens_count
+
+    def get_pages_per_second(self) -> float:
+        return self.pages_count / self.seconds if self.seconds else 0
+
+    def get_tokens_per_second(self) -> float:
+        return self.tokens_count / self.seconds if self.seconds else 0
+
+    def __str__(self):
+        return (
+            f"{self.files_count} files: {self.extracted_count} extracted, {self.skipped_count} skipped, "
+            f"{self.failed_count} failed in {self.seconds:.1f}s "
+            f"({self.get_pages_per_second():.1f} pages/s, {self.get_tokens_per_second():.0f} tokens/s)"
+            + self.get_limits_summary()
+        )
+
+    def get_limits_summary(self) -> str:
+        if not self.timeouts_count + self.memory_limits_count + self.cpu_limits_count:
+            return ""
+
+        return (
+            f", limits fired: {self.timeouts_count} timeouts, {self.memory_limits_count} memory, "
+            f"{self.cpu_limits_count} cpu, {self.partial_count} partial documents"
+        )
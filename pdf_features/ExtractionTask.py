@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from pdf_features.ExtractionJob import ExtractionJob
+
+
+class ExtractionTask(BaseModel):
+    jobs: list[ExtractionJob]
+    seconds: float = 0
+    page_range: tuple[int, int | None] | None = None
+    range_index: int = 0
+    merge: bool = False
+
+    def add_job(self, job: ExtractionJob):
+        self.jobs.append(job)
+        self.seconds += job.cost.seconds
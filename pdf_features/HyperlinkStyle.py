@@ -1,6 +1,6 @@
 from enum import StrEnum
 from lxml.etree import ElementBase
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class HyperlinkType(StrEnum):
@@ -10,20 +10,35 @@ class HyperlinkType(StrEnum):
 
 
 class HyperlinkStyle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     link_text: str = ""
     link: str = ""
     type: HyperlinkType = HyperlinkType.NO_LINK
 
+    additional_links: tuple["HyperlinkStyle", ...] = ()
+
     @staticmethod
     def from_xml_tag(xml_tag: ElementBase, content: str) -> "HyperlinkStyle":
-        links = xml_tag.findall(".//a")
-        if not links:
-            return HyperlinkStyle(link_text="", link="", type=HyperlinkType.NO_LINK)
+        return HyperlinkStyle.from_link_elements(xml_tag.findall(".//a"), content)
+
+    @staticmethod
+    def from_link_elements(link_elements: list[ElementBase], content: str) -> "HyperlinkStyle":
+        hyperlink_styles = [HyperlinkStyle.from_link_element(link_element, content) for link_element in link_elements]
+        hyperlink_styles = [hyperlink_style for hyperlink_style in hyperlink_styles if hyperlink_style != NO_HYPERLINK_STYLE]
+        if not hyperlink_styles:
+            return NO_HYPERLINK_STYLE
+
+        if len(hyperlink_styles) == 1:
+            return hyperlink_styles[0]
 
-        link_element = links[0]
+        return hyperlink_styles[0].model_copy(update={"additional_links": tuple(hyperlink_styles[1:])})
+
+    @staticmethod
+    def from_link_element(link_element: ElementBase, content: str) -> "HyperlinkStyle":
         link = link_element.attrib.get("href", "")
         if not link:
-            return HyperlinkStyle(link="", type=HyperlinkType.NO_LINK)
+            return NO_HYPERLINK_STYLE
 
         link_text = "".join(link_element.itertext()).strip()
         if link.startswith("http"):
@@ -31,16 +46,67 @@ class HyperlinkStyle(BaseModel):
             if link_text and link_text in content:
                 return HyperlinkStyle(link_text=link_text, link=link, type=HyperlinkType.WEB_URL)
             else:
-                return HyperlinkStyle(link_text="", link="", type=HyperlinkType.NO_LINK)
+                return NO_HYPERLINK_STYLE
         else:
             return HyperlinkStyle(link_text=link_text, link=link, type=HyperlinkType.DOCUMENT_REFERENCE)
 
+    @staticmethod
+    def get_links_by_text_element(xml_page: ElementBase) -> dict[ElementBase, list[ElementBase]]:
+        links_by_text_element: dict[ElementBase, list[ElementBase]] = dict()
+        for link_element in xml_page.iter("a"):
+            text_element = next(link_element.iterancestors("text"), None)
+            if text_element is not None:
+                links_by_text_element.setdefault(text_element, []).append(link_element)
+        return links_by_text_element
+
+    def get_links(self) -> list["HyperlinkStyle"]:
+        return [self, *self.additional_links]
+
+    def get_link_spans(self, content: str) -> list[tuple[int, int, "HyperlinkStyle"]]:
+        web_links = [link for link in self.get_links() if link.type == HyperlinkType.WEB_URL and link.link_text]
+        candidates: list[tuple[int, int, int]] = list()
+        for link_index, web_link in enumerate(web_links):
+            start = content.find(web_link.link_text)
+            while start >= 0:
+                candidates.append((start, -len(web_link.link_text), link_index))
+                start = content.find(web_link.link_text, start + 1)
+
+        spans: list[tuple[int, int, HyperlinkStyle]] = list()
+        used_link_indexes: set[int] = set()
+        last_end = 0
+        for start, negative_length, link_index in sorted(candidates):
+            if start < last_end or link_index in used_link_indexes:
+                continue
+            last_end = start - negative_length
+            spans.append((start, last_end, web_links[link_index]))
+            used_link_indexes.add(link_index)
+        return spans
+
+    def get_linked_content(self, content: str, render_link) -> str:
+        parts: list[str] = list()
+        position = 0
+        for start, end, web_link in self.get_link_spans(content):
+            parts.append(content[position:start])
+            parts.append(render_link(web_link))
+            position = end
+        parts.append(content[position:])
+        return "".join(parts)
+
     def get_styled_content_markdown(self, content: str) -> str:
+        if self.additional_links:
+            return self.get_linked_content(content, lambda link: f"[{link.link_text}]({link.link})")
+
         if self.type != HyperlinkType.WEB_URL:
             return content
         return f"{content.replace(self.link_text, f'[{self.link_text}]')}({self.link})"
 
     def get_styled_content_html(self, content: str) -> str:
+        if self.additional_links:
+            return self.get_linked_content(content, lambda link: f'<a href="{link.link}">{link.link_text}</a>')
+
         if self.type != HyperlinkType.WEB_URL:
             return content
         return content.replace(self.link_text, f'<a href="{self.link}">{self.link_text}</a>')
+
+
+NO_HYPERLINK_STYLE = HyperlinkStyle()
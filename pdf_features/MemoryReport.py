@@ -0,0 +1,78 @@
+import sys
+
+from pydantic import BaseModel
+
+from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfPage import PdfPage
+
+
+class PageMemoryReport(BaseModel):
+    page_number: int
+    tokens_count: int
+    total_bytes: int
+
+
+class MemoryReport(BaseModel):
+    pages_count: int = 0
+    tokens_count: int = 0
+    pages_bytes: int = 0
+    tokens_bytes: int = 0
+    contents_bytes: int = 0
+    rectangles_bytes: int = 0
+    styles_bytes: int = 0
+    contexts_bytes: int = 0
+    fonts_bytes: int = 0
+    total_bytes: int = 0
+    peak_memory_bytes: int = 0
+    pages: list[PageMemoryReport] = list()
+
+    def get_bytes_per_token(self) -> float:
+        return self.total_bytes / self.tokens_count if self.tokens_count else 0
+
+    def get_bytes_per_page(self) -> float:
+        return self.total_bytes / self.pages_count if self.pages_count else 0
+
+    @staticmethod
+    def get_model_size(model: BaseModel) -> int:
+        size = sys.getsizeof(model) + sys.getsizeof(model.__dict__) + sys.getsizeof(model.__pydantic_fields_set__)
+        return size + sum(sys.getsizeof(value) for value in model.__dict__.values() if isinstance(value, (int, float, str)))
+
+    @staticmethod
+    def from_pages(pages: list[PdfPage], fonts: list[PdfFont], peak_memory_bytes: int = 0) -> "MemoryReport":
+        report = MemoryReport(pages_count=len(pages), peak_memory_bytes=peak_memory_bytes)
+        seen_ids: set[int] = set()
+
+        def get_shared_size(model: BaseModel) -> int:
+            if id(model) in seen_ids:
+                return 0
+            seen_ids.add(id(model))
+            return MemoryReport.get_model_size(model)
+
+        report.fonts_bytes = sys.getsizeof(fonts) + sum(get_shared_size(font) for font in fonts)
+
+        for page in pages:
+            page_bytes = MemoryReport.get_model_size(page) + sys.getsizeof(page.tokens)
+            tokens_bytes, contents_bytes, rectangles_bytes, styles_bytes, contexts_bytes = 0, 0, 0, 0, 0
+            for token in page.tokens:
+                tokens_bytes += sys.getsizeof(token) + sys.getsizeof(token.__dict__)
+                tokens_bytes += sys.getsizeof(token.__pydantic_fields_set__) + sys.getsizeof(token.__pydantic_private__)
+                contents_bytes += sys.getsizeof(token.content) + sys.getsizeof(token.id)
+                rectangles_bytes += MemoryReport.get_model_size(token.bounding_box)
+                styles_bytes += get_shared_size(token.token_style) + get_shared_size(token.token_style.hyperlink_style)
+                contexts_bytes += get_shared_size(token.pdf_token_context)
+                report.fonts_bytes += get_shared_size(token.font)
+
+            report.tokens_count += len(page.tokens)
+            report.pages_bytes += page_bytes
+            report.tokens_bytes += tokens_bytes
+            report.contents_bytes += contents_bytes
+            report.rectangles_bytes += rectangles_bytes
+            report.styles_bytes += styles_bytes
+            report.contexts_bytes += contexts_bytes
+            page_total = page_bytes + tokens_bytes + contents_bytes + rectangles_bytes + styles_bytes + contexts_bytes
+            report.pages.append(
+                PageMemoryReport(page_number=page.page_number, tokens_count=len(page.tokens), total_bytes=page_total)
+            )
+
+        report.total_bytes = report.fonts_bytes + sum(page.total_bytes for page in report.pages)
+        return report
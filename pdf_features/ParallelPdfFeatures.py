@@ -0,0 +1,212 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from os.path import join, exists
+from pathlib import Path
+
+from lxml import etree
+from lxml.etree import ElementBase, XMLSyntaxError
+
+from pdf_features.CompressedXml import CompressedXml
+from pdf_features.ConversionLimits import ConversionLimits
+from pdf_features.ConversionReport import ConversionReport
+from pdf_features.CorpusStatistics import CorpusStatistics
+from pdf_features.ListLevel import ListLevel
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFeaturesBuffer import PdfFeaturesBuffer
+from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfStatistics import PdfStatistics
+from pdf_features.Rectangle import Rectangle
+from pdf_features.ScriptType import ScriptType
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
+
+CHUNKS_PER_WORKER = 4
+
+
+class ParallelPdfFeatures:
+    @staticmethod
+    def get_workers(workers: int | None) -> int:
+        return max(1, workers if workers else os.cpu_count() or 1)
+
+    @staticmethod
+    def get_chunks(items: list, workers: int) -> list[list]:
+        chunk_size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+        return [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    @staticmethod
+    def from_pdf_path(
+        pdf_path, xml_path: str | Path = None, workers: int | None = None, limits: ConversionLimits | None = None
+    ) -> PdfFeatures | None:
+        if not xml_path:
+            with tempfile.TemporaryDirectory() as xml_directory:
+                xml_path = join(xml_directory, "pdf_etree.xml")
+                return ParallelPdfFeatures.from_pdf_path(pdf_path, xml_path, workers, limits)
+
+        xml_path = str(xml_path)
+        conversion_report = PdfFeatures.pdf_to_poppler_etree(pdf_path, xml_path, limits)
+        file_name, file_type = Path(pdf_path).name, Path(pdf_path).absolute().parent.name
+        pdf_features = ParallelPdfFeatures.from_poppler_etree(xml_path, file_name, file_type, workers)
+        return PdfFeatures.with_conversion_report(pdf_features, conversion_report, file_name, file_type)
+
+    @staticmethod
+    def from_paths(
+        paths: list[str | Path], workers: int | None = None, limits: ConversionLimits | None = None
+    ) -> list[PdfFeatures | None]:
+        with ThreadPoolExecutor(max_workers=ParallelPdfFeatures.get_workers(workers)) as executor:
+            return list(executor.map(ParallelPdfFeatures.from_path, paths, repeat(limits)))
+
+    @staticmethod
+    def from_path(path: str | Path, limits: ConversionLimits | None = None) -> PdfFeatures | None:
+        if CompressedXml.is_xml_path(path):
+            return PdfFeatures.from_poppler_etree(path, file_name=Path(path).name)
+        return PdfFeatures.from_pdf_path(str(path), limits=limits)
+
+    @staticmethod
+    def convert_page_range(
+        pdf_path: str | Path, page_range: tuple[int, int | None], limits: ConversionLimits | None = None
+    ) -> tuple[bytes, list[tuple[str, str, str, str]], ConversionReport]:
+        with tempfile.TemporaryDirectory() as xml_directory:
+            xml_path = join(xml_directory, "pdf_etree.xml")
+            report = PdfFeatures.pdf_to_poppler_etree(str(pdf_path), xml_path, limits, page_range, decrypt=False)
+            root: ElementBase | None = PdfFeatures.parse_poppler_etree(xml_path) if exists(xml_path) else None
+
+        pdf_features = PdfFeatures.from_poppler_root(root, pdf_path, Path(pdf_path).name)
+        fontspecs = [
+            (fontspec.get("id", ""), fontspec.get("size", ""), fontspec.get("family", ""), fontspec.get("color", ""))
+            for fontspec in (root.iter("fontspec") if root is not None else [])
+        ]
+        return PdfFeaturesBuffer.pack(pdf_features), fontspecs, report
+
+    @staticmethod
+    def merge_page_ranges(
+        page_ranges: list[tuple[bytes, list[tuple[str, str, str, str]], ConversionReport]],
+        file_name: str,
+        file_type: str = "",
+    ) -> PdfFeatures:
+        font_ids_by_fontspec: dict[tuple[str, str, str, int], str] = dict()
+        fonts_by_font_id: dict[str, PdfFont] = dict()
+        pages: list[PdfPage] = list()
+        conversion_report = ConversionReport()
+        for packed_pages, fontspecs, range_report in page_ranges:
+            range_font_ids: dict[str, str] = dict()
+            for font_id, size, family, color in fontspecs:
+                range_font_ids[font_id] = font_ids_by_fontspec.setdefault(
+                    (size, family, color), str(len(font_ids_by_fontspec))
+                )
+
+            range_pdf_features = PdfFeaturesBuffer.unpack(packed_pages)
+            ParallelPdfFeatures.set_font_ids(range_pdf_features, range_font_ids, fonts_by_font_id)
+            pages.extend(range_pdf_features.pages)
+            conversion_report = conversion_report.merge(range_report)
+
+        pdf_features = PdfFeatures(
+            pages=pages, fonts=list(fonts_by_font_id.values()), file_name=file_name, file_type=file_type
+        )
+        pdf_features._conversion_report = conversion_report
+        return pdf_features
+
+    @staticmethod
+    def set_font_ids(pdf_features: PdfFeatures, font_ids: dict[str, str], fonts_by_font_id: dict[str, PdfFont]):
+        fonts: dict[int, PdfFont] = dict()
+        for font in pdf_features.fonts:
+            font_id = font_ids.get(font.font_id, font.font_id)
+            if font_id not in fonts_by_font_id:
+                fonts_by_font_id[font_id] = PdfFont.get_shared(**(font.model_dump() | {"font_id": font_id}))
+            fonts[id(font)] = fonts_by_font_id[font_id]
+
+        for _, token in pdf_features.loop_tokens():
+            font = fonts.get(id(token.font), token.font)
+            if font is not token.font:
+                token.font = font
+                token.token_style = token.token_style.copy_with(font=font)
+
+    @staticmethod
+    def from_poppler_etree(
+        file_path: str | Path, file_name: str | None = None, dataset: str | None = None, workers: int | None = None
+    ) -> PdfFeatures | None:
+        try:
+            root: ElementBase | None = PdfFeatures.parse_poppler_etree(file_path)
+        except (FileNotFoundError, IsADirectoryError, UnicodeDecodeError, XMLSyntaxError):
+            return None
+
+        workers = ParallelPdfFeatures.get_workers(workers)
+        if root is None or workers == 1:
+            return PdfFeatures.from_poppler_root(root, file_path, file_name, dataset)
+
+        fonts: list[PdfFont] = PdfFont.from_poppler_etree(root)
+        xml_pages: list[bytes] = [etree.tostring(tree_page) for tree_page in root.findall(".//page")]
+        pages: list[PdfPage] = list()
+        statistics = PdfStatistics()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = ParallelPdfFeatures.get_chunks(xml_pages, workers)
+            for packed_pages, chunk_statistics in executor.map(
+                ParallelPdfFeatures.process_pages, chunks, repeat(fonts), repeat(file_name)
+            ):
+                pages.extend(PdfFeaturesBuffer.unpack(packed_pages).pages)
+                statistics = statistics.merge(chunk_statistics)
+
+        return PdfFeatures.from_analyzed_pages(
+            pages,
+            fonts,
+            Path(file_path).name if not file_name else file_name,
+            Path(file_path).parent.name if not dataset else dataset,
+            statistics.get_pdf_modes(),
+            statistics,
+        )
+
+    @staticmethod
+    def process_pages(xml_pages: list[bytes], fonts: list[PdfFont], pdf_name: str | None) -> tuple[bytes, PdfStatistics]:
+        fonts_by_font_id: dict[str, PdfFont] = {font.font_id: font for font in fonts}
+        parser = etree.XMLParser(recover=True, encoding="utf-8")
+        pages: list[PdfPage] = [
+            PdfPage.from_poppler_etree(etree.fromstring(xml_page, parser=parser), fonts_by_font_id, pdf_name)
+            for xml_page in xml_pages
+        ]
+        pdf_features = PdfFeatures(pages=pages, fonts=fonts, file_name="", file_type="")
+        return PdfFeaturesBuffer.pack(pdf_features), pdf_features.get_statistics()
+
+    @staticmethod
+    def set_token_styles(
+        pdf_features: PdfFeatures, corpus_statistics: CorpusStatistics | None = None, workers: int | None = None
+    ):
+        workers = ParallelPdfFeatures.get_workers(workers)
+        if workers == 1 or len(pdf_features.pages) < 2:
+            pdf_features.set_token_styles(corpus_statistics)
+            return
+
+        pdf_features.set_modes(corpus_statistics)
+        pages_values = [
+            (
+                [token.bounding_box for token in page.tokens],
+                [token.content for token in page.tokens],
+                [token.token_type for token in page.tokens],
+            )
+            for page in pdf_features.pages
+        ]
+        common_text_height = pdf_features.pdf_modes.common_text_height
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = ParallelPdfFeatures.get_chunks(pages_values, workers)
+            pages_token_styles = [
+                page_token_styles
+                for chunk_token_styles in executor.map(
+                    ParallelPdfFeatures.get_token_styles, chunks, repeat(common_text_height)
+                )
+                for page_token_styles in chunk_token_styles
+            ]
+
+        for page, page_token_styles in zip(pdf_features.pages, pages_token_styles):
+            page.apply_token_styles(page_token_styles)
+
+        pdf_features.reset_token_index()
+
+    @staticmethod
+    def get_token_styles(
+        pages_values: list[tuple[list[Rectangle], list[str], list[TokenType]]], common_text_height: int
+    ) -> list[list[tuple[TitleType, ScriptType, ListLevel | None]]]:
+        return [
+            PdfPage.get_token_styles(boxes, contents, token_types, common_text_height)
+            for boxes, contents, token_types in pages_values
+        ]
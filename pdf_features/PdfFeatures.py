@@ -1,113 +1,233 @@
-import json
+import logging
+import mmap
 import os
 import subprocess
 import tempfile
-from collections import Counter
-from itertools import groupby
+import time
+import tracemalloc
 from os.path import join, exists
 from pathlib import Path
-from statistics import mode
 from subprocess import CalledProcessError
+from typing import BinaryIO, Iterable, Iterator
 from lxml import etree
 from lxml.etree import ElementBase, XMLSyntaxError
-from pydantic import BaseModel
-
-from pdf_features.configuration import LABELS_FILE_NAME, TOKEN_TYPE_RELATIVE_PATH, XML_NAME
+from pydantic import BaseModel, Field, PrivateAttr
+
+from pdf_features.CompressedXml import CompressedXml
+from pdf_features.configuration import LABELS_FILE_NAME, TOKEN_TYPE_RELATIVE_PATH, XML_CHUNK_SIZE, XML_NAME
+from pdf_features.ConversionLimits import ConversionLimits, FallbackPolicy
+from pdf_features.ConversionReport import ConversionReport
+from pdf_features.CorpusStatistics import CorpusStatistics
+from pdf_features.MemoryReport import MemoryReport
 from pdf_features.PdfFont import PdfFont
 from pdf_features.PdfModes import PdfModes
+from pdf_features.PdfOutline import PdfOutline
 from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfPageCache import PdfPageCache
+from pdf_features.PdfParagraph import PdfParagraph
+from pdf_features.PdfStatistics import PdfStatistics
 from pdf_features.PdfToken import PdfToken
-from pdf_features.ListLevel import ListLevel
+from pdf_features.PdfTokenIndex import PdfTokenIndex
+from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.PdfLabels import PdfLabels
 from pdf_token_type_labels.TokenType import TokenType
 
+logger = logging.getLogger(__name__)
+SKIP_ANALYSIS_CONTEXT = "skip_analysis"
+
 
 class PdfFeatures(BaseModel):
     pages: list[PdfPage]
     fonts: list[PdfFont]
     file_name: str
     file_type: str
-    pdf_modes: PdfModes = PdfModes()
+    pdf_modes: PdfModes = Field(default_factory=PdfModes)
+    _peak_memory_bytes: int = PrivateAttr(default=0)
+    _statistics: PdfStatistics | None = PrivateAttr(default=None)
+    _conversion_report: ConversionReport | None = PrivateAttr(default=None)
+    _token_index: PdfTokenIndex | None = PrivateAttr(default=None)
+    _page_cache: PdfPageCache | None = PrivateAttr(default=None)
 
     def model_post_init(self, ctx):
-        self.get_modes()
-        self.get_mode_font()
+        if ctx and ctx.get(SKIP_ANALYSIS_CONTEXT):
+            return
+
+        self._statistics = PdfStatistics.from_pages(self.pages)
+        self._statistics.set_pdf_modes(self.pdf_modes)
         self.get_tokens_context()
 
+    @staticmethod
+    def from_analyzed_pages(
+        pages: list[PdfPage],
+        fonts: list[PdfFont],
+        file_name: str,
+        file_type: str,
+        pdf_modes: PdfModes,
+        statistics: PdfStatistics | None = None,
+    ) -> "PdfFeatures":
+        pdf_features = PdfFeatures.model_validate(
+            {"pages": pages, "fonts": fonts, "file_name": file_name, "file_type": file_type, "pdf_modes": pdf_modes},
+            context={SKIP_ANALYSIS_CONTEXT: True},
+        )
+        pdf_features._statistics = statistics
+        return pdf_features
+
+    def __eq__(self, other):
+        if not isinstance(other, PdfFeatures):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def get_statistics(self) -> PdfStatistics:
+        if self._statistics is None:
+            self._statistics = PdfStatistics.from_pages(self.pages)
+        return self._statistics
+
+    def add_page(self, page: PdfPage):
+        statistics = self.get_statistics()
+        self.pages.append(page)
+        page.set_tokens_context()
+        statistics.add_page(page)
+        statistics.set_pdf_modes(self.pdf_modes)
+        self.reset_token_index()
+
     def loop_tokens(self):
         for page in self.pages:
             for token in page.tokens:
                 yield page, token
 
-    def set_token_types(self, labels: PdfLabels):
-        if not labels.pages:
-            return
+    def get_token_index(self) -> PdfTokenIndex:
+        if self._token_index is None or self._token_index.is_outdated(self.pages):
+            self._token_index = PdfTokenIndex(self.pages)
+        return self._token_index
 
-        for page, token in self.loop_tokens():
-            token.token_type = TokenType.from_index(labels.get_label_type(token.page_number, token.bounding_box))
+    def reset_token_index(self):
+        self._token_index = None
 
-    def set_common_text_height(self):
-        self.pdf_modes.common_text_height = mode(
-            [t.bounding_box.height for _, t in self.loop_tokens() if t.token_type in {TokenType.TEXT, TokenType.LIST_ITEM}]
-        )
+    def get_tokens_by_type(self, token_type: TokenType) -> tuple[PdfToken, ...]:
+        return self.get_token_index().get_tokens_by_type(token_type)
 
-    def set_token_styles(self):
-        self.set_common_text_height()
-        common_text_height = self.pdf_modes.common_text_height
+    def get_tokens_by_font_id(self, font_id: str) -> tuple[PdfToken, ...]:
+        return self.get_token_index().get_tokens_by_font_id(font_id)
 
-        for page in self.pages:
-            page_boxes = [t.bounding_box for t in page.tokens]
+    def get_page(self, page_number: int) -> PdfPage | None:
+        return self.get_token_index().get_page(page_number)
 
-            for token in page.tokens:
-                token.token_style.set_title_type(token.bounding_box.height, common_text_height, token.token_type)
-                token.token_style.set_script_style(
-                    common_text_height, token.content, token.bounding_box, page_boxes, token.token_type
-                )
+    def get_page_tokens(self, page_number: int) -> tuple[PdfToken, ...]:
+        return self.get_token_index().get_page_tokens(page_number)
+
+    def get_tokens_in_region(self, page_number: int, region: Rectangle) -> tuple[PdfToken, ...]:
+        return self.get_token_index().get_tokens_in_region(page_number, region)
+
+    def get_page_paragraphs(self, page_number: int) -> list[PdfParagraph]:
+        return self.get_token_index().get_paragraphs(page_number, self.pdf_modes.lines_space_mode)
+
+    def get_paragraphs(self) -> list[PdfParagraph]:
+        token_index = self.get_token_index()
+        lines_space_mode = self.pdf_modes.lines_space_mode
+        return [
+            paragraph for page in self.pages for paragraph in token_index.get_paragraphs(page.page_number, lines_space_mode)
+        ]
+
+    def get_outline(self) -> PdfOutline:
+        return self.get_token_index().get_outline(self.pdf_modes.common_text_height, self.pdf_modes.lines_space_mode)
+
+    def set_token_types(self, labels: PdfLabels):
+        if not labels.pages:
+            return
 
-            list_item_groups: list[list[PdfToken]] = [
-                list(group)
-                for is_list_item, group in groupby(page.tokens, key=lambda t: t.token_type == TokenType.LIST_ITEM)
-                if is_list_item
-            ]
+        for page in self.pages:
+            label_types = labels.get_label_types(page.page_number, [token.bounding_box for token in page.tokens])
+            for token, label_type in zip(page.tokens, label_types):
+                token.token_type = TokenType.from_index(label_type)
+
+        self.get_statistics().reset_text_heights([token for _, token in self.loop_tokens()])
+        self.reset_token_index()
+
+    def set_common_text_height(self, corpus_statistics: CorpusStatistics | None = None):
+        statistics = self.get_statistics()
+        statistics.reset_text_heights([token for _, token in self.loop_tokens()])
+        if corpus_statistics:
+            common_text_height = corpus_statistics.get_common_text_height(statistics)
+        else:
+            common_text_height = statistics.get_common_text_height()
+
+        if common_text_height is not None:
+            self.pdf_modes.common_text_height = common_text_height
+
+    def set_font_size_mode(self, corpus_statistics: CorpusStatistics | None = None):
+        if corpus_statistics:
+            font_size_mode = corpus_statistics.get_font_size_mode(self.get_statistics())
+        else:
+            font_size_mode = self.get_statistics().get_font_size_mode()
+
+        if font_size_mode is not None:
+            self.pdf_modes.font_size_mode = font_size_mode
+
+    def set_lines_space_mode(self, corpus_statistics: CorpusStatistics | None = None):
+        if corpus_statistics:
+            self.pdf_modes.lines_space_mode = corpus_statistics.get_lines_space_mode(self.get_statistics())
+        else:
+            self.pdf_modes.lines_space_mode = self.get_statistics().get_lines_space_mode()
+
+    def set_modes(self, corpus_statistics: CorpusStatistics | None = None):
+        self.set_common_text_height(corpus_statistics)
+        self.set_font_size_mode(corpus_statistics)
+        self.set_lines_space_mode(corpus_statistics)
+
+    def set_token_styles(self, corpus_statistics: CorpusStatistics | None = None):
+        self.set_modes(corpus_statistics)
+        for page in self.pages:
+            if self._page_cache and page._fingerprint:
+                page.apply_token_styles(self._page_cache.get_token_styles(page, self.pdf_modes.common_text_height))
+            else:
+                page.set_token_styles(self.pdf_modes.common_text_height)
 
-            for list_item_group in list_item_groups:
-                contents = [t.content for t in list_item_group]
-                list_levels: list[ListLevel] = ListLevel.from_list_contents(contents)
-                for token, level in zip(list_item_group, list_levels):
-                    token.token_style.set_list_level(level)
+        self.reset_token_index()
 
     @staticmethod
-    def from_poppler_etree(file_path: str | Path, file_name: str | None = None, dataset: str | None = None):
+    def from_poppler_etree(
+        file_path: str | Path | bytes | BinaryIO,
+        file_name: str | None = None,
+        dataset: str | None = None,
+        page_cache: PdfPageCache | None = None,
+    ):
         try:
-            file_content: str = open(file_path, errors="ignore").read()
-        except (FileNotFoundError, UnicodeDecodeError, XMLSyntaxError):
+            root: ElementBase | None = PdfFeatures.parse_poppler_etree(file_path)
+        except (FileNotFoundError, IsADirectoryError, UnicodeDecodeError, XMLSyntaxError):
             return None
 
-        return PdfFeatures.from_poppler_etree_content(file_path, file_content, file_name, dataset)
+        source_path = file_path if isinstance(file_path, (str, Path)) else getattr(file_path, "name", "")
+        return PdfFeatures.from_poppler_root(root, str(source_path), file_name, dataset, page_cache)
 
     @staticmethod
     def from_poppler_etree_content(
         file_path: str | Path, file_content: str, file_name: str | None = None, dataset: str | None = None
     ):
-        if not file_content:
-            return PdfFeatures.get_empty()
-
-        file_bytes: bytes = file_content.encode("utf-8")
-
-        parser = etree.XMLParser(recover=True, encoding="utf-8")
-        root: ElementBase = etree.fromstring(file_bytes, parser=parser)
+        root: ElementBase | None = PdfFeatures.parse_poppler_etree(file_content.encode("utf-8"))
+        return PdfFeatures.from_poppler_root(root, file_path, file_name, dataset)
 
-        if root is None or not len(root):
+    @staticmethod
+    def from_poppler_root(
+        root: ElementBase | None,
+        file_path: str | Path,
+        file_name: str | None = None,
+        dataset: str | None = None,
+        page_cache: PdfPageCache | None = None,
+    ):
+        if root is None:
             return PdfFeatures.get_empty()
 
         fonts: list[PdfFont] = PdfFont.from_poppler_etree(root)
         fonts_by_font_id: dict[str, PdfFont] = {font.font_id: font for font in fonts}
         tree_pages: list[ElementBase] = [tree_page for tree_page in root.findall(".//page")]
+        if page_cache:
+            return PdfFeatures.from_cached_pages(tree_pages, fonts, file_path, file_name, dataset, page_cache)
+
         pages: list[PdfPage] = [
             PdfPage.from_poppler_etree(tree_page, fonts_by_font_id, file_name) for tree_page in tree_pages
         ]
 
-        file_type: str = file_path.split("/")[-2] if not dataset else dataset
+        file_type: str = Path(file_path).parent.name if not dataset else dataset
         file_name: str = Path(file_path).name if not file_name else file_name
 
         return PdfFeatures(
@@ -117,49 +237,320 @@ class PdfFeatures(BaseModel):
             file_type=file_type,
         )
 
+    @staticmethod
+    def from_cached_pages(
+        tree_pages: list[ElementBase],
+        fonts: list[PdfFont],
+        file_path: str | Path,
+        file_name: str | None,
+        dataset: str | None,
+        page_cache: PdfPageCache,
+    ):
+        fonts_by_font_id: dict[str, PdfFont] = {font.font_id: font for font in fonts}
+        pages: list[PdfPage] = [page_cache.get_page(tree_page, fonts_by_font_id, file_name) for tree_page in tree_pages]
+        statistics = PdfStatistics.from_pages(pages)
+        pdf_features = PdfFeatures.from_analyzed_pages(
+            pages,
+            fonts,
+            Path(file_path).name if not file_name else file_name,
+            Path(file_path).parent.name if not dataset else dataset,
+            statistics.get_pdf_modes(),
+            statistics,
+        )
+        pdf_features._page_cache = page_cache
+        return pdf_features
+
+    @staticmethod
+    def parse_poppler_etree(source: str | Path | bytes | BinaryIO) -> ElementBase | None:
+        return PdfFeatures.feed_poppler_etree(PdfFeatures.get_source_chunks(source))
+
+    @staticmethod
+    def iter_poppler_pages(source: str | Path | bytes | BinaryIO, file_name: str | None = None) -> Iterator[PdfPage]:
+        parser = etree.XMLPullParser(events=("end",), tag=("fontspec", "page"), recover=True, encoding="utf-8")
+        fontspecs: dict[str, ElementBase] = dict()
+        fonts_by_font_id: dict[str, PdfFont] = dict()
+        for chunk in PdfFeatures.get_source_chunks(source):
+            parser.feed(chunk)
+            yield from PdfFeatures.get_pulled_pages(parser, fontspecs, fonts_by_font_id, file_name)
+
+        try:
+            parser.close()
+        except XMLSyntaxError:
+            return
+
+        yield from PdfFeatures.get_pulled_pages(parser, fontspecs, fonts_by_font_id, file_name)
+
+    @staticmethod
+    def get_pulled_pages(
+        parser: etree.XMLPullParser,
+        fontspecs: dict[str, ElementBase],
+        fonts_by_font_id: dict[str, PdfFont],
+        file_name: str | None,
+    ) -> Iterator[PdfPage]:
+        for _, element in parser.read_events():
+            if element.tag == "fontspec":
+                fontspecs[element.attrib["id"]] = element
+                continue
+
+            PdfFont.add_new_fonts(element, fontspecs, fonts_by_font_id)
+            page = PdfPage.from_poppler_etree(element, fonts_by_font_id, file_name)
+            page.set_tokens_context()
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            yield page
+
+    @staticmethod
+    def get_source_chunks(source: str | Path | bytes | BinaryIO) -> Iterator[bytes]:
+        return CompressedXml.decompress_chunks(PdfFeatures.get_raw_chunks(source))
+
+    @staticmethod
+    def get_raw_chunks(source: str | Path | bytes | BinaryIO) -> Iterator[bytes]:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source_view = memoryview(source)
+            for start in range(0, len(source_view), XML_CHUNK_SIZE):
+                yield source_view[start : start + XML_CHUNK_SIZE].tobytes()
+            return
+
+        if isinstance(source, (str, Path)):
+            with open(source, "rb") as file:
+                yield from PdfFeatures.read_chunks(file, use_mmap=True)
+            return
+
+        yield from PdfFeatures.read_chunks(source, use_mmap=False)
+
+    @staticmethod
+    def read_chunks(file: BinaryIO, use_mmap: bool) -> Iterator[bytes]:
+        try:
+            mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else None
+        except (OSError, ValueError):
+            mapped_file = None
+
+        if mapped_file is None:
+            yield from iter(lambda: file.read(XML_CHUNK_SIZE), b"")
+            return
+
+        with mapped_file:
+            for start in range(0, len(mapped_file), XML_CHUNK_SIZE):
+                yield mapped_file[start : start + XML_CHUNK_SIZE]
+
+    @staticmethod
+    def feed_poppler_etree(chunks: Iterable[bytes]) -> ElementBase | None:
+        parser = etree.XMLParser(recover=True, encoding="utf-8")
+        fed = False
+        for chunk in chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            fed = True
+
+        if not fed:
+            return None
+
+        try:
+            root: ElementBase = parser.close()
+        except XMLSyntaxError:
+            return None
+
+        return root if root is not None and len(root) else None
+
     @staticmethod
     def contains_text(xml_path: str):
         try:
-            file_content = open(xml_path).read()
-            file_bytes = file_content.encode("utf-8")
-            root: ElementBase = etree.fromstring(file_bytes)
-            text_elements: list[ElementBase] = root.findall(".//text")
-        except (FileNotFoundError, UnicodeDecodeError, XMLSyntaxError):
+            for _ in etree.iterparse(xml_path, events=("start",), tag="text", recover=True):
+                return True
+        except (FileNotFoundError, OSError, XMLSyntaxError):
             return False
-        return len(text_elements) > 0
+        return False
 
     @staticmethod
-    def is_pdf_encrypted(pdf_path):
+    def is_pdf_encrypted(pdf_path, timeout_seconds: float | None = None):
         try:
-            result = subprocess.run(["qpdf", "--show-encryption", pdf_path], capture_output=True, text=True, check=True)
-        except CalledProcessError:
+            result = subprocess.run(
+                ["qpdf", "--show-encryption", pdf_path], capture_output=True, text=True, check=True, timeout=timeout_seconds
+            )
+        except (CalledProcessError, subprocess.TimeoutExpired):
             return False
         return False if "File is not encrypted" in result.stdout else True
 
     @staticmethod
-    def from_pdf_path(pdf_path, xml_path: str | Path = None):
-        remove_xml = False if xml_path else True
-        xml_path = str(xml_path) if xml_path else join(tempfile.gettempdir(), "pdf_etree.xml")
+    def get_pdftohtml_command(
+        pdf_path, xml_path: str, hidden: bool, page_range: tuple[int, int | None] | None = None
+    ) -> list[str]:
+        hidden_arguments = ["-hidden"] if hidden else []
+        range_arguments = ["-f", str(page_range[0])] if page_range else []
+        if page_range and page_range[1]:
+            range_arguments += ["-l", str(page_range[1])]
+        return ["pdftohtml", "-nodrm", "-i", *hidden_arguments, *range_arguments, "-xml", "-zoom", "1.0", pdf_path, xml_path]
+
+    @staticmethod
+    def pdf_to_poppler_etree(
+        pdf_path,
+        xml_path: str,
+        limits: ConversionLimits | None = None,
+        page_range: tuple[int, int | None] | None = None,
+        decrypt: bool = True,
+    ) -> ConversionReport:
+        limits = limits if limits else ConversionLimits()
+        report = ConversionReport()
+        start = time.perf_counter()
+        try:
+            with tempfile.TemporaryDirectory() as pdf_directory:
+                if decrypt:
+                    pdf_path = PdfFeatures.decrypt_pdf(pdf_path, join(pdf_directory, "decrypted.pdf"), limits, report)
+                PdfFeatures.run_conversion(pdf_path, xml_path, limits, report, page_range)
+        finally:
+            report.seconds = time.perf_counter() - start
+        return report
+
+    @staticmethod
+    def decrypt_pdf(pdf_path, decrypted_pdf_path: str, limits: ConversionLimits, report: ConversionReport):
+        if not PdfFeatures.is_pdf_encrypted(pdf_path, limits.timeout_seconds):
+            return pdf_path
+
+        report.add_reason(limits.run(["qpdf", "--decrypt", str(pdf_path), decrypted_pdf_path]))
+        return decrypted_pdf_path if exists(decrypted_pdf_path) else pdf_path
+
+    @staticmethod
+    def run_conversion(
+        pdf_path,
+        xml_path: str,
+        limits: ConversionLimits,
+        report: ConversionReport,
+        page_range: tuple[int, int | None] | None = None,
+    ):
+        reason = limits.run(PdfFeatures.get_pdftohtml_command(pdf_path, xml_path, hidden=False, page_range=page_range))
+        report.add_reason(reason)
+        if reason.limit_fired:
+            fallback_policy = (
+                FallbackPolicy.EMPTY if limits.fallback_policy == FallbackPolicy.EMPTY else FallbackPolicy.PARTIAL
+            )
+            PdfFeatures.apply_fallback_policy(xml_path, fallback_policy, report)
+            return
+
+        if PdfFeatures.contains_text(xml_path):
+            return
+
+        hidden_xml_path = str(Path(xml_path).with_suffix(".hidden.xml"))
+        try:
+            PdfFeatures.run_hidden_conversion(pdf_path, xml_path, hidden_xml_path, limits, report, page_range)
+        finally:
+            if exists(hidden_xml_path):
+                os.remove(hidden_xml_path)
+
+    @staticmethod
+    def run_hidden_conversion(
+        pdf_path,
+        xml_path: str,
+        hidden_xml_path: str,
+        limits: ConversionLimits,
+        report: ConversionReport,
+        page_range: tuple[int, int | None] | None = None,
+    ):
+        reason = limits.run(PdfFeatures.get_pdftohtml_command(pdf_path, hidden_xml_path, hidden=True, page_range=page_range))
+        report.add_reason(reason)
+        if reason.limit_fired and limits.fallback_policy == FallbackPolicy.RETRY_WITHOUT_HIDDEN:
+            report.fallback = FallbackPolicy.RETRY_WITHOUT_HIDDEN
+            return
 
-        if PdfFeatures.is_pdf_encrypted(pdf_path):
-            subprocess.run(["qpdf", "--decrypt", "--replace-input", pdf_path])
+        if exists(hidden_xml_path):
+            os.replace(hidden_xml_path, xml_path)
 
-        subprocess.run(["pdftohtml", "-nodrm", "-i", "-xml", "-zoom", "1.0", pdf_path, xml_path])
+        if reason.limit_fired:
+            PdfFeatures.apply_fallback_policy(xml_path, limits.fallback_policy, report)
 
-        if not PdfFeatures.contains_text(xml_path):
-            subprocess.run(["pdftohtml", "-nodrm", "-i", "-hidden", "-xml", "-zoom", "1.0", pdf_path, xml_path])
+    @staticmethod
+    def apply_fallback_policy(xml_path: str, fallback_policy: FallbackPolicy, report: ConversionReport):
+        report.fallback = fallback_policy
+        if fallback_policy == FallbackPolicy.EMPTY:
+            if exists(xml_path):
+                os.remove(xml_path)
+            return
 
-        pdf_features = PdfFeatures.from_poppler_etree(xml_path, file_name=Path(pdf_path).name)
+        report.partial = True
+        PdfFeatures.keep_complete_pages(xml_path)
 
-        if remove_xml and exists(xml_path):
-            os.remove(xml_path)
+    @staticmethod
+    def keep_complete_pages(xml_path: str):
+        if not exists(xml_path):
+            return
+
+        with open(xml_path, "r+b") as xml_file:
+            try:
+                with mmap.mmap(xml_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    last_page_end = mapped_file.rfind(b"</page>")
+            except ValueError:
+                last_page_end = -1
+
+            if last_page_end < 0:
+                xml_file.truncate(0)
+                return
+
+            xml_file.truncate(last_page_end + len(b"</page>"))
+            xml_file.seek(0, os.SEEK_END)
+            xml_file.write(b"\n</pdf2xml>\n")
+
+    @staticmethod
+    def from_pdf_path(
+        pdf_path, xml_path: str | Path = None, measure_memory: bool = False, limits: ConversionLimits | None = None
+    ):
+        if measure_memory:
+            return PdfFeatures.from_pdf_path_measuring_memory(pdf_path, xml_path, limits)
+
+        if not xml_path:
+            with tempfile.TemporaryDirectory() as xml_directory:
+                return PdfFeatures.from_pdf_path(pdf_path, join(xml_directory, "pdf_etree.xml"), limits=limits)
+
+        xml_path = str(xml_path)
+        conversion_report = PdfFeatures.pdf_to_poppler_etree(pdf_path, xml_path, limits)
+        file_name, file_type = Path(pdf_path).name, Path(pdf_path).absolute().parent.name
+        pdf_features = PdfFeatures.from_poppler_etree(xml_path, file_name=file_name, dataset=file_type)
+        return PdfFeatures.with_conversion_report(pdf_features, conversion_report, file_name, file_type)
+
+    @staticmethod
+    def with_conversion_report(
+        pdf_features: "PdfFeatures | None", conversion_report: ConversionReport, file_name: str, file_type: str
+    ) -> "PdfFeatures | None":
+        if not pdf_features and conversion_report.fallback:
+            pdf_features = PdfFeatures(pages=[], fonts=[], file_name=file_name, file_type=file_type)
+
+        if pdf_features:
+            pdf_features._conversion_report = conversion_report
 
         return pdf_features
 
+    def conversion_report(self) -> ConversionReport:
+        return self._conversion_report if self._conversion_report else ConversionReport()
+
     @staticmethod
-    def from_labeled_data(pdf_labeled_data_root_path: str | Path, dataset: str, pdf_name: str):
-        xml_path = join(pdf_labeled_data_root_path, "pdfs", pdf_name, XML_NAME)
-        pdf_features = PdfFeatures.from_poppler_etree(xml_path, pdf_name, dataset)
+    def from_pdf_path_measuring_memory(pdf_path, xml_path: str | Path = None, limits: ConversionLimits | None = None):
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        try:
+            pdf_features = PdfFeatures.from_pdf_path(pdf_path, xml_path, limits=limits)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        if pdf_features:
+            pdf_features._peak_memory_bytes = max(0, peak_memory - start_memory)
+
+        return pdf_features
+
+    def memory_report(self) -> MemoryReport:
+        return MemoryReport.from_pages(self.pages, self.fonts, self._peak_memory_bytes)
+
+    @staticmethod
+    def from_labeled_data(
+        pdf_labeled_data_root_path: str | Path, dataset: str, pdf_name: str, page_cache: PdfPageCache | None = None
+    ):
+        xml_path = CompressedXml.get_existing_path(join(pdf_labeled_data_root_path, "pdfs", pdf_name, XML_NAME))
+        pdf_features = PdfFeatures.from_poppler_etree(xml_path, pdf_name, dataset, page_cache)
         token_type_label_path: str = join(pdf_labeled_data_root_path, TOKEN_TYPE_RELATIVE_PATH)
         token_type_labels_path = join(token_type_label_path, dataset, pdf_name, LABELS_FILE_NAME)
         token_type_labels = PdfFeatures.load_labels(token_type_labels_path)
@@ -168,55 +559,25 @@ class PdfFeatures(BaseModel):
         return pdf_features
 
     @staticmethod
-    def load_labels(path: str) -> PdfLabels:
+    def load_labels(path: str, use_cache: bool = True) -> PdfLabels:
         if not exists(path):
-            print(f"No labeled data for {path}")
+            logger.debug("No labeled data for %s", path)
             return PdfLabels(pages=[])
 
-        labels_text = Path(path).read_text()
-        labels_dict = json.loads(labels_text)
-        return PdfLabels(**labels_dict)
+        return PdfLabels.from_path(path, use_cache)
 
     def get_modes(self):
-        line_spaces, right_spaces = [0], [0]
-
-        for page, token in self.loop_tokens():
-            bottom = token.bounding_box.bottom
-            right = token.bounding_box.right
-
-            on_the_bottom = [page_token for page_token in page.tokens if bottom < page_token.bounding_box.top]
-
-            on_the_right = [
-                line_token
-                for line_token in PdfToken.get_same_line_tokens(token, page.tokens)
-                if right < line_token.bounding_box.left
-            ]
-
-            if len(on_the_bottom):
-                line_spaces.append(min(map(lambda x: int(x.bounding_box.top - bottom), on_the_bottom)))
-
-            if not on_the_right:
-                right_spaces.append(int(right))
-
-        self.pdf_modes.lines_space_mode = mode(line_spaces)
-        self.pdf_modes.right_space_mode = int(self.pages[0].page_width - mode(right_spaces)) if self.pages else 0
+        self.pdf_modes.lines_space_mode = self.get_statistics().get_lines_space_mode()
+        self.pdf_modes.right_space_mode = self.get_statistics().get_right_space_mode()
 
     def get_mode_font(self):
-        fonts_counter: Counter = Counter()
-        for page, token in self.loop_tokens():
-            fonts_counter.update([token.font.font_id])
-
-        if len(fonts_counter.most_common()) == 0:
-            return
-
-        font_mode_id = fonts_counter.most_common()[0][0]
-        font_mode_token = [font for font in self.fonts if font.font_id == font_mode_id]
-        if font_mode_token:
-            self.pdf_modes.font_size_mode = float(font_mode_token[0].font_size)
+        font_size_mode = self.get_statistics().get_font_size_mode()
+        if font_size_mode is not None:
+            self.pdf_modes.font_size_mode = font_size_mode
 
     def get_tokens_context(self):
-        for page, token in self.loop_tokens():
-            token.get_context(page.tokens)
+        for page in self.pages:
+            page.set_tokens_context()
 
     @staticmethod
     def get_empty():
@@ -0,0 +1,264 @@
+import json
+import struct
+import sys
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from pydantic import BaseModel
+
+from pdf_features.HyperlinkStyle import HyperlinkStyle, NO_HYPERLINK_STYLE
+from pdf_features.ListLevel import ListLevel
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfModes import PdfModes
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+from pdf_features.PdfTokenContext import PdfTokenContext
+from pdf_features.PdfTokenStyle import PdfTokenStyle
+from pdf_features.Rectangle import Rectangle
+from pdf_features.ScriptType import ScriptType
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
+
+MAGIC = b"PDFF"
+VERSION = 1
+HEADER_FORMAT = "<4sIQ"
+TOKEN_INTEGERS_COUNT = 15
+TOKEN_FLOATS_COUNT = 4
+TOKEN_TYPES = list(TokenType)
+SCRIPT_TYPES = list(ScriptType)
+TITLE_TYPES = list(TitleType)
+LIST_LEVELS = {list_level.value: list_level for list_level in ListLevel}
+
+
+class PdfFeaturesBuffer:
+    @staticmethod
+    def pack(pdf_features: PdfFeatures) -> bytes:
+        fonts: list[PdfFont] = list(pdf_features.fonts)
+        font_indexes: dict[int, int] = {id(font): index for index, font in enumerate(fonts)}
+        hyperlink_styles: list[HyperlinkStyle] = [NO_HYPERLINK_STYLE]
+        hyperlink_indexes: dict[int, int] = {id(NO_HYPERLINK_STYLE): 0}
+        integers, floats, string_offsets = array("i"), array("d"), array("q", [0])
+        strings: list[bytes] = list()
+        string_length = 0
+
+        for _, token in pdf_features.loop_tokens():
+            if id(token.font) not in font_indexes:
+                font_indexes[id(token.font)] = len(fonts)
+                fonts.append(token.font)
+
+            hyperlink_style = token.token_style.hyperlink_style
+            if id(hyperlink_style) not in hyperlink_indexes:
+                hyperlink_indexes[id(hyperlink_style)] = len(hyperlink_styles)
+                hyperlink_styles.append(hyperlink_style)
+
+            box = token.bounding_box
+            integers.extend(
+                (
+                    token.page_number,
+                    token.reading_order_no,
+                    box.left,
+                    box.top,
+                    box.right,
+                    box.bottom,
+                    box.width,
+                    box.height,
+                    font_indexes[id(token.font)],
+                    hyperlink_indexes[id(hyperlink_style)],
+                    token.prediction,
+                    TOKEN_TYPES.index(token.token_type),
+                    SCRIPT_TYPES.index(token.token_style.script_type),
+                    TITLE_TYPES.index(token.token_style.title_type),
+                    token.token_style.list_level,
+                )
+            )
+            context = token.pdf_token_context
+            floats.extend(
+                (
+                    context.right_of_token_on_the_left,
+                    context.left_of_token_on_the_left,
+                    context.left_of_token_on_the_right,
+                    context.right_of_token_on_the_right,
+                )
+            )
+            for string in (token.id, token.content):
+                encoded_string = string.encode("utf-8")
+                strings.append(encoded_string)
+                string_length += len(encoded_string)
+                string_offsets.append(string_length)
+
+        header = {
+            "file_name": pdf_features.file_name,
+            "file_type": pdf_features.file_type,
+            "pdf_modes": pdf_features.pdf_modes.model_dump(),
+            "fonts": [font.model_dump() for font in fonts],
+            "documents_fonts_count": len(pdf_features.fonts),
+            "hyperlink_styles": [hyperlink_style.model_dump(mode="json") for hyperlink_style in hyperlink_styles],
+            "pages": [
+                [page.page_number, page.page_width, page.page_height, page.pdf_name, len(page.tokens)]
+                for page in pdf_features.pages
+            ],
+        }
+        header_bytes = json.dumps(header).encode("utf-8")
+        header_bytes += b" " * (-len(header_bytes) % 8)
+        return b"".join(
+            [
+                struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(header_bytes)),
+                header_bytes,
+                floats.tobytes(),
+                string_offsets.tobytes(),
+                integers.tobytes(),
+                *strings,
+            ]
+        )
+
+    @staticmethod
+    def unpack(buffer: bytes | memoryview) -> PdfFeatures:
+        buffer_view = memoryview(buffer)
+        magic, version, header_length = struct.unpack_from(HEADER_FORMAT, buffer_view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a PdfFeatures buffer")
+
+        offset = struct.calcsize(HEADER_FORMAT)
+        header = json.loads(bytes(buffer_view[offset : offset + header_length]))
+        offset += header_length
+        tokens_count = sum(page[4] for page in header["pages"])
+
+        floats_view = buffer_view[offset : offset + 8 * TOKEN_FLOATS_COUNT * tokens_count]
+        offset += len(floats_view)
+        offsets_view = buffer_view[offset : offset + 8 * (2 * tokens_count + 1)]
+        offset += len(offsets_view)
+        integers_view = buffer_view[offset : offset + 4 * TOKEN_INTEGERS_COUNT * tokens_count]
+        offset += len(integers_view)
+        strings_view = buffer_view[offset:]
+
+        try:
+            floats = floats_view.cast("d").tolist()
+            string_offsets = offsets_view.cast("q").tolist()
+            integers = integers_view.cast("i").tolist()
+            strings_bytes = bytes(strings_view)
+        finally:
+            for view in (floats_view, offsets_view, integers_view, strings_view, buffer_view):
+                view.release()
+
+        strings = [strings_bytes[start:end].decode("utf-8") for start, end in zip(string_offsets, string_offsets[1:])]
+        fonts = [PdfFont.get_shared(**font) for font in header["fonts"]]
+        hyperlink_styles = [NO_HYPERLINK_STYLE] + [HyperlinkStyle(**style) for style in header["hyperlink_styles"][1:]]
+        pages: list[PdfPage] = list()
+        first_token_index = 0
+        for page_number, page_width, page_height, pdf_name, page_tokens_count in header["pages"]:
+            tokens = [
+                PdfFeaturesBuffer.get_token(
+                    integers[token_index * TOKEN_INTEGERS_COUNT : (token_index + 1) * TOKEN_INTEGERS_COUNT],
+                    floats[token_index * TOKEN_FLOATS_COUNT : (token_index + 1) * TOKEN_FLOATS_COUNT],
+                    strings[2 * token_index],
+                    strings[2 * token_index + 1],
+                    fonts,
+                    hyperlink_styles,
+                )
+                for token_index in range(first_token_index, first_token_index + page_tokens_count)
+            ]
+            first_token_index += page_tokens_count
+            pages.append(
+                PdfFeaturesBuffer.restore_model(
+                    PdfPage,
+                    {
+                        "page_number": page_number,
+                        "page_width": page_width,
+                        "page_height": page_height,
+                        "tokens": tokens,
+                        "pdf_name": pdf_name,
+                    },
+                )
+            )
+
+        return PdfFeatures.from_analyzed_pages(
+            pages,
+            fonts[: header["documents_fonts_count"]],
+            header["file_name"],
+            header["file_type"],
+            PdfModes(**header["pdf_modes"]),
+        )
+
+    @staticmethod
+    def get_token(
+        integers: list[int],
+        floats: list[float],
+        token_id: str,
+        content: str,
+        fonts: list[PdfFont],
+        hyperlink_styles: list[HyperlinkStyle],
+    ) -> PdfToken:
+        page_number, reading_order_no, left, top, right, bottom, width, height = integers[:8]
+        font_index, hyperlink_index, prediction, token_type, script_type, title_type, list_level = integers[8:]
+        font = fonts[font_index]
+        token_style = PdfTokenStyle.get_shared(
+            font=font,
+            hyperlink_style=hyperlink_styles[hyperlink_index],
+            script_type=SCRIPT_TYPES[script_type],
+            title_type=TITLE_TYPES[title_type],
+            list_level=LIST_LEVELS[list_level],
+        )
+        bounding_box = PdfFeaturesBuffer.restore_model(
+            Rectangle, {"left": left, "top": top, "right": right, "bottom": bottom, "width": width, "height": height}
+        )
+        context = PdfFeaturesBuffer.restore_model(
+            PdfTokenContext,
+            {
+                "right_of_token_on_the_left": floats[0],
+                "left_of_token_on_the_left": floats[1],
+                "left_of_token_on_the_right": floats[2],
+                "right_of_token_on_the_right": floats[3],
+            },
+        )
+        return PdfFeaturesBuffer.restore_model(
+            PdfToken,
+            {
+                "page_number": page_number,
+                "id": token_id,
+                "content": content,
+                "font": font,
+                "reading_order_no": reading_order_no,
+                "bounding_box": bounding_box,
+                "token_type": TOKEN_TYPES[token_type],
+                "token_style": token_style,
+                "pdf_token_context": context,
+                "prediction": prediction,
+            },
+        )
+
+    @staticmethod
+    def restore_model(model_class: type[BaseModel], values: dict) -> BaseModel:
+        model = model_class.__new__(model_class)
+        private_values = {name: attribute.get_default() for name, attribute in model_class.__private_attributes__.items()}
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", set(values))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", private_values if private_values else None)
+        return model
+
+    @staticmethod
+    def to_shared_memory(pdf_features: PdfFeatures) -> str:
+        packed_pdf_features = PdfFeaturesBuffer.pack(pdf_features)
+        shared_memory = SharedMemory(create=True, size=max(1, len(packed_pdf_features)))
+        shared_memory.buf[: len(packed_pdf_features)] = packed_pdf_features
+        shared_memory.close()
+        if sys.version_info < (3, 13):
+            resource_tracker.unregister(shared_memory._name, "shared_memory")
+        return shared_memory.name
+
+    @staticmethod
+    def extract_to_shared_memory(pdf_path: str) -> str | None:
+        pdf_features = PdfFeatures.from_pdf_path(pdf_path)
+        return PdfFeaturesBuffer.to_shared_memory(pdf_features) if pdf_features else None
+
+    @staticmethod
+    def from_shared_memory(name: str, unlink: bool = True) -> PdfFeatures:
+        shared_memory = SharedMemory(name=name)
+        try:
+            return PdfFeaturesBuffer.unpack(shared_memory.buf)
+        finally:
+            shared_memory.close()
+            if unlink:
+                shared_memory.unlink()
@@ -0,0 +1,107 @@
+import io
+import json
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, TextIO
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+
+TOKEN_FIELDS: dict[str, Callable[[PdfToken], object]] = {
+    "page_number": lambda token: token.page_number,
+    "id": lambda token: token.id,
+    "content": lambda token: token.content,
+    "reading_order_no": lambda token: token.reading_order_no,
+    "bounding_box": lambda token: token.bounding_box.to_dict(),
+    "font_id": lambda token: token.font.font_id,
+    "font_size": lambda token: token.font.font_size,
+    "bold": lambda token: token.font.bold,
+    "italics": lambda token: token.font.italics,
+    "token_type": lambda token: token.token_type.value,
+    "script_type": lambda token: token.token_style.script_type.value,
+    "title_type": lambda token: token.token_style.title_type.value,
+    "list_level": lambda token: int(token.token_style.list_level),
+    "hyperlink_type": lambda token: token.token_style.hyperlink_style.type.value,
+    "hyperlink": lambda token: token.token_style.hyperlink_style.link,
+    "hyperlinks": lambda token: [
+        hyperlink_style.link for hyperlink_style in token.token_style.hyperlink_style.get_links() if hyperlink_style.link
+    ],
+    "context": lambda token: token.pdf_token_context.model_dump(),
+    "prediction": lambda token: token.prediction,
+}
+
+DEFAULT_FIELDS = [
+    "page_number",
+    "id",
+    "content",
+    "bounding_box",
+    "font_id",
+    "token_type",
+    "script_type",
+    "title_type",
+    "list_level",
+    "hyperlink_type",
+]
+
+
+class PdfFeaturesJsonl:
+    @staticmethod
+    def get_field_getters(fields: list[str] | None) -> list[tuple[str, Callable[[PdfToken], object]]]:
+        fields = fields if fields else DEFAULT_FIELDS
+        unknown_fields = [field for field in fields if field not in TOKEN_FIELDS]
+        if unknown_fields:
+            raise ValueError(f"Unknown token fields: {', '.join(unknown_fields)}")
+        return [(field, TOKEN_FIELDS[field]) for field in fields]
+
+    @staticmethod
+    def get_token_record(token: PdfToken, field_getters: list[tuple[str, Callable[[PdfToken], object]]]) -> dict:
+        return {field: get_field(token) for field, get_field in field_getters}
+
+    @staticmethod
+    def get_page_record(page: PdfPage, field_getters: list[tuple[str, Callable[[PdfToken], object]]]) -> dict:
+        return {
+            "page_number": page.page_number,
+            "page_width": page.page_width,
+            "page_height": page.page_height,
+            "tokens": [PdfFeaturesJsonl.get_token_record(token, field_getters) for token in page.tokens],
+        }
+
+    @staticmethod
+    def iter_page_lines(pages: Iterable[PdfPage], fields: list[str] | None = None, per_page: bool = False) -> Iterator[str]:
+        field_getters = PdfFeaturesJsonl.get_field_getters(fields)
+        for page in pages:
+            if per_page:
+                yield json.dumps(PdfFeaturesJsonl.get_page_record(page, field_getters), ensure_ascii=False) + "\n"
+                continue
+
+            yield "".join(
+                json.dumps(PdfFeaturesJsonl.get_token_record(token, field_getters), ensure_ascii=False) + "\n"
+                for token in page.tokens
+            )
+
+    @staticmethod
+    def write(
+        pages: Iterable[PdfPage], output: TextIO | BinaryIO, fields: list[str] | None = None, per_page: bool = False
+    ) -> int:
+        written_pages = 0
+        binary_output = not isinstance(output, io.TextIOBase)
+        for page_lines in PdfFeaturesJsonl.iter_page_lines(pages, fields, per_page):
+            output.write(page_lines.encode("utf-8") if binary_output else page_lines)
+            written_pages += 1
+        return written_pages
+
+    @staticmethod
+    def write_pdf_features(
+        pdf_features: PdfFeatures, output: TextIO | BinaryIO, fields: list[str] | None = None, per_page: bool = False
+    ) -> int:
+        return PdfFeaturesJsonl.write(pdf_features.pages, output, fields, per_page)
+
+    @staticmethod
+    def write_from_poppler_etree(
+        source: str | Path | bytes | BinaryIO,
+        output: TextIO | BinaryIO,
+        file_name: str | None = None,
+        fields: list[str] | None = None,
+        per_page: bool = False,
+    ) -> int:
+        return PdfFeaturesJsonl.write(PdfFeatures.iter_poppler_pages(source, file_name), output, fields, per_page)
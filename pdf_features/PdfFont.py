@@ -1,8 +1,16 @@
+import threading
+from weakref import WeakValueDictionary
+
 from lxml.etree import ElementBase
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+SHARED_FONTS: WeakValueDictionary = WeakValueDictionary()
+SHARED_FONTS_LOCK = threading.Lock()
 
 
 class PdfFont(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     font_id: str
     font_size: float
     bold: bool
@@ -15,15 +23,20 @@ class PdfFont(BaseModel):
     @classmethod
     def from_poppler_etree(cls, root: ElementBase) -> list["PdfFont"]:
         fonts: dict[str, ElementBase] = {font.attrib["id"]: font for font in root.findall(".//fontspec")}
-        processed_font_ids: set[str] = set()
+        return cls.add_new_fonts(root, fonts, dict())
+
+    @classmethod
+    def add_new_fonts(
+        cls, xml_element: ElementBase, fonts: dict[str, ElementBase], fonts_by_font_id: dict[str, "PdfFont"]
+    ) -> list["PdfFont"]:
         pdf_fonts: list[PdfFont] = []
-        for xml_tag in root.findall(".//text"):
+        for xml_tag in xml_element.iter("text"):
             font_id: str = xml_tag.attrib.get("font", "")
-            if not font_id or font_id in processed_font_ids:
+            if not font_id or font_id in fonts_by_font_id:
                 continue
             pdf_font = cls._get_pdf_font(font_id, fonts, xml_tag)
             pdf_fonts.append(pdf_font)
-            processed_font_ids.add(font_id)
+            fonts_by_font_id[font_id] = pdf_font
         return pdf_fonts
 
     @classmethod
@@ -35,7 +48,17 @@ class PdfFont(BaseModel):
         content = "".join(xml_tag.itertext()).strip()
         bold = cls._is_bold(content, font_family, xml_tag)
         italics = cls._is_italic(content, font_family, xml_tag)
-        return cls(font_id=font_id, font_size=font_size, bold=bold, italics=italics, color=color)
+        return cls.get_shared(font_id=font_id, font_size=font_size, bold=bold, italics=italics, color=color)
+
+    @classmethod
+    def get_shared(cls, font_id: str, font_size: float, bold: bool, italics: bool, color: str) -> "PdfFont":
+        font_key = (font_id, float(font_size), bold, italics, color)
+        pdf_font = SHARED_FONTS.get(font_key)
+        if pdf_font is None:
+            pdf_font = cls(font_id=font_id, font_size=font_size, bold=bold, italics=italics, color=color)
+            with SHARED_FONTS_LOCK:
+                pdf_font = SHARED_FONTS.setdefault(font_key, pdf_font)
+        return pdf_font
 
     @staticmethod
     def _is_italic(content: str, font_family: str, xml_tag: ElementBase) -> bool:
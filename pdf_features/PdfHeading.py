@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+from pdf_features.TitleType import TitleType
+
+
+class PdfHeading(BaseModel):
+    title: str
+    title_type: TitleType
+    level: int
+    page_number: int
+    start_index: int
+    body_start_index: int
+    end_index: int
+    children: list["PdfHeading"] = list()
+
+    def __str__(self):
+        return f"PdfHeading(title={self.title}, level={self.level}, tokens={self.start_index}:{self.end_index})"
+
+    def get_number(self) -> str | None:
+        return PdfHeading.get_section_number(self.title)
+
+    @staticmethod
+    def get_section_number(text: str) -> str | None:
+        number = text.split(maxsplit=1)[0].rstrip(".") if text.strip() else ""
+        return number if number and all(part.isdigit() for part in number.split(".")) else None
@@ -0,0 +1,66 @@
+from bisect import bisect_left, bisect_right
+from enum import StrEnum
+
+from pdf_features.Rectangle import Rectangle
+
+
+class LineOverlapRule(StrEnum):
+    OVERLAP = "Overlap"
+    TOP_OR_BOTTOM_INSIDE = "Top or bottom inside"
+    CENTER_BAND = "Center band"
+
+    def matches(self, box: Rectangle, other_box: Rectangle) -> bool:
+        if self == LineOverlapRule.OVERLAP:
+            return not (box.bottom < other_box.top or other_box.bottom < box.top)
+
+        if self == LineOverlapRule.TOP_OR_BOTTOM_INSIDE:
+            top, bottom = box.top, box.top + box.height
+            return top <= other_box.top < bottom or top < other_box.bottom <= bottom
+
+        height_threshold = max(3, (box.bottom - box.top) / 2)
+        return not (other_box.bottom < box.top + height_threshold or box.bottom - height_threshold < other_box.top)
+
+
+class PdfLineIndex:
+    def __init__(self, boxes: list[Rectangle]):
+        self.boxes = boxes
+        self.sorted_indexes = sorted(range(len(boxes)), key=lambda index: boxes[index].top)
+        self.sorted_tops = [boxes[index].top for index in self.sorted_indexes]
+        self.max_height = max((box.height for box in boxes), default=0)
+        self.lines_by_rule: dict[LineOverlapRule, list[list[int]]] = dict()
+
+    def get_candidate_indexes(self, box: Rectangle) -> list[int]:
+        start = bisect_left(self.sorted_tops, box.top - self.max_height)
+        end = bisect_right(self.sorted_tops, box.bottom)
+        return [index for index in self.sorted_indexes[start:end] if self.boxes[index].bottom >= box.top]
+
+    def get_same_line_indexes(self, box: Rectangle, rule: LineOverlapRule = LineOverlapRule.OVERLAP) -> list[int]:
+        candidate_indexes = self.get_candidate_indexes(box)
+        return sorted(index for index in candidate_indexes if rule.matches(box, self.boxes[index]))
+
+    def get_same_line_boxes(self, box: Rectangle, rule: LineOverlapRule = LineOverlapRule.OVERLAP) -> list[Rectangle]:
+        return [self.boxes[index] for index in self.get_same_line_indexes(box, rule)]
+
+    def get_first_top_below(self, bottom: int) -> int | None:
+        index = bisect_right(self.sorted_tops, bottom)
+        return self.sorted_tops[index] if index < len(self.sorted_tops) else None
+
+    def get_lines(self, rule: LineOverlapRule = LineOverlapRule.OVERLAP) -> list[list[int]]:
+        if rule not in self.lines_by_rule:
+            self.lines_by_rule[rule] = self.cluster_lines(rule)
+        return self.lines_by_rule[rule]
+
+    def cluster_lines(self, rule: LineOverlapRule) -> list[list[int]]:
+        lines: list[list[int]] = list()
+        line_box: Rectangle | None = None
+        for index in self.sorted_indexes:
+            box = self.boxes[index]
+            if line_box and (rule.matches(line_box, box) or rule.matches(box, line_box)):
+                lines[-1].append(index)
+                line_box = Rectangle.merge_rectangles([line_box, box])
+                continue
+
+            lines.append([index])
+            line_box = box
+
+        return [sorted(line, key=lambda index: (self.boxes[index].left, index)) for line in lines]
@@ -0,0 +1,94 @@
+from pdf_features.PdfHeading import PdfHeading
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfParagraph import LINE_GAP_RATIO
+from pdf_features.PdfToken import PdfToken
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
+
+HEADING_TOKEN_TYPES = {TokenType.TITLE, TokenType.SECTION_HEADER}
+TITLE_LEVELS = {TitleType.H1: 1, TitleType.H2: 2, TitleType.H3: 3, TitleType.H4: 4}
+
+
+class PdfOutline:
+    def __init__(self, pages: list[PdfPage], common_text_height: int = 1, lines_space_mode: float = 0):
+        self.tokens: tuple[PdfToken, ...] = tuple(token for page in pages for token in page.tokens)
+        self.common_text_height = max(1, common_text_height)
+        self.lines_space_mode = max(0.0, lines_space_mode)
+        self.headings: list[PdfHeading] = self.get_headings()
+        self.roots: list[PdfHeading] = self.build_tree()
+        self.headings_by_number: dict[str, PdfHeading] = dict()
+        for heading in self.headings:
+            number = heading.get_number()
+            if number:
+                self.headings_by_number.setdefault(number, heading)
+
+    def get_title_type(self, token: PdfToken) -> TitleType:
+        if token.token_style.title_type != TitleType.NO_TITLE:
+            return token.token_style.title_type
+        return TitleType.from_height_ratio(token.bounding_box.height / self.common_text_height, token.token_type)
+
+    def get_headings(self) -> list[PdfHeading]:
+        headings: list[PdfHeading] = list()
+        previous_title_type: TitleType | None = None
+        for index, token in enumerate(self.tokens):
+            if token.token_type not in HEADING_TOKEN_TYPES:
+                previous_title_type = None
+                continue
+
+            title_type = self.get_title_type(token)
+            if title_type == previous_title_type and self.is_continuation(self.tokens[index - 1], token):
+                headings[-1].title = f"{headings[-1].title} {token.content}"
+                headings[-1].body_start_index = index + 1
+                continue
+
+            previous_title_type = title_type
+            headings.append(
+                PdfHeading(
+                    title=token.content,
+                    title_type=title_type,
+                    level=TITLE_LEVELS.get(title_type, len(TITLE_LEVELS)),
+                    page_number=token.page_number,
+                    start_index=index,
+                    body_start_index=index + 1,
+                    end_index=len(self.tokens),
+                )
+            )
+        return headings
+
+    def is_continuation(self, previous_token: PdfToken, token: PdfToken) -> bool:
+        if token.page_number != previous_token.page_number or PdfHeading.get_section_number(token.content):
+            return False
+
+        max_line_space = self.lines_space_mode + LINE_GAP_RATIO * previous_token.bounding_box.height
+        return token.bounding_box.top - previous_token.bounding_box.bottom <= max_line_space
+
+    def build_tree(self) -> list[PdfHeading]:
+        roots: list[PdfHeading] = list()
+        stack: list[PdfHeading] = list()
+        for heading in self.headings:
+            while stack and stack[-1].level >= heading.level:
+                stack.pop().end_index = heading.start_index
+
+            if stack:
+                stack[-1].children.append(heading)
+            else:
+                roots.append(heading)
+            stack.append(heading)
+        return roots
+
+    def get_heading(self, number: str) -> PdfHeading | None:
+        return self.headings_by_number.get(number.rstrip("."))
+
+    def find_headings(self, title: str) -> list[PdfHeading]:
+        title = title.lower()
+        return [heading for heading in self.headings if title in heading.title.lower()]
+
+    def get_section_tokens(self, heading: PdfHeading, include_heading: bool = True) -> tuple[PdfToken, ...]:
+        start_index = heading.start_index if include_heading else heading.body_start_index
+        return self.tokens[start_index : heading.end_index]
+
+    def get_section_markdown(self, heading: PdfHeading) -> str:
+        return "\n".join(token.content_markdown for token in self.get_section_tokens(heading))
+
+    def get_section_html(self, heading: PdfHeading) -> str:
+        return "\n".join(token.content_html for token in self.get_section_tokens(heading))
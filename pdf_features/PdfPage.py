@@ -1,10 +1,18 @@
+from itertools import groupby
 from typing import Optional
 
 from lxml.etree import ElementBase
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
+from pdf_features.HyperlinkStyle import HyperlinkStyle
+from pdf_features.ListLevel import ListLevel
 from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfLineIndex import PdfLineIndex, LineOverlapRule
 from pdf_features.PdfToken import PdfToken
+from pdf_features.Rectangle import Rectangle
+from pdf_features.ScriptType import ScriptType
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
 
 
 class PdfPage(BaseModel):
@@ -13,15 +21,101 @@ class PdfPage(BaseModel):
     page_height: int
     tokens: list[PdfToken]
     pdf_name: Optional[str]
+    _line_index: Optional[PdfLineIndex] = PrivateAttr(default=None)
+    _line_index_tokens: Optional[list[PdfToken]] = PrivateAttr(default=None)
+    _fingerprint: Optional[bytes] = PrivateAttr(default=None)
+
+    def __eq__(self, other):
+        if not isinstance(other, PdfPage):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
 
     def __str__(self):
         return f"PdfPage(page_number={self.page_number}, page_width={self.page_width}, page_height={self.page_height})"
 
+    def get_line_index(self) -> PdfLineIndex:
+        if self.is_line_index_outdated():
+            self._line_index = PdfLineIndex([token.bounding_box for token in self.tokens])
+            self._line_index_tokens = self.tokens
+        return self._line_index
+
+    def is_line_index_outdated(self) -> bool:
+        if self._line_index is None or self._line_index_tokens is not self.tokens:
+            return True
+        return len(self._line_index.boxes) != len(self.tokens)
+
+    def reset_line_index(self):
+        self._line_index = None
+        self._line_index_tokens = None
+
+    def get_same_line_tokens(
+        self, token: PdfToken, rule: LineOverlapRule = LineOverlapRule.TOP_OR_BOTTOM_INSIDE
+    ) -> list[PdfToken]:
+        return [self.tokens[index] for index in self.get_line_index().get_same_line_indexes(token.bounding_box, rule)]
+
+    def get_lines(self, rule: LineOverlapRule = LineOverlapRule.OVERLAP) -> list[list[PdfToken]]:
+        return [[self.tokens[index] for index in line] for line in self.get_line_index().get_lines(rule)]
+
+    def render_contents(self) -> list[tuple[str, str]]:
+        return [(token.content_markdown, token.content_html) for token in self.tokens]
+
+    def set_tokens_context(self):
+        for token in self.tokens:
+            token.set_context(self.get_same_line_tokens(token))
+
+    def set_token_styles(self, common_text_height: int):
+        self.apply_token_styles(self.get_page_token_styles(common_text_height))
+
+    def get_page_token_styles(self, common_text_height: int) -> list[tuple[TitleType, ScriptType, ListLevel | None]]:
+        return PdfPage.get_token_styles(
+            [token.bounding_box for token in self.tokens],
+            [token.content for token in self.tokens],
+            [token.token_type for token in self.tokens],
+            common_text_height,
+            self.get_line_index(),
+        )
+
+    def apply_token_styles(self, token_styles: list[tuple[TitleType, ScriptType, ListLevel | None]]):
+        for token, (title_type, script_type, list_level) in zip(self.tokens, token_styles):
+            changes = {"title_type": title_type, "script_type": script_type}
+            if list_level is not None:
+                changes["list_level"] = list_level
+            token.token_style = token.token_style.copy_with(**changes)
+
+    @staticmethod
+    def get_token_styles(
+        boxes: list[Rectangle],
+        contents: list[str],
+        token_types: list[TokenType],
+        common_text_height: int,
+        line_index: PdfLineIndex | None = None,
+    ) -> list[tuple[TitleType, ScriptType, ListLevel | None]]:
+        line_index = line_index if line_index else PdfLineIndex(boxes)
+        title_types = [
+            TitleType.from_height_ratio(box.height / common_text_height, token_type)
+            for box, token_type in zip(boxes, token_types)
+        ]
+        script_types = [
+            ScriptType.from_text_height(common_text_height, content, box, line_index, token_type)
+            for box, content, token_type in zip(boxes, contents, token_types)
+        ]
+        list_levels: list[ListLevel | None] = [None] * len(contents)
+        token_indexes = groupby(range(len(contents)), key=lambda index: token_types[index] == TokenType.LIST_ITEM)
+        for list_item_indexes in [list(group) for is_list_item, group in token_indexes if is_list_item]:
+            group_levels = ListLevel.from_list_contents([contents[index] for index in list_item_indexes])
+            for index, level in zip(list_item_indexes, group_levels):
+                list_levels[index] = level
+
+        return list(zip(title_types, script_types, list_levels))
+
     @staticmethod
     def from_poppler_etree(xml_page: ElementBase, fonts_by_font_id: dict[str, PdfFont], pdf_name: str):
         page_number = int(xml_page.attrib["number"])
+        links_by_text_element = HyperlinkStyle.get_links_by_text_element(xml_page)
         tokens = [
-            PdfToken.from_poppler_etree(page_number, xml_tag, fonts_by_font_id[xml_tag.attrib["font"]])
+            PdfToken.from_poppler_etree(
+                page_number, xml_tag, fonts_by_font_id[xml_tag.attrib["font"]], links_by_text_element.get(xml_tag, [])
+            )
             for xml_tag in xml_page.findall(".//text")
         ]
         tokens = [token for token in tokens if token.content.strip()]
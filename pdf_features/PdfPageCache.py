@@ -0,0 +1,129 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+from pdf_features.ListLevel import ListLevel
+from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfPage import PdfPage
+from pdf_features.ScriptType import ScriptType
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
+
+PAGE_CACHE_SIZE = 4096
+
+
+class PdfPageCache:
+    def __init__(self, max_pages: int = PAGE_CACHE_SIZE):
+        self.max_pages = max_pages
+        self.pages: OrderedDict[bytes, tuple[PdfPage, list[PdfFont]]] = OrderedDict()
+        self.token_styles: OrderedDict[tuple, list[tuple[TitleType, ScriptType, ListLevel | None]]] = OrderedDict()
+        self.page_hits = 0
+        self.page_misses = 0
+        self.style_hits = 0
+        self.style_misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_fingerprint(xml_page: ElementBase, fonts_by_font_id: dict[str, PdfFont]) -> tuple[bytes, list[PdfFont]]:
+        digest = hashlib.blake2b(repr((xml_page.get("width"), xml_page.get("height"))).encode(), digest_size=16)
+        font_indexes: dict[str, int] = dict()
+        fonts: list[PdfFont] = list()
+        for xml_tag in xml_page.iter("text"):
+            font_id = xml_tag.get("font", "")
+            if font_id not in font_indexes:
+                font = fonts_by_font_id[font_id]
+                font_indexes[font_id] = len(fonts)
+                fonts.append(font)
+                digest.update(repr((font.font_size, font.bold, font.italics, font.color)).encode())
+
+            attributes = [(name, value) for name, value in xml_tag.attrib.items() if name != "font"]
+            children = [etree.tostring(child) for child in xml_tag]
+            digest.update(repr((attributes, font_indexes[font_id], xml_tag.text, children)).encode())
+
+        return digest.digest(), fonts
+
+    def get_page(self, xml_page: ElementBase, fonts_by_font_id: dict[str, PdfFont], pdf_name: str) -> PdfPage:
+        fingerprint, fonts = self.get_fingerprint(xml_page, fonts_by_font_id)
+        page_number = int(xml_page.attrib["number"])
+        with self.lock:
+            cached_page = self.pages.get(fingerprint)
+            if cached_page is None:
+                self.page_misses += 1
+            else:
+                self.page_hits += 1
+                self.pages.move_to_end(fingerprint)
+
+        if cached_page is None:
+            page = PdfPage.from_poppler_etree(xml_page, fonts_by_font_id, pdf_name)
+            page.set_tokens_context()
+            page._fingerprint = fingerprint
+            self.add(self.pages, fingerprint, (self.copy_page(page, page_number, pdf_name, fonts, fonts), fonts))
+            return page
+
+        template_page, template_fonts = cached_page
+        return self.copy_page(template_page, page_number, pdf_name, template_fonts, fonts)
+
+    @staticmethod
+    def copy_page(
+        page: PdfPage, page_number: int, pdf_name: str, template_fonts: list[PdfFont], fonts: list[PdfFont]
+    ) -> PdfPage:
+        fonts_by_template_font = {id(template_font): font for template_font, font in zip(template_fonts, fonts)}
+        tokens = list()
+        for token in page.tokens:
+            changes = {"page_number": page_number, "bounding_box": token.bounding_box.model_copy()}
+            font = fonts_by_template_font.get(id(token.font), token.font)
+            if font is not token.font:
+                changes["font"] = font
+                changes["token_style"] = token.token_style.copy_with(font=font)
+            tokens.append(token.model_copy(update=changes))
+
+        page_copy = page.model_copy(update={"page_number": page_number, "pdf_name": pdf_name, "tokens": tokens})
+        page_copy.reset_line_index()
+        page_copy._fingerprint = page._fingerprint
+        return page_copy
+
+    def get_token_styles(
+        self, page: PdfPage, common_text_height: int
+    ) -> list[tuple[TitleType, ScriptType, ListLevel | None]]:
+        token_types: tuple[TokenType, ...] = tuple(token.token_type for token in page.tokens)
+        key = (page._fingerprint, common_text_height, token_types)
+        with self.lock:
+            token_styles = self.token_styles.get(key) if page._fingerprint else None
+            if token_styles is None:
+                self.style_misses += 1
+            else:
+                self.style_hits += 1
+                self.token_styles.move_to_end(key)
+                return token_styles
+
+        token_styles = page.get_page_token_styles(common_text_height)
+        if page._fingerprint:
+            self.add(self.token_styles, key, token_styles)
+        return token_styles
+
+    def add(self, cache: OrderedDict, key, value):
+        with self.lock:
+            cache[key] = value
+            while len(cache) > self.max_pages:
+                cache.popitem(last=False)
+
+    def get_page_hit_rate(self) -> float:
+        return self.page_hits / (self.page_hits + self.page_misses) if self.page_hits + self.page_misses else 0
+
+    def get_style_hit_rate(self) -> float:
+        return self.style_hits / (self.style_hits + self.style_misses) if self.style_hits + self.style_misses else 0
+
+    def clear(self):
+        with self.lock:
+            self.pages.clear()
+            self.token_styles.clear()
+            self.page_hits = self.page_misses = self.style_hits = self.style_misses = 0
+
+    def __str__(self):
+        return (
+            f"PdfPageCache(pages={len(self.pages)}, page_hit_rate={self.get_page_hit_rate():.1%}, "
+            f"style_hit_rate={self.get_style_hit_rate():.1%})"
+        )
@@ -0,0 +1,120 @@
+from pydantic import BaseModel, PrivateAttr
+
+from pdf_features.PdfLineIndex import LineOverlapRule
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+from pdf_features.Rectangle import Rectangle
+from pdf_token_type_labels.ParagraphType import ParagraphType
+from pdf_token_type_labels.TokenType import TokenType
+
+SEGMENT_GAP_RATIO = 2
+LINE_GAP_RATIO = 0.5
+HEIGHT_TOLERANCE = 0.2
+
+
+class PdfParagraph(BaseModel):
+    page_number: int
+    token_indexes: list[int]
+    bounding_box: Rectangle
+    token_type: TokenType
+    paragraph_type: ParagraphType = ParagraphType.PARAGRAPH
+    _line_height: int = PrivateAttr(default=0)
+
+    def __str__(self):
+        return f"PdfParagraph(page_number={self.page_number}, tokens={len(self.token_indexes)}, {self.bounding_box})"
+
+    def get_tokens(self, page: PdfPage) -> list[PdfToken]:
+        return [page.tokens[index] for index in self.token_indexes]
+
+    def get_content(self, page: PdfPage) -> str:
+        return " ".join(token.content for token in self.get_tokens(page))
+
+    def get_max_line_space(self, lines_space_mode: float) -> float:
+        return lines_space_mode + LINE_GAP_RATIO * self._line_height
+
+    def accepts(self, segment: "PdfParagraph", lines_space_mode: float) -> bool:
+        if segment.token_type != self.token_type:
+            return False
+
+        if segment.bounding_box.top - self.bounding_box.bottom > self.get_max_line_space(lines_space_mode):
+            return False
+
+        return abs(segment._line_height - self._line_height) <= HEIGHT_TOLERANCE * max(
+            segment._line_height, self._line_height
+        )
+
+    def add(self, segment: "PdfParagraph"):
+        self.token_indexes.extend(segment.token_indexes)
+        self.bounding_box = Rectangle.merge_rectangles([self.bounding_box, segment.bounding_box])
+        self._line_height = segment._line_height
+
+    @staticmethod
+    def from_tokens(page: PdfPage, token_indexes: list[int]) -> "PdfParagraph":
+        boxes = [page.tokens[index].bounding_box for index in token_indexes]
+        paragraph = PdfParagraph(
+            page_number=page.page_number,
+            token_indexes=token_indexes,
+            bounding_box=Rectangle.merge_rectangles(boxes),
+            token_type=page.tokens[token_indexes[0]].token_type,
+        )
+        paragraph._line_height = max(box.height for box in boxes)
+        return paragraph
+
+    @staticmethod
+    def get_line_segments(page: PdfPage, line: list[int]) -> list["PdfParagraph"]:
+        segments_indexes: list[list[int]] = list()
+        right, height, token_type = 0, 0, None
+        for index in line:
+            token = page.tokens[index]
+            box = token.bounding_box
+            if token.token_type == token_type and box.left - right <= SEGMENT_GAP_RATIO * max(height, box.height):
+                segments_indexes[-1].append(index)
+                right, height = max(right, box.right), max(height, box.height)
+                continue
+
+            segments_indexes.append([index])
+            right, height, token_type = box.right, box.height, token.token_type
+
+        return [PdfParagraph.from_tokens(page, indexes) for indexes in segments_indexes]
+
+    @staticmethod
+    def get_paragraph(
+        segment: "PdfParagraph", paragraphs: list["PdfParagraph"], lines_space_mode: float
+    ) -> "PdfParagraph | None":
+        best_paragraph, best_overlap = None, 0
+        for paragraph in paragraphs:
+            if not paragraph.accepts(segment, lines_space_mode):
+                continue
+
+            overlap = min(segment.bounding_box.right, paragraph.bounding_box.right) - max(
+                segment.bounding_box.left, paragraph.bounding_box.left
+            )
+            if overlap > best_overlap:
+                best_paragraph, best_overlap = paragraph, overlap
+        return best_paragraph
+
+    @staticmethod
+    def from_page(page: PdfPage, lines_space_mode: float = 0) -> list["PdfParagraph"]:
+        lines_space_mode = max(0.0, lines_space_mode)
+        paragraphs: list[PdfParagraph] = list()
+        open_paragraphs: list[PdfParagraph] = list()
+        for line in page.get_line_index().get_lines(LineOverlapRule.OVERLAP):
+            segments = PdfParagraph.get_line_segments(page, line)
+            line_top = min(segment.bounding_box.top for segment in segments)
+            open_paragraphs = [
+                paragraph
+                for paragraph in open_paragraphs
+                if line_top - paragraph.bounding_box.bottom <= paragraph.get_max_line_space(lines_space_mode)
+            ]
+            new_paragraphs: list[PdfParagraph] = list()
+            for segment in segments:
+                paragraph = PdfParagraph.get_paragraph(segment, open_paragraphs, lines_space_mode)
+                if paragraph:
+                    paragraph.add(segment)
+                else:
+                    new_paragraphs.append(segment)
+
+            paragraphs.extend(new_paragraphs)
+            open_paragraphs.extend(new_paragraphs)
+
+        return sorted(paragraphs, key=lambda paragraph: min(paragraph.token_indexes))
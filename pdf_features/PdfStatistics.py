@@ -0,0 +1,119 @@
+from collections import Counter
+
+from pydantic import BaseModel
+
+from pdf_features.PdfModes import PdfModes
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+from pdf_token_type_labels.TokenType import TokenType
+
+TEXT_TOKEN_TYPES = {TokenType.TEXT, TokenType.LIST_ITEM}
+
+
+class PdfStatistics(BaseModel):
+    pages_count: int = 0
+    tokens_count: int = 0
+    first_page_width: int = 0
+    line_spaces: dict[int, int] = dict()
+    right_spaces: dict[int, int] = dict()
+    font_ids: dict[str, int] = dict()
+    font_sizes_by_font_id: dict[str, float] = dict()
+    text_heights: dict[int, int] = dict()
+
+    @staticmethod
+    def from_pages(pages: list[PdfPage]) -> "PdfStatistics":
+        statistics = PdfStatistics()
+        for page in pages:
+            statistics.add_page(page)
+        return statistics
+
+    def add_page(self, page: PdfPage):
+        if not self.pages_count:
+            self.first_page_width = page.page_width
+
+        self.pages_count += 1
+        self.tokens_count += len(page.tokens)
+        line_index = page.get_line_index()
+        line_spaces, right_spaces, font_ids = Counter(self.line_spaces), Counter(self.right_spaces), Counter(self.font_ids)
+        text_heights = Counter(self.text_heights)
+
+        for token in page.tokens:
+            bottom = token.bounding_box.bottom
+            right = token.bounding_box.right
+
+            top_on_the_bottom = line_index.get_first_top_below(bottom)
+            if top_on_the_bottom is not None:
+                line_spaces[int(top_on_the_bottom - bottom)] += 1
+
+            if not any(right < line_token.bounding_box.left for line_token in page.get_same_line_tokens(token)):
+                right_spaces[int(right)] += 1
+
+            font_ids[token.font.font_id] += 1
+            self.font_sizes_by_font_id.setdefault(token.font.font_id, token.font.font_size)
+
+            if token.token_type in TEXT_TOKEN_TYPES:
+                text_heights[token.bounding_box.height] += 1
+
+        self.line_spaces, self.right_spaces, self.font_ids = dict(line_spaces), dict(right_spaces), dict(font_ids)
+        self.text_heights = dict(text_heights)
+
+    def reset_text_heights(self, tokens: list[PdfToken]):
+        text_heights: Counter = Counter()
+        for token in tokens:
+            if token.token_type in TEXT_TOKEN_TYPES:
+                text_heights[token.bounding_box.height] += 1
+        self.text_heights = dict(text_heights)
+
+    def merge(self, other: "PdfStatistics") -> "PdfStatistics":
+        return PdfStatistics(
+            pages_count=self.pages_count + other.pages_count,
+            tokens_count=self.tokens_count + other.tokens_count,
+            first_page_width=self.first_page_width if self.pages_count else other.first_page_width,
+            line_spaces=dict(Counter(self.line_spaces) + Counter(other.line_spaces)),
+            right_spaces=dict(Counter(self.right_spaces) + Counter(other.right_spaces)),
+            font_ids=dict(Counter(self.font_ids) + Counter(other.font_ids)),
+            font_sizes_by_font_id=other.font_sizes_by_font_id | self.font_sizes_by_font_id,
+            text_heights=dict(Counter(self.text_heights) + Counter(other.text_heights)),
+        )
+
+    @staticmethod
+    def get_mode(histogram: dict, initial_value=None):
+        counts = Counter() if initial_value is None else Counter({initial_value: 1})
+        counts.update(histogram)
+        if not counts:
+            return None
+        return max(counts, key=counts.get)
+
+    def get_lines_space_mode(self) -> float:
+        return self.get_mode(self.line_spaces, initial_value=0)
+
+    def get_right_space_mode(self) -> float:
+        if not self.pages_count:
+            return 0
+        return int(self.first_page_width - self.get_mode(self.right_spaces, initial_value=0))
+
+    def get_font_size_mode(self) -> float | None:
+        font_id_mode = self.get_mode(self.font_ids)
+        if font_id_mode is None or font_id_mode not in self.font_sizes_by_font_id:
+            return None
+        return float(self.font_sizes_by_font_id[font_id_mode])
+
+    def get_common_text_height(self) -> int | None:
+        return self.get_mode(self.text_heights)
+
+    def get_pdf_modes(self) -> PdfModes:
+        pdf_modes = PdfModes()
+        self.set_pdf_modes(pdf_modes)
+        return pdf_modes
+
+    def set_pdf_modes(self, pdf_modes: PdfModes):
+        pdf_modes.lines_space_mode = self.get_lines_space_mode()
+        pdf_modes.right_space_mode = self.get_right_space_mode()
+
+        font_size_mode = self.get_font_size_mode()
+        if font_size_mode is not None:
+            pdf_modes.font_size_mode = font_size_mode
+
+        common_text_height = self.get_common_text_height()
+        if common_text_height is not None:
+            pdf_modes.common_text_height = common_text_height
@@ -1,9 +1,10 @@
 from lxml.etree import ElementBase
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 
 from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfLineIndex import LineOverlapRule
 from pdf_features.PdfTokenStyle import PdfTokenStyle
-from pdf_features.PdfTokenContext import PdfTokenContext
+from pdf_features.PdfTokenContext import PdfTokenContext, EMPTY_TOKEN_CONTEXT
 from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.Label import Label
 from pdf_token_type_labels.TokenType import TokenType
@@ -18,23 +19,26 @@ class PdfToken(BaseModel):
     bounding_box: Rectangle
     token_type: TokenType
     token_style: PdfTokenStyle
-    pdf_token_context: PdfTokenContext = PdfTokenContext()
+    pdf_token_context: PdfTokenContext = Field(default_factory=lambda: EMPTY_TOKEN_CONTEXT)
     prediction: int = 0
+    _rendered_markdown: tuple | None = PrivateAttr(default=None)
+    _rendered_html: tuple | None = PrivateAttr(default=None)
+
+    def __eq__(self, other):
+        if not isinstance(other, PdfToken):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
 
     def __str__(self):
         return f"PdfToken(page_number={self.page_number}, content={self.content}, bounding_box={self.bounding_box}, token_type={self.token_type}"
 
     def same_line(self, token: "PdfToken"):
-        if self.bounding_box.bottom < token.bounding_box.top:
-            return False
-
-        if token.bounding_box.bottom < self.bounding_box.top:
-            return False
-
-        return True
+        return LineOverlapRule.OVERLAP.matches(self.bounding_box, token.bounding_box)
 
     @staticmethod
-    def from_poppler_etree(page_number: int, xml_tag: ElementBase, pdf_font: PdfFont):
+    def from_poppler_etree(
+        page_number: int, xml_tag: ElementBase, pdf_font: PdfFont, link_elements: list[ElementBase] | None = None
+    ):
         if "id" in xml_tag.attrib:
             tag_id = xml_tag.attrib["id"]
         else:
@@ -45,7 +49,9 @@ class PdfToken(BaseModel):
         token_type = TokenType.TEXT
 
         content = "".join(xml_tag.itertext()).strip()
-        token_style = PdfTokenStyle.from_xml_tag(xml_tag=xml_tag, content=content, pdf_font=pdf_font)
+        token_style = PdfTokenStyle.from_xml_tag(
+            xml_tag=xml_tag, content=content, pdf_font=pdf_font, link_elements=link_elements
+        )
 
         return PdfToken(
             page_number=page_number,
@@ -60,6 +66,26 @@ class PdfToken(BaseModel):
 
     @property
     def content_markdown(self) -> str:
+        return self.get_rendered_content("_rendered_markdown", self.render_markdown)
+
+    @property
+    def content_html(self) -> str:
+        return self.get_rendered_content("_rendered_html", self.render_html)
+
+    def get_rendered_content(self, private_name: str, render) -> str:
+        private_attributes = self.__pydantic_private__
+        rendered = private_attributes[private_name]
+        if (
+            rendered is None
+            or rendered[0] is not self.content
+            or rendered[1] is not self.token_style
+            or rendered[2] is not self.token_type
+        ):
+            rendered = (self.content, self.token_style, self.token_type, render())
+            private_attributes[private_name] = rendered
+        return rendered[3]
+
+    def render_markdown(self) -> str:
         markdown_content = self.content
         markdown_content = self.token_style.get_styled_content_markdown(markdown_content)
         markdown_content = self.token_style.title_type.get_styled_content_markdown(markdown_content)
@@ -68,8 +94,7 @@ class PdfToken(BaseModel):
         markdown_content = self.token_style.hyperlink_style.get_styled_content_markdown(markdown_content)
         return markdown_content
 
-    @property
-    def content_html(self) -> str:
+    def render_html(self) -> str:
         html_content = self.content
         html_content = self.token_style.get_styled_content_html(html_content)
         html_content = self.token_style.title_type.get_styled_content_html(html_content)
@@ -86,30 +111,32 @@ class PdfToken(BaseModel):
         return self.bounding_box.get_intersection_percentage(label_bounding_box)
 
     def get_same_line_tokens(self, page_tokens: list["PdfToken"]):
-        top, height = self.bounding_box.top, self.bounding_box.height
-
-        same_line_tokens = [
-            each_token
-            for each_token in page_tokens
-            if top <= each_token.bounding_box.top < (top + height) or top < each_token.bounding_box.bottom <= (top + height)
-        ]
-
-        return same_line_tokens
+        rule = LineOverlapRule.TOP_OR_BOTTOM_INSIDE
+        return [each_token for each_token in page_tokens if rule.matches(self.bounding_box, each_token.bounding_box)]
 
     def get_context(self, page_tokens: list["PdfToken"]):
-        left, right = self.bounding_box.left, self.bounding_box.right
+        self.set_context(self.get_same_line_tokens(page_tokens))
 
-        self.pdf_token_context.left_of_token_on_the_left = left
+    def set_context(self, same_line_tokens: list["PdfToken"]):
+        left, right = self.bounding_box.left, self.bounding_box.right
 
-        same_line_tokens = self.get_same_line_tokens(page_tokens)
+        right_of_token_on_the_left, left_of_token_on_the_left = 0, left
+        left_of_token_on_the_right, right_of_token_on_the_right = 0, 0
 
         on_the_left = [each_token for each_token in same_line_tokens if each_token.bounding_box.right < right]
         on_the_right = [each_token for each_token in same_line_tokens if left < each_token.bounding_box.left]
 
         if on_the_left:
-            self.pdf_token_context.right_of_token_on_the_left = max([x.bounding_box.right for x in on_the_left])
-            self.pdf_token_context.left_of_token_on_the_left = min([x.bounding_box.left for x in on_the_left])
+            right_of_token_on_the_left = max([x.bounding_box.right for x in on_the_left])
+            left_of_token_on_the_left = min([x.bounding_box.left for x in on_the_left])
 
         if on_the_right:
-            self.pdf_token_context.left_of_token_on_the_right = min([x.bounding_box.left for x in on_the_right])
-            self.pdf_token_context.right_of_token_on_the_right = max([x.bounding_box.right for x in on_the_right])
+            left_of_token_on_the_right = min([x.bounding_box.left for x in on_the_right])
+            right_of_token_on_the_right = max([x.bounding_box.right for x in on_the_right])
+
+        self.pdf_token_context = PdfTokenContext(
+            right_of_token_on_the_left=right_of_token_on_the_left,
+            left_of_token_on_the_left=left_of_token_on_the_left,
+            left_of_token_on_the_right=left_of_token_on_the_right,
+            right_of_token_on_the_right=right_of_token_on_the_right,
+        )
@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PdfTokenContext(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     right_of_token_on_the_left: float = 0
     left_of_token_on_the_left: float = 0
     left_of_token_on_the_right: float = 0
     right_of_token_on_the_right: float = 0
+
+
+EMPTY_TOKEN_CONTEXT = PdfTokenContext()
@@ -0,0 +1,84 @@
+from typing import Callable, Hashable
+
+from pdf_features.PdfOutline import PdfOutline
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfParagraph import PdfParagraph
+from pdf_features.PdfToken import PdfToken
+from pdf_features.Rectangle import Rectangle
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class PdfTokenIndex:
+    def __init__(self, pages: list[PdfPage]):
+        self.pages = pages
+        self.pages_count = len(pages)
+        self.pages_tokens: list[tuple[PdfPage, list[PdfToken], int]] = [
+            (page, page.tokens, len(page.tokens)) for page in pages
+        ]
+        self.pages_by_number: dict[int, PdfPage] = {page.page_number: page for page in reversed(pages)}
+        self.tokens_by_page_number: dict[int, tuple[PdfToken, ...]] = dict()
+        self.tokens_by_type: dict[TokenType, tuple[PdfToken, ...]] | None = None
+        self.tokens_by_font_id: dict[str, tuple[PdfToken, ...]] | None = None
+        self.paragraphs_by_page_number: dict[int, list[PdfParagraph]] = dict()
+        self.outline: PdfOutline | None = None
+
+    def is_outdated(self, pages: list[PdfPage]) -> bool:
+        if pages is not self.pages or len(pages) != self.pages_count:
+            return True
+
+        return any(
+            page is not indexed_page or page.tokens is not tokens or len(page.tokens) != tokens_count
+            for page, (indexed_page, tokens, tokens_count) in zip(pages, self.pages_tokens)
+        )
+
+    def group_tokens(self, get_key: Callable[[PdfToken], Hashable]) -> dict[Hashable, tuple[PdfToken, ...]]:
+        tokens_by_key: dict[Hashable, list[PdfToken]] = dict()
+        for page in self.pages:
+            for token in page.tokens:
+                tokens_by_key.setdefault(get_key(token), []).append(token)
+        return {key: tuple(tokens) for key, tokens in tokens_by_key.items()}
+
+    def get_tokens_by_type(self, token_type: TokenType) -> tuple[PdfToken, ...]:
+        if self.tokens_by_type is None:
+            self.tokens_by_type = self.group_tokens(lambda token: token.token_type)
+        return self.tokens_by_type.get(token_type, ())
+
+    def get_tokens_by_font_id(self, font_id: str) -> tuple[PdfToken, ...]:
+        if self.tokens_by_font_id is None:
+            self.tokens_by_font_id = self.group_tokens(lambda token: token.font.font_id)
+        return self.tokens_by_font_id.get(font_id, ())
+
+    def get_page(self, page_number: int) -> PdfPage | None:
+        return self.pages_by_number.get(page_number)
+
+    def get_page_tokens(self, page_number: int) -> tuple[PdfToken, ...]:
+        if page_number not in self.tokens_by_page_number:
+            page = self.get_page(page_number)
+            self.tokens_by_page_number[page_number] = tuple(page.tokens) if page else ()
+        return self.tokens_by_page_number[page_number]
+
+    def get_tokens_in_region(self, page_number: int, region: Rectangle) -> tuple[PdfToken, ...]:
+        page = self.get_page(page_number)
+        if not page:
+            return ()
+
+        candidate_indexes = page.get_line_index().get_candidate_indexes(region)
+        return tuple(
+            page.tokens[index]
+            for index in sorted(candidate_indexes)
+            if region.left < page.tokens[index].bounding_box.right
+            and page.tokens[index].bounding_box.left < region.right
+            and region.top < page.tokens[index].bounding_box.bottom
+            and page.tokens[index].bounding_box.top < region.bottom
+        )
+
+    def get_paragraphs(self, page_number: int, lines_space_mode: float) -> list[PdfParagraph]:
+        if page_number not in self.paragraphs_by_page_number:
+            page = self.get_page(page_number)
+            self.paragraphs_by_page_number[page_number] = PdfParagraph.from_page(page, lines_space_mode) if page else []
+        return self.paragraphs_by_page_number[page_number]
+
+    def get_outline(self, common_text_height: int, lines_space_mode: float = 0) -> PdfOutline:
+        if self.outline is None:
+            self.outline = PdfOutline(self.pages, common_text_height, lines_space_mode)
+        return self.outline
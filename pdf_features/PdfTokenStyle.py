@@ -1,26 +1,74 @@
+import threading
+import warnings
+from weakref import WeakValueDictionary
+
 from lxml.etree import ElementBase
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
-from pdf_features.HyperlinkStyle import HyperlinkStyle
+from pdf_features.HyperlinkStyle import HyperlinkStyle, NO_HYPERLINK_STYLE
 from pdf_features.ListLevel import ListLevel
 from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfLineIndex import PdfLineIndex
 from pdf_features.Rectangle import Rectangle
 from pdf_features.ScriptType import ScriptType
 from pdf_features.TitleType import TitleType
 from pdf_token_type_labels.TokenType import TokenType
 
+SHARED_TOKEN_STYLES: WeakValueDictionary = WeakValueDictionary()
+SHARED_TOKEN_STYLES_LOCK = threading.Lock()
+
 
 class PdfTokenStyle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     font: PdfFont
-    hyperlink_style: HyperlinkStyle = HyperlinkStyle()
+    hyperlink_style: HyperlinkStyle = Field(default_factory=lambda: NO_HYPERLINK_STYLE)
     script_type: ScriptType = ScriptType.REGULAR
     title_type: TitleType = TitleType.NO_TITLE
     list_level: ListLevel = ListLevel.NO_LEVEL
 
     @staticmethod
-    def from_xml_tag(xml_tag: ElementBase, content: str, pdf_font: PdfFont) -> "PdfTokenStyle":
-        hyperlink_style: HyperlinkStyle = HyperlinkStyle.from_xml_tag(xml_tag, content)
-        return PdfTokenStyle(font=pdf_font, hyperlink_style=hyperlink_style)
+    def from_xml_tag(
+        xml_tag: ElementBase, content: str, pdf_font: PdfFont, link_elements: list[ElementBase] | None = None
+    ) -> "PdfTokenStyle":
+        if link_elements is None:
+            hyperlink_style: HyperlinkStyle = HyperlinkStyle.from_xml_tag(xml_tag, content)
+        else:
+            hyperlink_style = HyperlinkStyle.from_link_elements(link_elements, content)
+        return PdfTokenStyle.get_shared(font=pdf_font, hyperlink_style=hyperlink_style)
+
+    @staticmethod
+    def get_shared(
+        font: PdfFont,
+        hyperlink_style: HyperlinkStyle = NO_HYPERLINK_STYLE,
+        script_type: ScriptType = ScriptType.REGULAR,
+        title_type: TitleType = TitleType.NO_TITLE,
+        list_level: ListLevel = ListLevel.NO_LEVEL,
+    ) -> "PdfTokenStyle":
+        style_key = (id(font), id(hyperlink_style), script_type, title_type, list_level)
+        token_style = SHARED_TOKEN_STYLES.get(style_key)
+        if token_style is None:
+            token_style = PdfTokenStyle(
+                font=font,
+                hyperlink_style=hyperlink_style,
+                script_type=script_type,
+                title_type=title_type,
+                list_level=list_level,
+            )
+            with SHARED_TOKEN_STYLES_LOCK:
+                token_style = SHARED_TOKEN_STYLES.setdefault(style_key, token_style)
+        return token_style
+
+    def copy_with(self, **changes) -> "PdfTokenStyle":
+        fields = {
+            "font": self.font,
+            "hyperlink_style": self.hyperlink_style,
+            "script_type": self.script_type,
+            "title_type": self.title_type,
+            "list_level": self.list_level,
+        }
+        fields.update(changes)
+        return PdfTokenStyle.get_shared(**fields)
 
     def get_styled_content_markdown(self, content: str):
         styled_content = content
@@ -38,14 +86,40 @@ class PdfTokenStyle(BaseModel):
             styled_content = "<b>" + content + "</b>"
         return styled_content
 
-    def set_title_type(self, text_height: int, most_common_text_height: int, token_type: TokenType):
+    def with_title_type(self, text_height: int, most_common_text_height: int, token_type: TokenType) -> "PdfTokenStyle":
         height_ratio = text_height / most_common_text_height
-        self.title_type = TitleType.from_height_ratio(height_ratio, token_type)
+        return self.copy_with(title_type=TitleType.from_height_ratio(height_ratio, token_type))
+
+    def with_script_style(
+        self,
+        common_text_height: int,
+        content: str,
+        token_box: Rectangle,
+        line_index: PdfLineIndex | list[Rectangle],
+        token_type: TokenType,
+    ) -> "PdfTokenStyle":
+        script_type = ScriptType.from_text_height(common_text_height, content, token_box, line_index, token_type)
+        return self.copy_with(script_type=script_type)
+
+    def with_list_level(self, level: ListLevel) -> "PdfTokenStyle":
+        return self.copy_with(list_level=level)
+
+    def set_title_type(self, text_height: int, most_common_text_height: int, token_type: TokenType) -> "PdfTokenStyle":
+        warnings.warn(
+            "PdfTokenStyle is immutable, assign the style returned by with_title_type", DeprecationWarning, stacklevel=2
+        )
+        return self.with_title_type(text_height, most_common_text_height, token_type)
 
     def set_script_style(
         self, common_text_height: int, content: str, token_box: Rectangle, page_boxes: list[Rectangle], token_type: TokenType
-    ):
-        self.script_type = ScriptType.from_text_height(common_text_height, content, token_box, page_boxes, token_type)
+    ) -> "PdfTokenStyle":
+        warnings.warn(
+            "PdfTokenStyle is immutable, assign the style returned by with_script_style", DeprecationWarning, stacklevel=2
+        )
+        return self.with_script_style(common_text_height, content, token_box, page_boxes, token_type)
 
-    def set_list_level(self, level: ListLevel):
-        self.list_level = level
+    def set_list_level(self, level: ListLevel) -> "PdfTokenStyle":
+        warnings.warn(
+            "PdfTokenStyle is immutable, assign the style returned by with_list_level", DeprecationWarning, stacklevel=2
+        )
+        return self.with_list_level(level)
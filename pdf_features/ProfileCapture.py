@@ -0,0 +1,114 @@
+import cProfile
+import hashlib
+import json
+import platform
+import tempfile
+import threading
+import time
+from os.path import join, exists
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pdf_features.ConversionLimits import ConversionLimits
+from pdf_features.PdfFeatures import PdfFeatures
+
+CAPTURE_XML_NAME = "pdf_etree.xml"
+CAPTURE_PROFILE_NAME = "profile.prof"
+CAPTURE_INFO_NAME = "capture.json"
+PROFILE_LOCK = threading.Lock()
+
+
+class ProfileCapture(BaseModel):
+    capture_path: Path
+    threshold_seconds: float = 10
+
+    def from_pdf_path(self, pdf_path, limits: ConversionLimits | None = None) -> PdfFeatures | None:
+        with tempfile.TemporaryDirectory() as xml_directory:
+            xml_path = join(xml_directory, CAPTURE_XML_NAME)
+            start = time.perf_counter()
+            pdf_features = PdfFeatures.from_pdf_path(pdf_path, xml_path, limits=limits)
+            seconds = time.perf_counter() - start
+            if seconds > self.threshold_seconds and exists(xml_path):
+                conversion_seconds = pdf_features.conversion_report().seconds if pdf_features else 0
+                self.capture(pdf_path, Path(xml_path).read_bytes(), seconds, conversion_seconds)
+
+        return pdf_features
+
+    def from_poppler_etree(self, xml_path: str | Path, file_name: str | None = None) -> PdfFeatures | None:
+        start = time.perf_counter()
+        pdf_features = PdfFeatures.from_poppler_etree(xml_path, file_name)
+        seconds = time.perf_counter() - start
+        if seconds > self.threshold_seconds and exists(xml_path):
+            self.capture(xml_path, Path(xml_path).read_bytes(), seconds)
+
+        return pdf_features
+
+    def from_poppler_etree_content(
+        self, file_path: str | Path, file_content: str, file_name: str | None = None, dataset: str | None = None
+    ) -> PdfFeatures:
+        start = time.perf_counter()
+        pdf_features = PdfFeatures.from_poppler_etree_content(file_path, file_content, file_name, dataset)
+        seconds = time.perf_counter() - start
+        if seconds > self.threshold_seconds:
+            self.capture(file_path, file_content.encode("utf-8"), seconds)
+
+        return pdf_features
+
+    def capture(self, source_path: str | Path, xml_content: bytes, seconds: float, conversion_seconds: float = 0) -> Path:
+        content_hash = hashlib.sha256(xml_content).hexdigest()[:12]
+        capture_directory = self.capture_path / f"{Path(source_path).stem}-{content_hash}"
+        capture_directory.mkdir(parents=True, exist_ok=True)
+        xml_path = capture_directory / CAPTURE_XML_NAME
+        xml_path.write_bytes(xml_content)
+
+        capture_info = {
+            "source_path": str(source_path),
+            "seconds": seconds,
+            "conversion_seconds": conversion_seconds,
+            "threshold_seconds": self.threshold_seconds,
+            "python_version": platform.python_version(),
+        }
+        (capture_directory / CAPTURE_INFO_NAME).write_text(json.dumps(capture_info, indent=4))
+        return capture_directory
+
+    def profile_pending(self) -> list[Path]:
+        pending_captures = [
+            capture_directory
+            for capture_directory in ProfileCapture.get_captures(self.capture_path)
+            if not (capture_directory / CAPTURE_PROFILE_NAME).exists()
+        ]
+        for capture_directory in pending_captures:
+            _, replay_seconds = ProfileCapture.replay(capture_directory, capture_directory / CAPTURE_PROFILE_NAME)
+            info_path = capture_directory / CAPTURE_INFO_NAME
+            capture_info = json.loads(info_path.read_text()) if info_path.exists() else dict()
+            capture_info["replay_seconds"] = replay_seconds
+            info_path.write_text(json.dumps(capture_info, indent=4))
+        return pending_captures
+
+    @staticmethod
+    def replay(capture_directory: str | Path, profile_path: str | Path | None = None) -> tuple[PdfFeatures | None, float]:
+        if not profile_path:
+            return ProfileCapture.run_python_stages(Path(capture_directory) / CAPTURE_XML_NAME)
+
+        with PROFILE_LOCK:
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                pdf_features, seconds = ProfileCapture.run_python_stages(Path(capture_directory) / CAPTURE_XML_NAME)
+            finally:
+                profile.disable()
+            profile.dump_stats(str(profile_path))
+        return pdf_features, seconds
+
+    @staticmethod
+    def run_python_stages(xml_path: Path) -> tuple[PdfFeatures | None, float]:
+        start = time.perf_counter()
+        pdf_features = PdfFeatures.from_poppler_etree(xml_path)
+        if pdf_features:
+            pdf_features.set_token_styles()
+        return pdf_features, time.perf_counter() - start
+
+    @staticmethod
+    def get_captures(capture_path: str | Path) -> list[Path]:
+        return sorted(path.parent for path in Path(capture_path).glob(f"*/{CAPTURE_XML_NAME}"))
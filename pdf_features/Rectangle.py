@@ -1,5 +1,6 @@
 import os
 import sys
+from bisect import bisect_left
 
 from lxml.etree import ElementBase
 from pydantic import BaseModel
@@ -71,6 +72,176 @@ class Rectangle(BaseModel):
     def area(self):
         return self.width * self.height
 
+    @staticmethod
+    def get_overlapping_indexes(rectangles: list["Rectangle"], others: list["Rectangle"]) -> list[list[int]]:
+        sorted_indexes = sorted(range(len(others)), key=lambda index: others[index].left)
+        sorted_lefts = [others[index].left for index in sorted_indexes]
+        max_width = max((other.right - other.left for other in others), default=0)
+        overlapping_indexes: list[list[int]] = list()
+        for rectangle in rectangles:
+            start = bisect_left(sorted_lefts, rectangle.left - max_width)
+            end = bisect_left(sorted_lefts, rectangle.right)
+            overlapping_indexes.append(
+                sorted(
+                    index
+                    for index in sorted_indexes[start:end]
+                    if rectangle.left < others[index].right
+                    and rectangle.top < others[index].bottom
+                    and others[index].top < rectangle.bottom
+                )
+            )
+        return overlapping_indexes
+
+    @staticmethod
+    def get_numpy_module():
+        try:
+            import numpy
+
+            return numpy
+        except ImportError:
+            return None
+
+    @staticmethod
+    def get_coordinates(numpy, rectangles: list["Rectangle"]):
+        coordinates = numpy.array(
+            [(rectangle.left, rectangle.top, rectangle.right, rectangle.bottom) for rectangle in rectangles],
+            dtype=numpy.int64,
+        )
+        return coordinates.reshape(-1, 4).T
+
+    @staticmethod
+    def get_areas(numpy, rectangles: list["Rectangle"]):
+        return numpy.array([rectangle.area() for rectangle in rectangles], dtype=numpy.int64)
+
+    @staticmethod
+    def get_intersection_percentages_with_numpy(numpy, rectangles: list["Rectangle"], others: list["Rectangle"]):
+        lefts, tops, rights, bottoms = (column[:, None] for column in Rectangle.get_coordinates(numpy, rectangles))
+        others_lefts, others_tops, others_rights, others_bottoms = Rectangle.get_coordinates(numpy, others)
+        widths = numpy.clip(numpy.minimum(rights, others_rights) - numpy.maximum(lefts, others_lefts), 0, None)
+        heights = numpy.clip(numpy.minimum(bottoms, others_bottoms) - numpy.maximum(tops, others_tops), 0, None)
+        return 100 * widths * heights / Rectangle.get_areas(numpy, rectangles)[:, None]
+
+    @staticmethod
+    def get_sparse_intersection_percentages_with_numpy(
+        numpy, rectangles: list["Rectangle"], others: list["Rectangle"]
+    ) -> list[dict[int, float]]:
+        lefts, tops, rights, bottoms = Rectangle.get_coordinates(numpy, rectangles)
+        others_lefts, others_tops, others_rights, others_bottoms = Rectangle.get_coordinates(numpy, others)
+        areas = Rectangle.get_areas(numpy, rectangles)
+        sorted_indexes = numpy.argsort(others_lefts, kind="stable")
+        sorted_lefts = others_lefts[sorted_indexes]
+        max_width = int((others_rights - others_lefts).max(initial=0))
+        starts = numpy.searchsorted(sorted_lefts, lefts - max_width, side="left")
+        ends = numpy.searchsorted(sorted_lefts, rights, side="left")
+        sparse_intersection_percentages: list[dict[int, float]] = list()
+        for index in range(len(rectangles)):
+            candidates = numpy.sort(sorted_indexes[starts[index] : ends[index]])
+            widths = numpy.minimum(rights[index], others_rights[candidates]) - numpy.maximum(
+                lefts[index], others_lefts[candidates]
+            )
+            heights = numpy.minimum(bottoms[index], others_bottoms[candidates]) - numpy.maximum(
+                tops[index], others_tops[candidates]
+            )
+            overlapping = (widths > 0) & (heights > 0)
+            percentages = 100 * widths[overlapping] * heights[overlapping] / areas[index]
+            sparse_intersection_percentages.append(dict(zip(candidates[overlapping].tolist(), percentages.tolist())))
+        return sparse_intersection_percentages
+
+    @staticmethod
+    def get_sparse_intersection_percentages(
+        rectangles: list["Rectangle"], others: list["Rectangle"], prefilter: bool = True, use_numpy: bool = True
+    ) -> list[dict[int, float]]:
+        if not prefilter:
+            return [
+                {index: percentage for index, percentage in enumerate(row) if percentage > 0}
+                for row in Rectangle.get_intersection_percentages(rectangles, others, prefilter=False, use_numpy=use_numpy)
+            ]
+
+        numpy = Rectangle.get_numpy_module() if use_numpy else None
+        if numpy:
+            return Rectangle.get_sparse_intersection_percentages_with_numpy(numpy, rectangles, others)
+
+        return [
+            {index: rectangle.get_intersection_percentage(others[index]) for index in overlapping_indexes}
+            for rectangle, overlapping_indexes in zip(rectangles, Rectangle.get_overlapping_indexes(rectangles, others))
+        ]
+
+    @staticmethod
+    def get_intersection_percentages(
+        rectangles: list["Rectangle"], others: list["Rectangle"], prefilter: bool = True, use_numpy: bool = True
+    ) -> list[list[float]]:
+        numpy = Rectangle.get_numpy_module() if use_numpy else None
+        if not prefilter and numpy:
+            return Rectangle.get_intersection_percentages_with_numpy(numpy, rectangles, others).tolist()
+
+        if not prefilter:
+            return [[rectangle.get_intersection_percentage(other) for other in others] for rectangle in rectangles]
+
+        matrix: list[list[float]] = list()
+        for intersection_percentages in Rectangle.get_sparse_intersection_percentages(
+            rectangles, others, use_numpy=use_numpy
+        ):
+            row = [0] * len(others)
+            for index, intersection_percentage in intersection_percentages.items():
+                row[index] = intersection_percentage
+            matrix.append(row)
+        return matrix
+
+    @staticmethod
+    def get_top_intersections(
+        rectangles: list["Rectangle"],
+        others: list["Rectangle"],
+        k: int = 1,
+        prefilter: bool = True,
+        use_numpy: bool = True,
+    ) -> list[list[tuple[int, float]]]:
+        return [
+            sorted(
+                [(index, percentage) for index, percentage in intersection_percentages.items() if percentage > 0],
+                key=lambda match: (-match[1], match[0]),
+            )[:k]
+            for intersection_percentages in Rectangle.get_sparse_intersection_percentages(
+                rectangles, others, prefilter, use_numpy
+            )
+        ]
+
+    @staticmethod
+    def get_vertical_intersections(
+        rectangles: list["Rectangle"], others: list["Rectangle"], use_numpy: bool = True
+    ) -> list[list[float]]:
+        numpy = Rectangle.get_numpy_module() if use_numpy else None
+        if numpy:
+            _, tops, _, bottoms = (column[:, None] for column in Rectangle.get_coordinates(numpy, rectangles))
+            _, others_tops, _, others_bottoms = Rectangle.get_coordinates(numpy, others)
+            return numpy.clip(numpy.minimum(bottoms, others_bottoms) - numpy.maximum(tops, others_tops), 0, None).tolist()
+
+        others_tops = [other.top for other in others]
+        others_bottoms = [other.bottom for other in others]
+        return [
+            [
+                max(0, min(rectangle.bottom, bottom) - max(rectangle.top, top))
+                for top, bottom in zip(others_tops, others_bottoms)
+            ]
+            for rectangle in rectangles
+        ]
+
+    @staticmethod
+    def get_horizontal_distances(
+        rectangles: list["Rectangle"], others: list["Rectangle"], use_numpy: bool = True
+    ) -> list[list[float]]:
+        numpy = Rectangle.get_numpy_module() if use_numpy else None
+        if numpy:
+            lefts, _, rights, _ = (column[:, None] for column in Rectangle.get_coordinates(numpy, rectangles))
+            others_lefts, _, others_rights, _ = Rectangle.get_coordinates(numpy, others)
+            return (numpy.maximum(lefts, others_lefts) - numpy.minimum(rights, others_rights)).tolist()
+
+        others_lefts = [other.left for other in others]
+        others_rights = [other.right for other in others]
+        return [
+            [max(rectangle.left, left) - min(rectangle.right, right) for left, right in zip(others_lefts, others_rights)]
+            for rectangle in rectangles
+        ]
+
     def to_dict(self):
         return {"top": self.top, "left": self.left, "right": self.right, "bottom": self.bottom}
 
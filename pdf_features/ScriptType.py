@@ -1,4 +1,5 @@
 from enum import StrEnum
+from pdf_features.PdfLineIndex import PdfLineIndex, LineOverlapRule
 from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.TokenType import TokenType
 
@@ -9,22 +10,23 @@ class ScriptType(StrEnum):
     SUBSCRIPT = "Subscript"
 
     @staticmethod
-    def _get_same_line_boxes(token_box: Rectangle, page_boxes: list[Rectangle]) -> list[Rectangle]:
-        left, top, bottom = token_box.left, token_box.top, token_box.bottom
-        page_boxes.remove(token_box)
-        height_threshold = max(3, (bottom - top) / 2)
-        left_threshold = left * 0.7
+    def _get_same_line_boxes(token_box: Rectangle, line_index: PdfLineIndex) -> list[Rectangle]:
+        left_threshold = token_box.left * 0.7
         same_line_boxes = [
             each_box
-            for each_box in page_boxes
-            if not (each_box.bottom < top + height_threshold or bottom - height_threshold < each_box.top)
-            and each_box.right > left_threshold
+            for each_box in line_index.get_same_line_boxes(token_box, LineOverlapRule.CENTER_BAND)
+            if each_box is not token_box and each_box.right > left_threshold
         ]
         return same_line_boxes
 
     @classmethod
     def from_text_height(
-        cls, common_text_height: int, content: str, token_box: Rectangle, page_boxes: list[Rectangle], token_type: TokenType
+        cls,
+        common_text_height: int,
+        content: str,
+        token_box: Rectangle,
+        line_index: PdfLineIndex | list[Rectangle],
+        token_type: TokenType,
     ):
         if not content.isdigit():
             return cls.REGULAR
@@ -33,7 +35,10 @@ class ScriptType(StrEnum):
         if token_type in {TokenType.TABLE, TokenType.FORMULA, TokenType.PICTURE}:
             return cls.REGULAR
 
-        same_line_boxes = cls._get_same_line_boxes(token_box, page_boxes)
+        if not isinstance(line_index, PdfLineIndex):
+            line_index = PdfLineIndex(line_index)
+
+        same_line_boxes = cls._get_same_line_boxes(token_box, line_index)
 
         if not same_line_boxes:
             return cls.REGULAR
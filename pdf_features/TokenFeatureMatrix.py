@@ -0,0 +1,324 @@
+from array import array
+from typing import Iterable
+
+from pdf_features.HyperlinkStyle import HyperlinkType
+from pdf_features.ListLevel import ListLevel
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfModes import PdfModes
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+from pdf_features.ScriptType import ScriptType
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
+
+NUMERIC_COLUMNS = [
+    "page_number",
+    "left",
+    "top",
+    "right",
+    "bottom",
+    "width",
+    "height",
+    "relative_left",
+    "relative_top",
+    "relative_right",
+    "relative_bottom",
+    "font_size",
+    "bold",
+    "italics",
+    "font_size_ratio",
+    "height_ratio",
+    "right_of_token_on_the_left",
+    "left_of_token_on_the_left",
+    "left_of_token_on_the_right",
+    "right_of_token_on_the_right",
+    "lines_space_mode",
+    "right_space_mode",
+    "reading_order_no",
+    "content_length",
+]
+
+RAW_COLUMNS = [
+    "page_number",
+    "left",
+    "top",
+    "right",
+    "bottom",
+    "width",
+    "height",
+    "page_width",
+    "page_height",
+    "font_size",
+    "bold",
+    "italics",
+    "right_of_token_on_the_left",
+    "left_of_token_on_the_left",
+    "left_of_token_on_the_right",
+    "right_of_token_on_the_right",
+    "reading_order_no",
+    "content_length",
+]
+
+MODE_COLUMNS = ["font_size_mode", "common_text_height", "lines_space_mode", "right_space_mode"]
+
+CATEGORICAL_ENUMS = [
+    ("token_type", TokenType),
+    ("script_type", ScriptType),
+    ("title_type", TitleType),
+    ("list_level", ListLevel),
+    ("hyperlink_type", HyperlinkType),
+]
+
+
+class TokenFeatureMatrix:
+    def __init__(self, columns: list[str], values: array, document_indexes: array):
+        self.columns = columns
+        self.values = values
+        self.document_indexes = document_indexes
+
+    @property
+    def rows_count(self) -> int:
+        return len(self.document_indexes)
+
+    @property
+    def columns_count(self) -> int:
+        return len(self.columns)
+
+    def get_row(self, row_index: int) -> list[float]:
+        start = row_index * self.columns_count
+        return self.values[start : start + self.columns_count].tolist()
+
+    def get_column(self, column_name: str) -> list[float]:
+        column_index = self.columns.index(column_name)
+        return self.values[column_index :: self.columns_count].tolist()
+
+    def to_numpy(self):
+        import numpy
+
+        return numpy.frombuffer(self.values, dtype=numpy.float32).reshape(self.rows_count, self.columns_count)
+
+    @staticmethod
+    def get_columns(categorical_features: bool = True) -> list[str]:
+        if not categorical_features:
+            return list(NUMERIC_COLUMNS)
+
+        categorical_columns = [f"{name}_{member.name.lower()}" for name, enum in CATEGORICAL_ENUMS for member in enum]
+        return NUMERIC_COLUMNS + categorical_columns
+
+    @staticmethod
+    def get_one_hot_encodings() -> list[dict]:
+        one_hot_encodings = list()
+        for _, enum in CATEGORICAL_ENUMS:
+            members = list(enum)
+            one_hot_encodings.append(
+                {member: tuple(1.0 if member == other else 0.0 for other in members) for member in members}
+            )
+        return one_hot_encodings
+
+    @staticmethod
+    def get_numeric_features(token: PdfToken, page: PdfPage, pdf_modes: PdfModes) -> tuple:
+        return TokenFeatureMatrix.get_derived_features(
+            TokenFeatureMatrix.get_raw_features(token, page),
+            TokenFeatureMatrix.get_mode_features(pdf_modes),
+            TokenFeatureMatrix.divide_or_zero,
+        )
+
+    @staticmethod
+    def divide_or_zero(dividend: float, divisor: float) -> float:
+        return dividend / divisor if divisor else 0
+
+    @staticmethod
+    def get_raw_features(token: PdfToken, page: PdfPage) -> tuple:
+        box = token.bounding_box
+        context = token.pdf_token_context
+        return (
+            token.page_number,
+            box.left,
+            box.top,
+            box.right,
+            box.bottom,
+            box.width,
+            box.height,
+            page.page_width or 1,
+            page.page_height or 1,
+            token.font.font_size,
+            token.font.bold,
+            token.font.italics,
+            context.right_of_token_on_the_left,
+            context.left_of_token_on_the_left,
+            context.left_of_token_on_the_right,
+            context.right_of_token_on_the_right,
+            token.reading_order_no,
+            len(token.content),
+        )
+
+    @staticmethod
+    def get_mode_features(pdf_modes: PdfModes) -> tuple:
+        return (
+            pdf_modes.font_size_mode,
+            pdf_modes.common_text_height,
+            pdf_modes.lines_space_mode,
+            pdf_modes.right_space_mode,
+        )
+
+    @staticmethod
+    def get_derived_features(raw_features, mode_features, divide) -> tuple:
+        (
+            page_number,
+            left,
+            top,
+            right,
+            bottom,
+            width,
+            height,
+            page_width,
+            page_height,
+            font_size,
+            bold,
+            italics,
+            right_of_token_on_the_left,
+            left_of_token_on_the_left,
+            left_of_token_on_the_right,
+            right_of_token_on_the_right,
+            reading_order_no,
+            content_length,
+        ) = raw_features
+        font_size_mode, common_text_height, lines_space_mode, right_space_mode = mode_features
+        return (
+            page_number,
+            left,
+            top,
+            right,
+            bottom,
+            width,
+            height,
+            left / page_width,
+            top / page_height,
+            right / page_width,
+            bottom / page_height,
+            font_size,
+            bold,
+            italics,
+            divide(font_size, font_size_mode),
+            divide(height, common_text_height),
+            right_of_token_on_the_left,
+            left_of_token_on_the_left,
+            left_of_token_on_the_right,
+            right_of_token_on_the_right,
+            lines_space_mode,
+            right_space_mode,
+            reading_order_no,
+            content_length,
+        )
+
+    @staticmethod
+    def get_categorical_indexes(token: PdfToken, enum_indexes: list[dict]) -> tuple:
+        token_type_indexes, script_type_indexes, title_type_indexes, list_level_indexes, hyperlink_indexes = enum_indexes
+        return (
+            token_type_indexes[token.token_type],
+            script_type_indexes[token.token_style.script_type],
+            title_type_indexes[token.token_style.title_type],
+            list_level_indexes[token.token_style.list_level],
+            hyperlink_indexes[token.token_style.hyperlink_style.type],
+        )
+
+    @staticmethod
+    def get_numpy_module():
+        try:
+            import numpy
+
+            return numpy
+        except ImportError:
+            return None
+
+    @staticmethod
+    def validate_pdf_features_list(pdf_features_list: Iterable[PdfFeatures]) -> list[PdfFeatures]:
+        if isinstance(pdf_features_list, PdfFeatures):
+            raise TypeError("from_pdf_features expects a list of PdfFeatures, not a single PdfFeatures")
+
+        pdf_features_list = list(pdf_features_list)
+        for pdf_features in pdf_features_list:
+            if not isinstance(pdf_features, PdfFeatures):
+                raise TypeError(f"from_pdf_features expects PdfFeatures items, got {type(pdf_features).__name__}")
+
+        return pdf_features_list
+
+    @staticmethod
+    def from_pdf_features(
+        pdf_features_list: Iterable[PdfFeatures], categorical_features: bool = True, use_numpy: bool = True
+    ) -> "TokenFeatureMatrix":
+        pdf_features_list = TokenFeatureMatrix.validate_pdf_features_list(pdf_features_list)
+        numpy = TokenFeatureMatrix.get_numpy_module() if use_numpy else None
+        if numpy:
+            return TokenFeatureMatrix.from_pdf_features_with_numpy(numpy, pdf_features_list, categorical_features)
+
+        columns = TokenFeatureMatrix.get_columns(categorical_features)
+        values = array("f")
+        document_indexes = array("i")
+        token_type_encoding, script_type_encoding, title_type_encoding, list_level_encoding, hyperlink_encoding = (
+            TokenFeatureMatrix.get_one_hot_encodings()
+        )
+
+        for document_index, pdf_features in enumerate(pdf_features_list):
+            pdf_modes = pdf_features.pdf_modes
+            for page in pdf_features.pages:
+                if categorical_features:
+                    values.extend(
+                        value
+                        for token in page.tokens
+                        for value in TokenFeatureMatrix.get_numeric_features(token, page, pdf_modes)
+                        + token_type_encoding[token.token_type]
+                        + script_type_encoding[token.token_style.script_type]
+                        + title_type_encoding[token.token_style.title_type]
+                        + list_level_encoding[token.token_style.list_level]
+                        + hyperlink_encoding[token.token_style.hyperlink_style.type]
+                    )
+                else:
+                    values.extend(
+                        value
+                        for token in page.tokens
+                        for value in TokenFeatureMatrix.get_numeric_features(token, page, pdf_modes)
+                    )
+                document_indexes.extend([document_index] * len(page.tokens))
+
+        return TokenFeatureMatrix(columns, values, document_indexes)
+
+    @staticmethod
+    def from_pdf_features_with_numpy(
+        numpy, pdf_features_list: list[PdfFeatures], categorical_features: bool
+    ) -> "TokenFeatureMatrix":
+        enum_indexes = [{member: index for index, member in enumerate(enum)} for _, enum in CATEGORICAL_ENUMS]
+        raw_rows: list[tuple] = list()
+        categorical_rows: list[tuple] = list()
+        document_modes: list[tuple] = list()
+        document_indexes = array("i")
+        for document_index, pdf_features in enumerate(pdf_features_list):
+            document_modes.append(TokenFeatureMatrix.get_mode_features(pdf_features.pdf_modes))
+            for page in pdf_features.pages:
+                raw_rows.extend(TokenFeatureMatrix.get_raw_features(token, page) for token in page.tokens)
+                if categorical_features:
+                    categorical_rows.extend(
+                        TokenFeatureMatrix.get_categorical_indexes(token, enum_indexes) for token in page.tokens
+                    )
+                document_indexes.extend([document_index] * len(page.tokens))
+
+        raw = numpy.array(raw_rows, dtype=numpy.float64).reshape(-1, len(RAW_COLUMNS))
+        modes = numpy.array(document_modes, dtype=numpy.float64).reshape(-1, len(MODE_COLUMNS))
+        modes = modes[numpy.frombuffer(document_indexes, dtype=numpy.int32)]
+        numeric_columns = TokenFeatureMatrix.get_derived_features(
+            raw.T,
+            modes.T,
+            lambda dividend, divisor: numpy.divide(dividend, divisor, out=numpy.zeros_like(dividend), where=divisor != 0),
+        )
+        matrix = numpy.column_stack(numeric_columns).astype(numpy.float32)
+        if categorical_features:
+            categories = numpy.array(categorical_rows, dtype=numpy.intp).reshape(-1, len(CATEGORICAL_ENUMS))
+            one_hot_blocks = [
+                numpy.eye(len(enum), dtype=numpy.float32)[categories[:, index]]
+                for index, (_, enum) in enumerate(CATEGORICAL_ENUMS)
+            ]
+            matrix = numpy.hstack([matrix, *one_hot_blocks])
+
+        values = array("f")
+        values.frombytes(numpy.ascontiguousarray(matrix, dtype=numpy.float32).tobytes())
+        return TokenFeatureMatrix(TokenFeatureMatrix.get_columns(categorical_features), values, document_indexes)
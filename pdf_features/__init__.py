@@ -10,6 +10,27 @@ from .ScriptType import ScriptType
 from .TitleType import TitleType
 from .ListLevel import ListLevel
 from .HyperlinkStyle import HyperlinkStyle
+from .MemoryReport import MemoryReport
+from .PdfLineIndex import PdfLineIndex, LineOverlapRule
+from .PdfTokenIndex import PdfTokenIndex
+from .PdfPageCache import PdfPageCache
+from .PdfParagraph import PdfParagraph
+from .PdfHeading import PdfHeading
+from .PdfOutline import PdfOutline
+from .PdfStatistics import PdfStatistics
+from .CorpusStatistics import CorpusStatistics
+from .PdfFeaturesBuffer import PdfFeaturesBuffer
+from .TokenFeatureMatrix import TokenFeatureMatrix
+from .ParallelPdfFeatures import ParallelPdfFeatures
+from .PdfFeaturesJsonl import PdfFeaturesJsonl
+from .CompressedXml import CompressedXml, Compression
+from .ConversionLimits import ConversionLimits, FallbackPolicy
+from .ConversionReport import ConversionReason, ConversionReport
+from .BatchExtraction import BatchExtraction, ExtractionFormat
+from .ExtractionCost import ExtractionCost
+from .ExtractionCostModel import ExtractionCostModel
+from .AdmissionControl import Admission, AdmissionControl, AdmissionDecision
+from .ProfileCapture import ProfileCapture
 from ._version import version as __version__
 
 __all__ = [
@@ -25,4 +46,32 @@ __all__ = [
     "TitleType",
     "ListLevel",
     "HyperlinkStyle",
+    "MemoryReport",
+    "PdfLineIndex",
+    "PdfTokenIndex",
+    "PdfPageCache",
+    "PdfParagraph",
+    "PdfHeading",
+    "PdfOutline",
+    "LineOverlapRule",
+    "PdfStatistics",
+    "CorpusStatistics",
+    "PdfFeaturesBuffer",
+    "TokenFeatureMatrix",
+    "ParallelPdfFeatures",
+    "PdfFeaturesJsonl",
+    "CompressedXml",
+    "Compression",
+    "ConversionLimits",
+    "FallbackPolicy",
+    "ConversionReason",
+    "ConversionReport",
+    "BatchExtraction",
+    "ExtractionFormat",
+    "ExtractionCost",
+    "ExtractionCostModel",
+    "Admission",
+    "AdmissionControl",
+    "AdmissionDecision",
+    "ProfileCapture",
 ]
@@ -0,0 +1,142 @@
+import argparse
+import os
+import pstats
+import sys
+from pathlib import Path
+
+from pdf_features.AdmissionControl import AdmissionControl
+from pdf_features.BatchExtraction import BatchExtraction, ExtractionFormat
+from pdf_features.CompressedXml import CompressedXml, Compression
+from pdf_features.configuration import XML_NAME
+from pdf_features.ConversionLimits import ConversionLimits, FallbackPolicy
+from pdf_features.ExtractionCostModel import ExtractionCostModel
+from pdf_features.ProfileCapture import ProfileCapture
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pdf-features",
+        description="Extract PDF features from PDF files or poppler XML files.",
+        fromfile_prefix_chars="@",
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF files, poppler XML files or directories. Use @file to read a list.")
+    parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument(
+        "-f", "--format", default=ExtractionFormat.JSONL, choices=[output_format.value for output_format in ExtractionFormat]
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--threads", action="store_true", help="Use worker threads instead of worker processes")
+    parser.add_argument("--manifest", help="Manifest path, defaults to manifest.jsonl in the output directory")
+    parser.add_argument("--force", action="store_true", help="Extract files even if the manifest says they are unchanged")
+    parser.add_argument("--split-pages", type=int, help="Convert PDFs with more pages in ranges of this many pages")
+    parser.add_argument("--timeout", type=float, help="Wall-clock seconds allowed for each qpdf or pdftohtml command")
+    parser.add_argument("--memory-limit", type=int, help="Address space limit in MB for each qpdf or pdftohtml command")
+    parser.add_argument("--cpu-limit", type=int, help="CPU seconds allowed for each qpdf or pdftohtml command")
+    parser.add_argument(
+        "--fallback",
+        default=FallbackPolicy.RETRY_WITHOUT_HIDDEN,
+        choices=[fallback_policy.value for fallback_policy in FallbackPolicy],
+        help="What to keep when a limit fires",
+    )
+    parser.add_argument("--max-seconds", type=float, help="Reject documents estimated to take longer than this")
+    parser.add_argument("--max-memory", type=int, help="Reject documents estimated to need more MB than this")
+    parser.add_argument("--max-pages", type=int, help="Reject documents with more pages than this")
+    parser.add_argument("--profile-slow", type=float, help="Profile documents taking longer than these seconds")
+    parser.add_argument(
+        "--capture-dir", help="Where slow documents are captured, defaults to captures in the output directory"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    arguments = get_parser().parse_args(argv)
+    batch_extraction = BatchExtraction(
+        output_path=arguments.output,
+        output_format=ExtractionFormat(arguments.format),
+        jobs=arguments.jobs,
+        manifest_path=arguments.manifest,
+        force=arguments.force,
+        limits=ConversionLimits(
+            timeout_seconds=arguments.timeout,
+            memory_bytes=arguments.memory_limit << 20 if arguments.memory_limit else None,
+            cpu_seconds=arguments.cpu_limit,
+            fallback_policy=FallbackPolicy(arguments.fallback),
+        ),
+        split_pages=arguments.split_pages,
+        use_threads=arguments.threads,
+        profile_capture=ProfileCapture(
+            capture_path=arguments.capture_dir if arguments.capture_dir else os.path.join(arguments.output, "captures"),
+            threshold_seconds=arguments.profile_slow,
+        )
+        if arguments.profile_slow is not None
+        else None,
+        admission_control=AdmissionControl(
+            workers=arguments.jobs,
+            max_seconds=arguments.max_seconds,
+            max_memory_bytes=arguments.max_memory << 20 if arguments.max_memory else None,
+            max_pages=arguments.max_pages,
+        ),
+    )
+    summary = batch_extraction.run(arguments.inputs)
+    print(summary)
+    return 1 if summary.failed_count else 0
+
+
+def get_compress_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pdf-features-compress", description="Compress the poppler XML files of a labeled data tree in place."
+    )
+    parser.add_argument("root_path", help="Labeled data root path")
+    parser.add_argument("-c", "--compression", choices=[compression.value for compression in Compression])
+    parser.add_argument("--xml-name", default=XML_NAME, help="Name of the XML files to compress")
+    return parser
+
+
+def compress_main(argv: list[str] | None = None) -> int:
+    arguments = get_compress_parser().parse_args(argv)
+    compression = Compression(arguments.compression) if arguments.compression else None
+    compressed_paths = CompressedXml.compress_tree(arguments.root_path, compression, arguments.xml_name)
+    print(f"{len(compressed_paths)} files compressed")
+    return 0
+
+
+def get_replay_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pdf-features-replay", description="Replay the Python stages on the XML of captured slow documents."
+    )
+    parser.add_argument("captures", nargs="+", help="Capture directories or directories containing captures")
+    parser.add_argument("--profile", action="store_true", help="Profile the replay and print the slowest functions")
+    parser.add_argument("--top", type=int, default=20, help="Number of functions printed with --profile")
+    return parser
+
+
+def replay_main(argv: list[str] | None = None) -> int:
+    arguments = get_replay_parser().parse_args(argv)
+    for capture_path in arguments.captures:
+        capture_directories = ProfileCapture.get_captures(capture_path) or [Path(capture_path)]
+        for capture_directory in capture_directories:
+            profile_path = capture_directory / "replay.prof" if arguments.profile else None
+            pdf_features, seconds = ProfileCapture.replay(capture_directory, profile_path)
+            tokens_count = sum(len(page.tokens) for page in pdf_features.pages) if pdf_features else 0
+            print(f"{capture_directory}: {seconds:.3f} seconds, {tokens_count} tokens")
+            if profile_path:
+                pstats.Stats(str(profile_path)).sort_stats("cumulative").print_stats(arguments.top)
+    return 0
+
+
+def get_calibrate_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pdf-features-calibrate", description="Fit the extraction cost model on benchmark PDF or poppler XML files."
+    )
+    parser.add_argument("paths", nargs="+", help="Benchmark PDF or poppler XML files")
+    return parser
+
+
+def calibrate_main(argv: list[str] | None = None) -> int:
+    arguments = get_calibrate_parser().parse_args(argv)
+    print(ExtractionCostModel.calibrate(arguments.paths).model_dump_json(indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
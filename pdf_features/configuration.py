@@ -3,5 +3,7 @@ from os.path import join
 
 ROOT_PATH = Path(__file__).parent.parent.absolute()
 XML_NAME = "etree.xml"
+XML_CHUNK_SIZE = 1 << 20
 LABELS_FILE_NAME = "labels.json"
 TOKEN_TYPE_RELATIVE_PATH = join("labeled_data", "token_type")
+SAMPLE_XML_PATH = join(ROOT_PATH, "test_pdfs", "sample_etree.xml")
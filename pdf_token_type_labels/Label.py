@@ -1,10 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from lxml.etree import ElementBase
 
 from pdf_features.Rectangle import Rectangle
 
 
 class Label(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     top: int
     left: int
     width: int
@@ -13,10 +15,12 @@ class Label(BaseModel):
     metadata: str = ""
 
     def intersection_percentage(self, token_bounding_box: Rectangle):
-        label_bounding_box = Rectangle.from_coordinates(
+        return self.get_bounding_box().get_intersection_percentage(token_bounding_box)
+
+    def get_bounding_box(self) -> Rectangle:
+        return Rectangle.from_coordinates(
             left=self.left, top=self.top, right=self.left + self.width, bottom=self.top + self.height
         )
-        return label_bounding_box.get_intersection_percentage(token_bounding_box)
 
     def get_location_discrepancy(self, token_bounding_box: Rectangle):
         coordinates_discrepancy: int = abs(self.left - token_bounding_box.left) + abs(self.top - token_bounding_box.top)
@@ -27,9 +31,14 @@ class Label(BaseModel):
         return self.width * self.height
 
     @staticmethod
-    def from_rectangle(rectangle: Rectangle, token_type: int):
+    def from_rectangle(rectangle: Rectangle, token_type: int, metadata: str = ""):
         return Label(
-            top=rectangle.top, left=rectangle.left, width=rectangle.width, height=rectangle.height, label_type=token_type
+            top=rectangle.top,
+            left=rectangle.left,
+            width=rectangle.width,
+            height=rectangle.height,
+            label_type=token_type,
+            metadata=metadata,
         )
 
     @staticmethod
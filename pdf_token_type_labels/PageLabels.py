@@ -23,3 +23,27 @@ class PageLabels(BaseModel):
                 return token_type
 
         return token_type
+
+    def get_token_types(self, token_bounding_boxes: list[Rectangle]) -> list[int]:
+        sorted_labels_by_area = sorted(self.labels, key=lambda x: x.area())
+        labels_boxes = [label.get_bounding_box() for label in sorted_labels_by_area]
+        tokens_intersections = Rectangle.get_sparse_intersection_percentages(labels_boxes, token_bounding_boxes)
+        labels_by_token: list[list[tuple[int, float]]] = [list() for _ in token_bounding_boxes]
+        for label_index, label_intersections in enumerate(tokens_intersections):
+            for token_index, intersection_percentage in label_intersections.items():
+                labels_by_token[token_index].append((label_index, intersection_percentage))
+
+        return [self.get_best_label_type(sorted_labels_by_area, token_labels) for token_labels in labels_by_token]
+
+    @staticmethod
+    def get_best_label_type(sorted_labels_by_area: list[Label], token_labels: list[tuple[int, float]]) -> int:
+        intersection_percentage = 0
+        token_type = 6
+        for label_index, label_intersection_percentage in token_labels:
+            if label_intersection_percentage > intersection_percentage:
+                intersection_percentage = label_intersection_percentage
+                token_type = sorted_labels_by_area[label_index].label_type
+            if intersection_percentage > 95:
+                return token_type
+
+        return token_type
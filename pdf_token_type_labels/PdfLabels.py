@@ -1,8 +1,17 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
 from pydantic import BaseModel
 
 from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.PageLabels import PageLabels
 
+LABELS_CACHE_SIZE = 4096
+LABELS_CACHE: OrderedDict[str, tuple[int, int, "PdfLabels"]] = OrderedDict()
+LABELS_CACHE_LOCK = threading.Lock()
+
 
 class PdfLabels(BaseModel):
     pages: list[PageLabels] = list()
@@ -15,3 +24,39 @@ class PdfLabels(BaseModel):
             return page.get_token_type(token_bounding_box)
 
         return 6
+
+    def get_label_types(self, page_number: int, token_bounding_boxes: list[Rectangle]) -> list[int]:
+        for page in self.pages:
+            if page.number != page_number:
+                continue
+
+            return page.get_token_types(token_bounding_boxes)
+
+        return [6] * len(token_bounding_boxes)
+
+    def get_copy(self) -> "PdfLabels":
+        return PdfLabels.model_construct(
+            pages=[PageLabels.model_construct(number=page.number, labels=list(page.labels)) for page in self.pages]
+        )
+
+    @staticmethod
+    def from_path(path: str | Path, use_cache: bool = True) -> "PdfLabels":
+        path = str(path)
+        stat = os.stat(path)
+        with LABELS_CACHE_LOCK:
+            cached_labels = LABELS_CACHE.get(path) if use_cache else None
+            if cached_labels and cached_labels[:2] == (stat.st_mtime_ns, stat.st_size):
+                LABELS_CACHE.move_to_end(path)
+                return cached_labels[2].get_copy()
+
+        pdf_labels = PdfLabels.model_validate_json(Path(path).read_bytes())
+
+        if use_cache:
+            with LABELS_CACHE_LOCK:
+                LABELS_CACHE[path] = (stat.st_mtime_ns, stat.st_size, pdf_labels)
+                LABELS_CACHE.move_to_end(path)
+                while len(LABELS_CACHE) > LABELS_CACHE_SIZE:
+                    LABELS_CACHE.popitem(last=False)
+            return pdf_labels.get_copy()
+
+        return pdf_labels
@@ -0,0 +1,70 @@
+import shutil
+import tempfile
+from os.path import join
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features.AdmissionControl import AdmissionControl, AdmissionDecision
+from pdf_features.BatchExtraction import BatchExtraction
+from pdf_features.cli import calibrate_main
+from pdf_features.CompressedXml import CompressedXml, Compression
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.ExtractionCost import ExtractionCost
+from pdf_features.ExtractionCostModel import ExtractionCostModel
+
+
+class TestAdmissionControl(TestCase):
+    def test_xml_cost(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = shutil.copy(SAMPLE_XML_PATH, join(tmp_directory, "sample.xml"))
+            cost = ExtractionCost.from_path(xml_path)
+            compressed_cost = ExtractionCost.from_path(CompressedXml.compress_file(xml_path, Compression.GZIP))
+
+        self.assertEqual((2, 7, True), (cost.pages_count, cost.tokens_count, cost.is_xml))
+        self.assertEqual((2, 7), (compressed_cost.pages_count, compressed_cost.tokens_count))
+        self.assertLess(cost.get_seconds(), ExtractionCost(bytes_count=990, pages_count=2).get_seconds())
+        self.assertEqual(ExtractionCostModel().base_memory_bytes + 7 * 5300, cost.get_peak_memory_bytes())
+
+    def test_budgets(self):
+        admission_control = AdmissionControl(workers=1, max_pages=10, max_memory_bytes=10 << 20)
+
+        accepted = admission_control.admit(SAMPLE_XML_PATH)
+        queued = admission_control.admit(SAMPLE_XML_PATH)
+        too_many_pages = admission_control.acquire(ExtractionCost(bytes_count=1000, pages_count=20))
+        too_much_memory = admission_control.acquire(ExtractionCost(bytes_count=1000, pages_count=1, tokens_count=10**5))
+        admission_control.release(accepted)
+
+        self.assertEqual(AdmissionDecision.ACCEPT, accepted.decision)
+        self.assertEqual(AdmissionDecision.QUEUE, queued.decision)
+        self.assertEqual(AdmissionDecision.REJECT, too_many_pages.decision)
+        self.assertEqual(AdmissionDecision.REJECT, too_much_memory.decision)
+        self.assertIn("memory", too_much_memory.reason)
+        self.assertTrue(admission_control.admit(SAMPLE_XML_PATH).accepted)
+
+    def test_calibration(self):
+        cost_model = ExtractionCostModel.calibrate([SAMPLE_XML_PATH], ExtractionCostModel(base_memory_bytes=0))
+
+        self.assertAlmostEqual(990 / 7, cost_model.xml_bytes_per_token)
+        self.assertEqual(ExtractionCostModel().tokens_per_page, cost_model.tokens_per_page)
+        self.assertEqual(0, calibrate_main([SAMPLE_XML_PATH]))
+
+    def test_calibration_measures_resident_memory(self):
+        content = Path(SAMPLE_XML_PATH).read_text()
+        first_page = content[content.index("<page") : content.index("</page>") + len("</page>")]
+        pages = [first_page.replace('number="1"', f'number="{page_number}"') for page_number in range(1, 2001)]
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = Path(tmp_directory) / "benchmark.xml"
+            xml_path.write_text(f'<?xml version="1.0" encoding="UTF-8"?>\n<pdf2xml>\n{"".join(pages)}\n</pdf2xml>')
+            cost_model = ExtractionCostModel.calibrate([xml_path], ExtractionCostModel(base_memory_bytes=0))
+
+        self.assertGreater(cost_model.peak_bytes_per_token, 1000)
+
+    def test_batch_rejection(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = Path(shutil.copy(SAMPLE_XML_PATH, join(tmp_directory, "sample.xml")))
+            admission_control = AdmissionControl(max_pages=1)
+
+            summary = BatchExtraction(Path(tmp_directory) / "outputs", admission_control=admission_control).run([xml_path])
+
+            self.assertEqual(1, summary.failed_count)
+            self.assertFalse((Path(tmp_directory) / "outputs" / "sample.jsonl").exists())
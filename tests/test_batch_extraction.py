@@ -0,0 +1,187 @@
+import os
+import shutil
+import tempfile
+from os.path import join
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features.AdaptiveConcurrency import AdaptiveConcurrency
+from pdf_features.BatchExtraction import BatchExtraction, ExtractionFormat
+from pdf_features.cli import main
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.ConversionReport import ConversionReport
+from pdf_features.ExtractionCost import ExtractionCost
+from pdf_features.ExtractionJob import ExtractionJob
+from pdf_features.ExtractionManifest import ExtractionManifest
+from pdf_features.ParallelPdfFeatures import ParallelPdfFeatures
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFeaturesBuffer import PdfFeaturesBuffer
+
+
+class TestBatchExtraction(TestCase):
+    def test_binary_output_and_resume(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = Path(tmp_directory) / "inputs" / "sample.xml"
+            xml_path.parent.mkdir()
+            shutil.copy(SAMPLE_XML_PATH, xml_path)
+            output_path = Path(tmp_directory) / "outputs"
+
+            summary = BatchExtraction(output_path, ExtractionFormat.BINARY).run([xml_path])
+            resumed_summary = BatchExtraction(output_path, ExtractionFormat.BINARY).run([xml_path])
+
+            self.assertEqual(
+                (1, 0, 2, 7), (summary.extracted_count, summary.failed_count, summary.pages_count, summary.tokens_count)
+            )
+            self.assertEqual(1, resumed_summary.skipped_count)
+            pdf_features = PdfFeaturesBuffer.unpack((output_path / "sample.pdff").read_bytes())
+            expected_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, file_name="sample.xml")
+            expected_pdf_features.set_token_styles()
+            self.assertEqual(expected_pdf_features.pages, pdf_features.pages)
+
+    def test_same_named_inputs(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_paths = [Path(tmp_directory) / folder / "sample.xml" for folder in ["a", "b"]]
+            for xml_path in xml_paths:
+                xml_path.parent.mkdir()
+                shutil.copy(SAMPLE_XML_PATH, xml_path)
+            output_path = Path(tmp_directory) / "outputs"
+
+            summary = BatchExtraction(output_path, ExtractionFormat.MARKDOWN).run(xml_paths)
+
+            self.assertEqual(2, summary.extracted_count)
+            self.assertTrue((output_path / "a" / "sample.md").exists())
+            self.assertTrue((output_path / "b" / "sample.md").exists())
+            manifest = ExtractionManifest.from_path(output_path / "manifest.jsonl")
+            output_paths = {result.output_path for result in manifest.results.values()}
+            self.assertEqual({str(output_path / "a" / "sample.md"), str(output_path / "b" / "sample.md")}, output_paths)
+
+    def test_overlapping_input_directories(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            input_paths = [Path(tmp_directory) / folder / "inputs" for folder in ["first", "second"]]
+            for input_path in input_paths:
+                (input_path / "reports").mkdir(parents=True)
+                (input_path / "reports" / "doc.pdf").write_bytes(b"")
+            (input_paths[0] / "other.pdf").write_bytes(b"")
+
+            relative_paths = BatchExtraction.get_source_paths(input_paths)
+
+            self.assertEqual(
+                [Path("first/inputs/reports/doc.pdf"), Path("other.pdf"), Path("second/inputs/reports/doc.pdf")],
+                sorted(relative_paths.values()),
+            )
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            output_path = join(tmp_directory, "outputs")
+            missing_path = join(tmp_directory, "missing.pdf")
+
+            exit_code = main([SAMPLE_XML_PATH, missing_path, "-o", output_path, "-f", "markdown", "-j", "1"])
+
+            self.assertEqual(1, exit_code)
+            self.assertTrue(Path(output_path, "sample_etree.md").read_text().startswith("**A title**"))
+            manifest = ExtractionManifest.from_path(join(output_path, "manifest.jsonl"))
+            self.assertTrue(manifest.results[missing_path].failed)
+            self.assertFalse(manifest.results[SAMPLE_XML_PATH].failed)
+
+    def test_parallel_extraction(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            input_path = Path(tmp_directory) / "inputs"
+            input_path.mkdir()
+            for index in range(5):
+                shutil.copy(SAMPLE_XML_PATH, input_path / f"sample_{index}.xml")
+            batch_extraction = BatchExtraction(Path(tmp_directory) / "outputs", ExtractionFormat.MARKDOWN, jobs=2)
+
+            summary = batch_extraction.run([input_path / f"sample_{index}.xml" for index in range(5)])
+
+            self.assertEqual((5, 0, 10), (summary.extracted_count, summary.failed_count, summary.pages_count))
+            self.assertEqual(5, len(list((Path(tmp_directory) / "outputs").glob("*.md"))))
+
+    def test_get_tasks(self):
+        batch_extraction = BatchExtraction(tempfile.gettempdir(), jobs=2, split_pages=100)
+        jobs = [
+            ExtractionJob(
+                source_path=Path(f"{name}.pdf"),
+                output_file_path=Path(f"{name}.jsonl"),
+                cost=ExtractionCost(bytes_count=1000, pages_count=pages_count),
+            )
+            for name, pages_count in [("small_1", 1), ("medium", 50), ("small_2", 2), ("huge", 250)]
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            tasks = batch_extraction.get_tasks(jobs, Path(tmp_directory))
+
+        self.assertEqual([(1, 100), (101, 200), None, (201, None)], [task.page_range for task in tasks[:4]])
+        self.assertEqual(["medium"], [job.source_path.stem for job in tasks[2].jobs])
+        self.assertEqual(["small_1", "small_2"], [job.source_path.stem for job in tasks[4].jobs])
+        self.assertEqual(5, len(tasks))
+
+    def test_last_page_range_is_open_ended(self):
+        first_command = PdfFeatures.get_pdftohtml_command("a.pdf", "a.xml", False, (101, 200))
+        last_command = PdfFeatures.get_pdftohtml_command("a.pdf", "a.xml", False, (201, None))
+
+        self.assertEqual(["-f", "101", "-l", "200"], first_command[3:7])
+        self.assertIn("201", last_command)
+        self.assertNotIn("-l", last_command)
+
+    def test_decrypt_into_copy(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            qpdf_path = Path(tmp_directory) / "qpdf"
+            qpdf_path.write_text('#!/bin/sh\n[ "$1" = "--decrypt" ] && echo decrypted > "$3"\necho encrypted\n')
+            qpdf_path.chmod(0o755)
+            pdf_path = Path(tmp_directory) / "encrypted.pdf"
+            pdf_path.write_bytes(b"encrypted")
+            job = ExtractionJob(
+                source_path=pdf_path,
+                output_file_path=Path("encrypted.jsonl"),
+                cost=ExtractionCost(bytes_count=1000, pages_count=250),
+            )
+            path = os.environ["PATH"]
+            os.environ["PATH"] = f"{tmp_directory}{os.pathsep}{path}"
+            try:
+                BatchExtraction(tmp_directory, jobs=2, split_pages=100).get_tasks([job], Path(tmp_directory))
+            finally:
+                os.environ["PATH"] = path
+
+            self.assertEqual(b"encrypted", pdf_path.read_bytes())
+            self.assertEqual(Path(tmp_directory) / "0.pdf", job.get_conversion_path())
+            self.assertEqual("decrypted\n", job.get_conversion_path().read_text())
+
+    def test_merge_page_ranges(self):
+        with open(SAMPLE_XML_PATH, "rb") as xml_file:
+            content = xml_file.read()
+        first_page_end = content.index(b"</page>") + len(b"</page>")
+        second_page = content[first_page_end : content.rindex(b"</page>")].replace(
+            b'<text top="50" left="72" width="300" height="12" font="0">',
+            b'<fontspec id="0" size="20" family="Arial" color="#000000"/>\n'
+            b'<fontspec id="1" size="12" family="Times" color="#000000"/>\n'
+            b'<text top="50" left="72" width="300" height="12" font="1">',
+        )
+        second_page = second_page.replace(b'font="0"', b'font="1"')
+        page_ranges = list()
+        for xml_content in [
+            content[:first_page_end] + b"</pdf2xml>",
+            content[: content.index(b"<page")] + second_page + b"</page></pdf2xml>",
+        ]:
+            root = PdfFeatures.parse_poppler_etree(xml_content)
+            pdf_features = PdfFeatures.from_poppler_root(root, "sample.pdf", "sample.pdf")
+            fontspecs = [
+                (font.get("id"), font.get("size"), font.get("family"), font.get("color")) for font in root.iter("fontspec")
+            ]
+            page_ranges.append((PdfFeaturesBuffer.pack(pdf_features), fontspecs, ConversionReport()))
+
+        merged_pdf_features = ParallelPdfFeatures.merge_page_ranges(page_ranges, "sample.pdf")
+
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, file_name="sample.pdf", dataset="")
+        self.assertEqual(pdf_features.pages, merged_pdf_features.pages)
+        self.assertEqual(pdf_features.fonts, merged_pdf_features.fonts)
+        self.assertEqual(pdf_features.pdf_modes, merged_pdf_features.pdf_modes)
+
+    def test_adaptive_concurrency(self):
+        concurrency = AdaptiveConcurrency(max_jobs=4, cores=4)
+
+        self.assertEqual(3, concurrency.adjust(load_per_core=2, available_memory_fraction=0.5))
+        self.assertEqual(2, concurrency.adjust(load_per_core=0.5, available_memory_fraction=0.05))
+        self.assertEqual(2, concurrency.adjust(load_per_core=1, available_memory_fraction=0.5))
+        self.assertEqual(3, concurrency.adjust(load_per_core=0.5, available_memory_fraction=0.5))
+        self.assertEqual(4, concurrency.adjust(load_per_core=0.5, available_memory_fraction=0.5))
+        self.assertEqual(4, concurrency.adjust(load_per_core=0.5, available_memory_fraction=0.5))
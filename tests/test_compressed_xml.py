@@ -0,0 +1,49 @@
+import gzip
+import shutil
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features.CompressedXml import CompressedXml, Compression
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.cli import compress_main
+from pdf_features.configuration import XML_NAME, SAMPLE_XML_PATH
+
+
+class TestCompressedXml(TestCase):
+    def test_gzip_sources(self):
+        expected_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, file_name="sample")
+        with open(SAMPLE_XML_PATH, "rb") as xml_file:
+            content = xml_file.read()
+        multi_member_content = gzip.compress(content[:300]) + gzip.compress(content[300:])
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            compressed_path = Path(tmp_directory) / "test_pdfs" / "sample_etree.xml.gz"
+            compressed_path.parent.mkdir()
+            compressed_path.write_bytes(gzip.compress(content))
+
+            sources = [compressed_path, gzip.compress(content), BytesIO(multi_member_content)]
+            for source in sources:
+                pdf_features = PdfFeatures.from_poppler_etree(source, file_name="sample", dataset="test_pdfs")
+                self.assertEqual(expected_pdf_features, pdf_features)
+
+    def test_decompress_plain_chunks(self):
+        chunks = [b"<pdf2xml>", b"</pdf2xml>"]
+        self.assertEqual(chunks, list(CompressedXml.decompress_chunks(chunks)))
+        self.assertEqual([], list(CompressedXml.decompress_chunks([])))
+
+    def test_compress_labeled_data(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = Path(tmp_directory, "pdfs", "sample", XML_NAME)
+            xml_path.parent.mkdir(parents=True)
+            shutil.copy(SAMPLE_XML_PATH, xml_path)
+            expected_pdf_features = PdfFeatures.from_labeled_data(tmp_directory, "dataset", "sample")
+
+            exit_code = compress_main([tmp_directory, "--compression", "gzip"])
+
+            self.assertEqual(0, exit_code)
+            self.assertFalse(xml_path.exists())
+            self.assertEqual(Compression.GZIP, Compression.from_header(Path(str(xml_path) + ".gz").read_bytes()))
+            self.assertEqual(expected_pdf_features, PdfFeatures.from_labeled_data(tmp_directory, "dataset", "sample"))
+            self.assertEqual([], CompressedXml.compress_tree(tmp_directory))
@@ -0,0 +1,112 @@
+import os
+import shutil
+import sys
+import tempfile
+from os.path import join
+from unittest import TestCase
+
+from pdf_features.ConversionLimits import ConversionLimits, FallbackPolicy
+from pdf_features.ConversionReport import ConversionReason, ConversionReport
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.configuration import SAMPLE_XML_PATH
+
+EMPTY_XML = b'<?xml version="1.0"?><pdf2xml><page number="1" height="10" width="10"></page></pdf2xml>'
+
+
+class FakePdftohtmlLimits(ConversionLimits):
+    hidden_reason: ConversionReason = ConversionReason.OK
+    commands: list[list[str]] = []
+
+    def run(self, command: list[str]) -> ConversionReason:
+        self.commands.append(command)
+        with open(command[-1], "wb") as xml_file:
+            xml_file.write(b"<pdf2xml><page" if "-hidden" in command else EMPTY_XML)
+        return self.hidden_reason if "-hidden" in command else ConversionReason.OK
+
+
+class TestConversionLimits(TestCase):
+    def test_limits_fired(self):
+        timeout_reason = ConversionLimits(timeout_seconds=0.2).run([sys.executable, "-c", "import time; time.sleep(10)"])
+        cpu_reason = ConversionLimits(cpu_seconds=1).run([sys.executable, "-c", "while True: pass"])
+        memory_reason = ConversionLimits(memory_bytes=256 << 20).run([sys.executable, "-c", "bytearray(1 << 30)"])
+        failed_reason = ConversionLimits(timeout_seconds=10).run([sys.executable, "-c", "raise SystemExit(2)"])
+
+        self.assertEqual(ConversionReason.TIMEOUT, timeout_reason)
+        self.assertEqual(ConversionReason.CPU_LIMIT, cpu_reason)
+        self.assertEqual(ConversionReason.MEMORY_LIMIT, memory_reason)
+        self.assertEqual(ConversionReason.FAILED, failed_reason)
+        self.assertEqual(ConversionReason.OK, ConversionLimits().run([sys.executable, "-c", "pass"]))
+
+    def test_report_counts(self):
+        report = ConversionReport()
+        for reason in [ConversionReason.OK, ConversionReason.TIMEOUT, ConversionReason.CPU_LIMIT, ConversionReason.OK]:
+            report.add_reason(reason)
+
+        self.assertEqual(ConversionReason.CPU_LIMIT, report.reason)
+        self.assertEqual(
+            (4, 1, 0, 1, 2),
+            (
+                report.commands_count,
+                report.timeouts_count,
+                report.memory_limits_count,
+                report.cpu_limits_count,
+                report.limits_count,
+            ),
+        )
+
+    def test_keep_complete_pages(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = join(tmp_directory, "etree.xml")
+            shutil.copy(SAMPLE_XML_PATH, xml_path)
+            with open(xml_path, "rb") as xml_file:
+                content = xml_file.read()
+            with open(xml_path, "wb") as xml_file:
+                xml_file.write(content[: content.rindex(b"<text")] + b'<text top="1" le')
+
+            PdfFeatures.keep_complete_pages(xml_path)
+            pdf_features = PdfFeatures.from_poppler_etree(xml_path)
+
+        self.assertEqual([1], [page.page_number for page in pdf_features.pages])
+        self.assertEqual(5, len(pdf_features.pages[0].tokens))
+
+    def test_retry_without_hidden_keeps_first_conversion(self):
+        limits = FakePdftohtmlLimits(hidden_reason=ConversionReason.TIMEOUT)
+        report = ConversionReport()
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = join(tmp_directory, "etree.xml")
+            PdfFeatures.run_conversion("document.pdf", xml_path, limits, report)
+            with open(xml_path, "rb") as xml_file:
+                content = xml_file.read()
+            files = os.listdir(tmp_directory)
+
+        self.assertEqual(2, len(limits.commands))
+        self.assertEqual(EMPTY_XML, content)
+        self.assertEqual(["etree.xml"], files)
+        self.assertEqual(FallbackPolicy.RETRY_WITHOUT_HIDDEN, report.fallback)
+        self.assertEqual(ConversionReason.TIMEOUT, report.reason)
+
+    def test_hidden_conversion_replaces_first_conversion(self):
+        limits = FakePdftohtmlLimits(fallback_policy=FallbackPolicy.EMPTY)
+        report = ConversionReport()
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = join(tmp_directory, "etree.xml")
+            PdfFeatures.run_conversion("document.pdf", xml_path, limits, report)
+            with open(xml_path, "rb") as xml_file:
+                content = xml_file.read()
+            files = os.listdir(tmp_directory)
+
+        self.assertEqual(2, len(limits.commands))
+        self.assertEqual(b"<pdf2xml><page", content)
+        self.assertEqual(["etree.xml"], files)
+        self.assertEqual("", report.fallback)
+
+    def test_rlimits_without_preexec_fn(self):
+        limits = ConversionLimits(memory_bytes=256 << 20, cpu_seconds=5)
+
+        with self.assertLogs("pdf_features.ConversionLimits") as logs:
+            reason = limits.run([sys.executable, "-c", "import sys; sys.stderr.write('converted')"])
+
+        self.assertEqual(ConversionReason.OK, reason)
+        self.assertEqual(sys.executable, limits.get_limited_command(["pdftohtml"])[0])
+        self.assertEqual(["pdftohtml"], ConversionLimits(timeout_seconds=1).get_limited_command(["pdftohtml"]))
+        self.assertIn("converted", logs.output[0])
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.CorpusStatistics import CorpusStatistics
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.Label import Label
+from pdf_token_type_labels.PageLabels import PageLabels
+from pdf_token_type_labels.PdfLabels import PdfLabels
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestCorpusStatistics(TestCase):
+    def test_merge_and_serialize(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        worker_1, worker_2 = CorpusStatistics(), CorpusStatistics()
+        worker_1.add_pdf_features(pdf_features)
+        worker_2.add_pdf_features(pdf_features)
+        worker_2.add_pdf_features(pdf_features)
+
+        reduced = CorpusStatistics.reduce(
+            [CorpusStatistics.model_validate_json(w.model_dump_json()) for w in [worker_1, worker_2]]
+        )
+
+        self.assertEqual(3, reduced.documents_count)
+        self.assertEqual(21, reduced.tokens_count)
+        self.assertEqual({18: 3, 12: 15, 7: 3}, reduced.text_heights)
+        self.assertEqual({18.0: 3, 12.0: 18}, reduced.font_sizes)
+        self.assertEqual(12, reduced.get_common_text_height())
+        self.assertEqual(12.0, reduced.get_font_size_mode())
+
+    def test_corpus_prior_in_token_styles(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        title = pdf_features.pages[0].tokens[0]
+        title.token_type = TokenType.TITLE
+        corpus_statistics = CorpusStatistics(text_heights={9: 1000, 12: 10}, font_sizes={9.0: 1000})
+
+        pdf_features.set_token_styles(corpus_statistics)
+
+        self.assertEqual(9, pdf_features.pdf_modes.common_text_height)
+        self.assertEqual(9.0, pdf_features.pdf_modes.font_size_mode)
+        self.assertEqual(TitleType.H1, title.token_style.title_type)
+
+        pdf_features.set_token_styles()
+
+        self.assertEqual(12, pdf_features.pdf_modes.common_text_height)
+        self.assertEqual(12.0, pdf_features.pdf_modes.font_size_mode)
+        self.assertEqual(TitleType.H2, title.token_style.title_type)
+
+    def test_reduce_keeps_prior_weight(self):
+        corpus_statistics = CorpusStatistics(text_heights={9: 10}, prior_weight=5)
+
+        reduced = CorpusStatistics.reduce([corpus_statistics, CorpusStatistics(prior_weight=5)])
+
+        self.assertEqual(5, reduced.prior_weight)
+        self.assertEqual({9: 10}, reduced.text_heights)
+        self.assertEqual(0, CorpusStatistics.reduce([]).documents_count)
+
+    def test_corpus_prior_for_lines_space_mode(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        lines_space_mode = pdf_features.pdf_modes.lines_space_mode
+
+        pdf_features.set_token_styles(CorpusStatistics(line_spaces={25: 1000}))
+        self.assertEqual(25, pdf_features.pdf_modes.lines_space_mode)
+
+        pdf_features.set_token_styles()
+        self.assertEqual(lines_space_mode, pdf_features.pdf_modes.lines_space_mode)
+
+    def test_labeled_document_text_heights(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        title_box = pdf_features.pages[0].tokens[0].bounding_box
+        title_label = Label.from_rectangle(title_box, TokenType.TITLE.get_index())
+        pdf_features.set_token_types(PdfLabels(pages=[PageLabels(number=1, labels=[title_label])]))
+        pdf_features.pages[0].tokens[2].token_type = TokenType.FOOTNOTE
+        corpus_statistics = CorpusStatistics()
+
+        corpus_statistics.add_pdf_features(pdf_features)
+
+        self.assertEqual({12: 5}, corpus_statistics.text_heights)
+        self.assertEqual({12: 5}, pdf_features.get_statistics().text_heights)
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.CorpusStatistics import CorpusStatistics
+from pdf_features.ParallelPdfFeatures import ParallelPdfFeatures
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestParallelPdfFeatures(TestCase):
+    def test_from_poppler_etree(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+
+        parallel_pdf_features = ParallelPdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, workers=2)
+
+        self.assertEqual(pdf_features, parallel_pdf_features)
+        self.assertEqual(pdf_features.get_statistics(), parallel_pdf_features.get_statistics())
+        self.assertEqual(
+            {id(font) for font in pdf_features.fonts}, {id(token.font) for _, token in parallel_pdf_features.loop_tokens()}
+        )
+
+    def test_set_token_styles_with_corpus_statistics(self):
+        corpus_statistics = CorpusStatistics(text_heights={9: 1000}, font_sizes={9.0: 1000}, line_spaces={25: 1000})
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        parallel_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+
+        pdf_features.set_token_styles(corpus_statistics)
+        ParallelPdfFeatures.set_token_styles(parallel_pdf_features, corpus_statistics, workers=2)
+
+        self.assertEqual(25, parallel_pdf_features.pdf_modes.lines_space_mode)
+        self.assertEqual(pdf_features.pdf_modes, parallel_pdf_features.pdf_modes)
+        self.assertEqual(pdf_features, parallel_pdf_features)
+
+    def test_set_token_styles(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        parallel_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        for document in [pdf_features, parallel_pdf_features]:
+            document.pages[0].tokens[0].token_type = TokenType.TITLE
+            document.pages[1].tokens[-1].token_type = TokenType.LIST_ITEM
+
+        pdf_features.set_token_styles()
+        ParallelPdfFeatures.set_token_styles(parallel_pdf_features, workers=2)
+
+        self.assertEqual(pdf_features, parallel_pdf_features)
@@ -1,8 +1,16 @@
+import os
+import tempfile
+from io import BytesIO
 from os.path import join
+from pathlib import Path
 from unittest import TestCase
 
-from pdf_features.configuration import ROOT_PATH
+from pdf_features.configuration import ROOT_PATH, SAMPLE_XML_PATH
+from pdf_features.HyperlinkStyle import HyperlinkStyle, HyperlinkType, NO_HYPERLINK_STYLE
+from pdf_features.ListLevel import ListLevel
 from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
 
 
 class TestPdfFeatures(TestCase):
@@ -21,3 +29,145 @@ class TestPdfFeatures(TestCase):
     def test_ocr_pdf(self):
         pdf_features = PdfFeatures.from_pdf_path(join(ROOT_PATH, "test_pdfs", "ocr_pdf.pdf"))
         self.assertGreater(len(pdf_features.pages[0].tokens), 0)
+
+    def test_file_type_from_pdf_directory(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            bin_path = Path(tmp_directory) / "bin"
+            bin_path.mkdir()
+            (bin_path / "qpdf").write_text("#!/bin/sh\necho File is not encrypted\n")
+            (bin_path / "pdftohtml").write_text(f'#!/bin/sh\nfor last; do :; done\ncp "{SAMPLE_XML_PATH}" "$last"\n')
+            for script_path in bin_path.iterdir():
+                script_path.chmod(0o755)
+            pdf_path = Path(tmp_directory) / "dataset" / "document.pdf"
+            pdf_path.parent.mkdir()
+            pdf_path.write_bytes(b"%PDF")
+            path = os.environ["PATH"]
+            os.environ["PATH"] = f"{bin_path}{os.pathsep}{path}"
+            try:
+                pdf_features = PdfFeatures.from_pdf_path(str(pdf_path))
+            finally:
+                os.environ["PATH"] = path
+
+        self.assertEqual(("document.pdf", "dataset"), (pdf_features.file_name, pdf_features.file_type))
+
+    def test_token_styles_are_shared(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        tokens = [token for _, token in pdf_features.loop_tokens()]
+        tokens[0].token_type = TokenType.TITLE
+        pdf_features.set_token_styles()
+
+        self.assertIs(tokens[1].token_style, tokens[4].token_style)
+        self.assertIs(tokens[1].token_style.font, tokens[6].font)
+        self.assertIs(tokens[1].token_style.hyperlink_style, tokens[4].token_style.hyperlink_style)
+        self.assertIsNot(tokens[1].token_style, tokens[3].token_style)
+        self.assertIsNot(tokens[0].token_style, tokens[1].token_style)
+        self.assertEqual("http://example.com", tokens[3].token_style.hyperlink_style.link)
+
+    def test_deprecated_style_setters_return_copies(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        token = pdf_features.pages[0].tokens[1]
+        token_style = token.token_style
+
+        with self.assertWarns(DeprecationWarning):
+            title_style = token_style.set_title_type(24, 12, TokenType.TITLE)
+        with self.assertWarns(DeprecationWarning):
+            list_style = token_style.set_list_level(ListLevel.LEVEL_1)
+        with self.assertWarns(DeprecationWarning):
+            script_style = token_style.set_script_style(12, token.content, token.bounding_box, [], TokenType.TEXT)
+
+        self.assertEqual(TitleType.NO_TITLE, token_style.title_type)
+        self.assertEqual(token_style.with_title_type(24, 12, TokenType.TITLE), title_style)
+        self.assertEqual(ListLevel.LEVEL_1, list_style.list_level)
+        self.assertEqual(token_style.script_type, script_style.script_type)
+
+    def test_memory_report(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        memory_report = pdf_features.memory_report()
+
+        self.assertEqual(2, memory_report.pages_count)
+        self.assertEqual(7, memory_report.tokens_count)
+        self.assertEqual([5, 2], [page.tokens_count for page in memory_report.pages])
+        self.assertGreater(memory_report.rectangles_bytes, 0)
+        self.assertGreater(memory_report.fonts_bytes, 0)
+        components_bytes = memory_report.pages_bytes + memory_report.tokens_bytes + memory_report.contents_bytes
+        components_bytes += memory_report.rectangles_bytes + memory_report.styles_bytes + memory_report.contexts_bytes
+        self.assertEqual(memory_report.total_bytes, components_bytes + memory_report.fonts_bytes)
+        self.assertEqual(
+            memory_report.total_bytes - memory_report.fonts_bytes, sum(p.total_bytes for p in memory_report.pages)
+        )
+
+    def test_from_poppler_etree_bytes_and_file_objects(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, "sample.pdf", "dataset")
+        with open(SAMPLE_XML_PATH, "rb") as file:
+            xml_bytes = file.read()
+            file.seek(0)
+            pdf_features_from_file = PdfFeatures.from_poppler_etree(file, "sample.pdf", "dataset")
+
+        self.assertEqual(pdf_features, pdf_features_from_file)
+        self.assertEqual(pdf_features, PdfFeatures.from_poppler_etree(xml_bytes, "sample.pdf", "dataset"))
+        self.assertEqual(pdf_features, PdfFeatures.from_poppler_etree(BytesIO(xml_bytes), "sample.pdf", "dataset"))
+
+    def test_from_poppler_etree_replaces_invalid_utf8(self):
+        xml_bytes = Path(SAMPLE_XML_PATH).read_bytes()
+        invalid_xml_bytes = xml_bytes.replace(b"</text>", b"\xff</text>")
+
+        pdf_features = PdfFeatures.from_poppler_etree(invalid_xml_bytes, "sample.pdf", "dataset")
+        valid_pdf_features = PdfFeatures.from_poppler_etree(xml_bytes, "sample.pdf", "dataset")
+
+        contents = [token.content for _, token in pdf_features.loop_tokens()]
+        self.assertEqual([token.content + "\ufffd" for _, token in valid_pdf_features.loop_tokens()], contents)
+
+    def test_multiple_links_per_token(self):
+        xml_bytes = b"""<?xml version="1.0" encoding="UTF-8"?>
+<pdf2xml><page number="1" position="absolute" top="0" left="0" height="842" width="595">
+<fontspec id="0" size="12" family="Times" color="#000000"/>
+<text top="10" left="10" width="300" height="12" font="0">See <a href="http://a.com">first</a> and <a href="http://b.com">second</a></text>
+<text top="30" left="10" width="300" height="12" font="0">No links here</text>
+</page></pdf2xml>"""
+
+        pdf_features = PdfFeatures.from_poppler_etree(xml_bytes, "links.pdf", "dataset")
+
+        linked_token, plain_token = pdf_features.pages[0].tokens
+        hyperlink_links = [style.link for style in linked_token.token_style.hyperlink_style.get_links()]
+        self.assertEqual(["http://a.com", "http://b.com"], hyperlink_links)
+        self.assertEqual("See [first](http://a.com) and [second](http://b.com)", linked_token.content_markdown)
+        self.assertIs(NO_HYPERLINK_STYLE, plain_token.token_style.hyperlink_style)
+
+    def test_links_sharing_a_prefix(self):
+        short_link = HyperlinkStyle(link_text="http://a.com", link="http://a.com", type=HyperlinkType.WEB_URL)
+        long_link = HyperlinkStyle(link_text="http://a.com/b", link="http://a.com/b", type=HyperlinkType.WEB_URL)
+        hyperlink_style = short_link.model_copy(update={"additional_links": (long_link,)})
+
+        html = hyperlink_style.get_styled_content_html("see http://a.com/b and http://a.com")
+        markdown = hyperlink_style.get_styled_content_markdown("see http://a.com/b and http://a.com")
+
+        self.assertEqual('see <a href="http://a.com/b">http://a.com/b</a> and <a href="http://a.com">http://a.com</a>', html)
+        self.assertEqual("see [http://a.com/b](http://a.com/b) and [http://a.com](http://a.com)", markdown)
+
+    def test_short_link_text_does_not_rewrite_markup(self):
+        first_link = HyperlinkStyle(link_text="a", link="http://x.com", type=HyperlinkType.WEB_URL)
+        second_link = HyperlinkStyle(link_text="b", link="http://y.com", type=HyperlinkType.WEB_URL)
+        hyperlink_style = second_link.model_copy(update={"additional_links": (first_link,)})
+
+        html = hyperlink_style.get_styled_content_html("b a")
+
+        self.assertEqual('<a href="http://y.com">b</a> <a href="http://x.com">a</a>', html)
+
+    def test_rendered_content_is_cached_until_the_token_changes(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        page = pdf_features.pages[0]
+        title_token = page.tokens[0]
+
+        rendered_contents = page.render_contents()
+        markdown = title_token.content_markdown
+
+        self.assertIs(rendered_contents[0][0], markdown)
+        self.assertEqual("**A title**", markdown)
+
+        title_token.token_type = TokenType.TITLE
+        pdf_features.set_token_styles()
+        self.assertEqual("## **A title**", title_token.content_markdown)
+        self.assertEqual("<h2><b>A title</b></h2>", title_token.content_html)
+
+        title_token.content = "New title"
+        self.assertEqual("## **New title**", title_token.content_markdown)
@@ -0,0 +1,72 @@
+import pickle
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFeaturesBuffer import PdfFeaturesBuffer
+from pdf_features.PdfModes import PdfModes
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestPdfFeaturesBuffer(TestCase):
+    def _get_pdf_features(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        pdf_features.pages[0].tokens[0].token_type = TokenType.TITLE
+        pdf_features.pages[1].tokens[0].token_type = TokenType.LIST_ITEM
+        pdf_features.set_token_styles()
+        return pdf_features
+
+    def test_pack_and_unpack(self):
+        pdf_features = self._get_pdf_features()
+
+        unpacked_pdf_features = PdfFeaturesBuffer.unpack(PdfFeaturesBuffer.pack(pdf_features))
+
+        self.assertEqual(pdf_features, unpacked_pdf_features)
+        self.assertEqual(pickle.loads(pickle.dumps(pdf_features)), unpacked_pdf_features)
+        tokens = [token for _, token in unpacked_pdf_features.loop_tokens()]
+        self.assertIs(tokens[1].token_style, tokens[4].token_style)
+        self.assertEqual(pdf_features.pages[0].tokens[3].content_html, tokens[3].content_html)
+
+    def test_shared_memory(self):
+        pdf_features = self._get_pdf_features()
+
+        shared_memory_name = PdfFeaturesBuffer.to_shared_memory(pdf_features)
+
+        self.assertEqual(pdf_features, PdfFeaturesBuffer.from_shared_memory(shared_memory_name))
+
+    def test_empty_pdf_features(self):
+        pdf_features = PdfFeatures.get_empty()
+        self.assertEqual(pdf_features, PdfFeaturesBuffer.unpack(PdfFeaturesBuffer.pack(pdf_features)))
+
+    def test_wrong_buffer(self):
+        with self.assertRaises(ValueError):
+            PdfFeaturesBuffer.unpack(b"not a buffer with enough bytes")
+
+    def test_explicit_pdf_modes_keep_analysis(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        pages = [
+            page.model_copy(update={"tokens": [token.model_copy() for token in page.tokens]}) for page in pdf_features.pages
+        ]
+        for page in pages:
+            for token in page.tokens:
+                token.pdf_token_context = token.pdf_token_context.model_copy(update={"left_of_token_on_the_left": -1})
+
+        validated_pdf_features = PdfFeatures(
+            pages=pages, fonts=pdf_features.fonts, file_name="", file_type="", pdf_modes=PdfModes()
+        )
+        dumped_pdf_features = PdfFeatures.model_validate(pdf_features.model_dump())
+
+        self.assertEqual(pdf_features.pdf_modes, validated_pdf_features.pdf_modes)
+        self.assertEqual(pdf_features.pages[0].tokens[1].pdf_token_context, pages[0].tokens[1].pdf_token_context)
+        self.assertEqual(pdf_features.pdf_modes, dumped_pdf_features.pdf_modes)
+        self.assertIsNotNone(dumped_pdf_features._statistics)
+
+    def test_unpacked_models_have_private_defaults(self):
+        unpacked_pdf_features = PdfFeaturesBuffer.unpack(PdfFeaturesBuffer.pack(self._get_pdf_features()))
+
+        page = unpacked_pdf_features.pages[0]
+        self.assertEqual(PdfPage.__private_attributes__.keys(), page.__pydantic_private__.keys())
+        self.assertEqual(PdfToken.__private_attributes__.keys(), page.tokens[0].__pydantic_private__.keys())
+        self.assertEqual(len(page.tokens), len(page.get_line_index().boxes))
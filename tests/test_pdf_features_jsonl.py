@@ -0,0 +1,35 @@
+import json
+from io import BytesIO, StringIO
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFeaturesJsonl import PdfFeaturesJsonl
+
+
+class TestPdfFeaturesJsonl(TestCase):
+    def test_write_tokens(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        output = StringIO()
+
+        written_pages = PdfFeaturesJsonl.write_pdf_features(pdf_features, output, fields=["page_number", "content"])
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(2, written_pages)
+        self.assertEqual(7, len(records))
+        self.assertEqual({"page_number": 1, "content": pdf_features.pages[0].tokens[0].content}, records[0])
+
+    def test_write_from_poppler_etree(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        expected_output = StringIO()
+        PdfFeaturesJsonl.write_pdf_features(pdf_features, expected_output, per_page=True)
+        output = BytesIO()
+
+        PdfFeaturesJsonl.write_from_poppler_etree(SAMPLE_XML_PATH, output, per_page=True)
+
+        self.assertEqual(expected_output.getvalue(), output.getvalue().decode("utf-8"))
+        self.assertEqual(pdf_features.pages, list(PdfFeatures.iter_poppler_pages(SAMPLE_XML_PATH)))
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            PdfFeaturesJsonl.write([], StringIO(), fields=["unknown"])
@@ -0,0 +1,82 @@
+import tempfile
+from os.path import join
+from pathlib import Path
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.Rectangle import Rectangle
+from pdf_token_type_labels.Label import Label
+from pdf_token_type_labels.PageLabels import PageLabels
+from pdf_token_type_labels.PdfLabels import PdfLabels
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestPdfLabels(TestCase):
+    def _get_pdf_labels(self, label_type: int):
+        label = Label.from_rectangle(Rectangle.from_coordinates(100, 200, 200, 220), label_type)
+        return PdfLabels(pages=[PageLabels(number=1, labels=[label])])
+
+    def test_load_labels(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            labels_path = join(tmp_directory, "labels.json")
+            pdf_labels = self._get_pdf_labels(TokenType.TITLE.get_index())
+            Path(labels_path).write_text(pdf_labels.model_dump_json())
+
+            loaded_labels = PdfFeatures.load_labels(labels_path, use_cache=False)
+
+            self.assertEqual(pdf_labels, loaded_labels)
+            self.assertEqual(
+                TokenType.TITLE.get_index(), loaded_labels.get_label_type(1, Rectangle.from_coordinates(100, 200, 200, 220))
+            )
+
+    def test_load_labels_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            labels_path = join(tmp_directory, "labels.json")
+            Path(labels_path).write_text(self._get_pdf_labels(1).model_dump_json())
+
+            first_labels = PdfFeatures.load_labels(labels_path)
+            cached_labels = PdfFeatures.load_labels(labels_path)
+            self.assertEqual(first_labels, cached_labels)
+            self.assertIs(first_labels.pages[0].labels[0], cached_labels.pages[0].labels[0])
+
+            Path(labels_path).write_text(self._get_pdf_labels(10).model_dump_json())
+            reloaded_labels = PdfFeatures.load_labels(labels_path)
+
+            self.assertIsNot(first_labels, reloaded_labels)
+            self.assertEqual(10, reloaded_labels.pages[0].labels[0].label_type)
+
+    def test_cached_labels_are_not_shared(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            labels_path = join(tmp_directory, "labels.json")
+            Path(labels_path).write_text(self._get_pdf_labels(1).model_dump_json())
+
+            first_labels = PdfFeatures.load_labels(labels_path)
+            first_labels.pages[0].add_label(Label.from_rectangle(Rectangle.from_coordinates(0, 0, 10, 10), 2))
+            first_labels.pages.append(PageLabels(number=2, labels=[]))
+            with self.assertRaises(ValidationError):
+                first_labels.pages[0].labels[0].label_type = 5
+
+            cached_labels = PdfFeatures.load_labels(labels_path)
+
+            self.assertEqual(self._get_pdf_labels(1), cached_labels)
+
+    def test_missing_labels(self):
+        self.assertEqual(PdfLabels(pages=[]), PdfFeatures.load_labels("/not/a/path/labels.json"))
+
+    def test_get_label_types(self):
+        small_label = Label.from_rectangle(Rectangle.from_coordinates(100, 200, 200, 220), TokenType.TITLE.get_index())
+        big_label = Label.from_rectangle(Rectangle.from_coordinates(0, 0, 600, 800), TokenType.TABLE.get_index())
+        pdf_labels = PdfLabels(pages=[PageLabels(number=1, labels=[big_label, small_label])])
+        boxes = [
+            Rectangle.from_coordinates(100, 200, 200, 220),
+            Rectangle.from_coordinates(300, 400, 350, 410),
+            Rectangle.from_coordinates(700, 900, 750, 910),
+        ]
+
+        label_types = pdf_labels.get_label_types(1, boxes)
+
+        self.assertEqual([pdf_labels.get_label_type(1, box) for box in boxes], label_types)
+        self.assertEqual([TokenType.TITLE.get_index(), TokenType.TABLE.get_index(), 6], label_types)
+        self.assertEqual([6, 6, 6], pdf_labels.get_label_types(2, boxes))
@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfLineIndex import LineOverlapRule
+from pdf_features.PdfPage import PdfPage
+from pdf_features.Rectangle import Rectangle
+from pdf_features.ScriptType import ScriptType
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestPdfLineIndex(TestCase):
+    def test_lines(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        page = pdf_features.pages[0]
+
+        lines = [[token.content for token in line] for line in page.get_lines()]
+
+        self.assertEqual(
+            [["A title"], ["First line of text", "1"], ["Second line of example"], ["Third line of text"]], lines
+        )
+
+    def test_same_line_tokens_match_token_rules(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        page = pdf_features.pages[0]
+
+        for token in page.tokens:
+            self.assertEqual(token.get_same_line_tokens(page.tokens), page.get_same_line_tokens(token))
+            same_line = [other for other in page.tokens if token.same_line(other)]
+            self.assertEqual(same_line, page.get_same_line_tokens(token, LineOverlapRule.OVERLAP))
+
+    def test_center_band_rule(self):
+        token_box = Rectangle.from_coordinates(0, 100, 10, 120)
+        self.assertTrue(LineOverlapRule.CENTER_BAND.matches(token_box, Rectangle.from_coordinates(20, 105, 30, 125)))
+        self.assertFalse(LineOverlapRule.CENTER_BAND.matches(token_box, Rectangle.from_coordinates(20, 115, 30, 135)))
+        self.assertTrue(LineOverlapRule.OVERLAP.matches(token_box, Rectangle.from_coordinates(20, 115, 30, 135)))
+
+    def test_first_top_below(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        line_index = pdf_features.pages[0].get_line_index()
+
+        self.assertEqual(78, line_index.get_first_top_below(68))
+        self.assertIsNone(line_index.get_first_top_below(122))
+
+    def test_line_index_follows_tokens_replacement(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        page = pdf_features.pages[0]
+        line_index = page.get_line_index()
+
+        page.tokens = list(reversed(page.tokens))
+        self.assertIsNot(line_index, page.get_line_index())
+        self.assertEqual([token.bounding_box for token in page.tokens], page.get_line_index().boxes)
+
+        line_index = page.get_line_index()
+        page.tokens[0] = page.tokens[0].model_copy(update={"bounding_box": Rectangle.from_coordinates(0, 500, 10, 510)})
+        page.reset_line_index()
+        self.assertIsNot(line_index, page.get_line_index())
+        self.assertEqual(500, page.get_line_index().boxes[0].top)
+
+        page.tokens[1].bounding_box.top = 600
+        page.tokens[1].bounding_box.bottom = 610
+        page.reset_line_index()
+        self.assertEqual([page.tokens[1]], page.get_lines()[-1])
+
+    def test_script_type_does_not_depend_on_token_order(self):
+        number_box = Rectangle.from_coordinates(100, 100, 110, 120)
+        footnote_box = Rectangle.from_coordinates(110, 100, 115, 108)
+        contents = ["1", "2"]
+        token_types = [TokenType.TEXT, TokenType.TEXT]
+
+        styles = PdfPage.get_token_styles([number_box, footnote_box], contents, token_types, 30)
+        reversed_styles = PdfPage.get_token_styles([footnote_box, number_box], contents[::-1], token_types, 30)
+
+        self.assertEqual(ScriptType.REGULAR, styles[0][1])
+        self.assertEqual(ScriptType.SUPERSCRIPT, styles[1][1])
+        self.assertEqual(styles, reversed_styles[::-1])
+
+    def test_script_type_accepts_page_boxes(self):
+        boxes = [Rectangle.from_coordinates(0, 100, 100, 120), Rectangle.from_coordinates(100, 100, 105, 108)]
+
+        script_type = ScriptType.from_text_height(20, "1", boxes[1], boxes, TokenType.TEXT)
+
+        self.assertEqual(ScriptType.SUPERSCRIPT, script_type)
+        self.assertEqual(2, len(boxes))
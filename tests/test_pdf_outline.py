@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.TitleType import TitleType
+from pdf_token_type_labels.TokenType import TokenType
+
+OUTLINE_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<pdf2xml producer="poppler" version="24.02.0">
+<page number="1" position="absolute" top="0" left="0" height="842" width="595">
+<fontspec id="0" size="12" family="Times" color="#000000"/>
+<fontspec id="1" size="24" family="Times-Bold" color="#000000"/>
+<fontspec id="2" size="16" family="Times-Bold" color="#000000"/>
+<text top="50" left="72" width="200" height="24" font="1">1 Introduction</text>
+<text top="90" left="72" width="300" height="12" font="0">Introduction text</text>
+<text top="120" left="72" width="200" height="24" font="1">2 Methods</text>
+<text top="160" left="72" width="200" height="16" font="2">2.1 Data</text>
+<text top="190" left="72" width="300" height="12" font="0">Data text</text>
+</page>
+<page number="2" position="absolute" top="0" left="0" height="842" width="595">
+<text top="50" left="72" width="200" height="16" font="2">2.2 Models and</text>
+<text top="70" left="72" width="200" height="16" font="2">baselines</text>
+<text top="100" left="72" width="300" height="12" font="0">Models text</text>
+<text top="130" left="72" width="200" height="24" font="1">3 Results</text>
+<text top="170" left="72" width="300" height="12" font="0">Results text</text>
+</page>
+</pdf2xml>"""
+
+CONSECUTIVE_HEADINGS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<pdf2xml producer="poppler" version="24.02.0">
+<page number="1" position="absolute" top="0" left="0" height="842" width="595">
+<fontspec id="0" size="12" family="Times" color="#000000"/>
+<fontspec id="1" size="24" family="Times-Bold" color="#000000"/>
+<text top="50" left="72" width="200" height="24" font="1">1 Introduction</text>
+<text top="120" left="72" width="200" height="24" font="1">2 Methods</text>
+<text top="190" left="72" width="200" height="24" font="1">Acknowledgements</text>
+<text top="230" left="72" width="300" height="12" font="0">Methods text</text>
+<text top="246" left="72" width="300" height="12" font="0">More methods text</text>
+<text top="262" left="72" width="300" height="12" font="0">Even more methods text</text>
+<text top="278" left="72" width="300" height="12" font="0">Last methods text</text>
+</page>
+</pdf2xml>"""
+
+
+class TestPdfOutline(TestCase):
+    def get_pdf_features(self, xml: bytes = OUTLINE_XML) -> PdfFeatures:
+        pdf_features = PdfFeatures.from_poppler_etree(xml)
+        for _, token in pdf_features.loop_tokens():
+            if token.bounding_box.height == 24:
+                token.token_type = TokenType.TITLE
+            elif token.bounding_box.height == 16:
+                token.token_type = TokenType.SECTION_HEADER
+        pdf_features.set_token_styles()
+        return pdf_features
+
+    def test_tree(self):
+        outline = self.get_pdf_features().get_outline()
+
+        self.assertEqual(["1 Introduction", "2 Methods", "3 Results"], [heading.title for heading in outline.roots])
+        self.assertEqual(["2.1 Data", "2.2 Models and baselines"], [heading.title for heading in outline.roots[1].children])
+        self.assertEqual(TitleType.H1, outline.roots[0].title_type)
+        self.assertEqual([1, 1, 3, 3, 1], [heading.level for heading in outline.headings])
+        self.assertEqual([(0, 2), (2, 8), (3, 5), (5, 8), (8, 10)], [(h.start_index, h.end_index) for h in outline.headings])
+
+    def test_sections(self):
+        pdf_features = self.get_pdf_features()
+        outline = pdf_features.get_outline()
+
+        heading = outline.get_heading("2.2")
+
+        self.assertEqual(2, heading.page_number)
+        self.assertEqual(7, heading.body_start_index)
+        self.assertEqual(["Models text"], [token.content for token in outline.get_section_tokens(heading, False)])
+        self.assertEqual(
+            ["2.1 Data", "Data text", "2.2 Models and", "baselines", "Models text"],
+            [token.content for token in outline.get_section_tokens(outline.get_heading("2"))[1:]],
+        )
+        self.assertEqual("### **2.1 Data**\nData text", outline.get_section_markdown(outline.get_heading("2.1")))
+        self.assertEqual([outline.roots[2]], outline.find_headings("results"))
+        self.assertIs(outline, pdf_features.get_outline())
+
+    def test_without_headings(self):
+        outline = PdfFeatures.from_poppler_etree(OUTLINE_XML).get_outline()
+
+        self.assertEqual([], outline.roots)
+        self.assertIsNone(outline.get_heading("1"))
+
+    def test_consecutive_headings_are_not_merged(self):
+        outline = self.get_pdf_features(CONSECUTIVE_HEADINGS_XML).get_outline()
+
+        self.assertEqual(
+            ["1 Introduction", "2 Methods", "Acknowledgements"], [heading.title for heading in outline.headings]
+        )
+        self.assertEqual("2 Methods", outline.get_heading("2").title)
+        self.assertEqual((1, 2), (outline.get_heading("2").start_index, outline.get_heading("2").end_index))
@@ -0,0 +1,57 @@
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfPageCache import PdfPageCache
+from pdf_features.configuration import SAMPLE_XML_PATH
+
+
+class TestPdfPageCache(TestCase):
+    def test_repeated_document(self):
+        page_cache = PdfPageCache()
+        expected_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        expected_pdf_features.set_token_styles()
+
+        for _ in range(2):
+            pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, page_cache=page_cache)
+            pdf_features.set_token_styles()
+            self.assertEqual(expected_pdf_features, pdf_features)
+            self.assertEqual(expected_pdf_features.pdf_modes, pdf_features.pdf_modes)
+
+        self.assertEqual(0.5, page_cache.get_page_hit_rate())
+        self.assertEqual(0.5, page_cache.get_style_hit_rate())
+
+    def test_cached_pages_are_not_shared(self):
+        page_cache = PdfPageCache()
+        first_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, page_cache=page_cache)
+        second_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, page_cache=page_cache)
+        third_pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, page_cache=page_cache)
+
+        second_pdf_features.pages[0].tokens[0].content = "changed"
+        second_pdf_features.pages[0].tokens[1].bounding_box.top = 500
+
+        for pdf_features in [first_pdf_features, third_pdf_features]:
+            self.assertNotEqual("changed", pdf_features.pages[0].tokens[0].content)
+            self.assertNotEqual(500, pdf_features.pages[0].tokens[1].bounding_box.top)
+            self.assertEqual(pdf_features.pages[0].tokens[2:], second_pdf_features.pages[0].tokens[2:])
+
+    def test_pages_with_other_font_ids(self):
+        content = Path(SAMPLE_XML_PATH).read_bytes()
+        renamed_content = content.replace(b'id="0"', b'id="5"').replace(b'font="0"', b'font="5"')
+        page_cache = PdfPageCache()
+        PdfFeatures.from_poppler_etree(content, page_cache=page_cache)
+
+        pdf_features = PdfFeatures.from_poppler_etree(renamed_content, page_cache=page_cache)
+
+        self.assertEqual(PdfFeatures.from_poppler_etree(renamed_content), pdf_features)
+        self.assertEqual({"1", "5"}, {token.font.font_id for _, token in pdf_features.loop_tokens()})
+        self.assertEqual(2, page_cache.page_hits)
+
+    def test_eviction(self):
+        page_cache = PdfPageCache(max_pages=1)
+        PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, page_cache=page_cache)
+        PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH, page_cache=page_cache)
+
+        self.assertEqual(1, len(page_cache.pages))
+        self.assertEqual(0, page_cache.page_hits)
+        self.assertEqual(4, page_cache.page_misses)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.Rectangle import Rectangle
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_token_type_labels.Label import Label
+from pdf_token_type_labels.PageLabels import PageLabels
+from pdf_token_type_labels.PdfLabels import PdfLabels
+from pdf_token_type_labels.TokenType import TokenType
+
+
+TWO_COLUMNS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<pdf2xml producer="poppler" version="24.02.0">
+<page number="1" position="absolute" top="0" left="0" height="842" width="595">
+<fontspec id="0" size="12" family="Times" color="#000000"/>
+<text top="100" left="72" width="200" height="12" font="0">Left first</text>
+<text top="100" left="320" width="200" height="12" font="0">Right first</text>
+<text top="114" left="72" width="200" height="12" font="0">Left second</text>
+<text top="114" left="320" width="200" height="12" font="0">Right second</text>
+<text top="160" left="72" width="200" height="12" font="0">Left after gap</text>
+</page>
+</pdf2xml>"""
+
+
+class TestPdfParagraphs(TestCase):
+    def test_paragraphs(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+
+        paragraphs = pdf_features.get_paragraphs()
+
+        self.assertEqual([1, 1, 2], [paragraph.page_number for paragraph in paragraphs])
+        self.assertEqual([[0], [1, 2, 3, 4], [0, 1]], [paragraph.token_indexes for paragraph in paragraphs])
+        self.assertEqual(Rectangle.from_coordinates(72, 78, 385, 122), paragraphs[1].bounding_box)
+        self.assertEqual(
+            "First line of text 1 Second line of example Third line of text",
+            paragraphs[1].get_content(pdf_features.pages[0]),
+        )
+        self.assertIs(paragraphs[2], pdf_features.get_page_paragraphs(2)[0])
+
+    def test_columns_and_gaps(self):
+        pdf_features = PdfFeatures.from_poppler_etree(TWO_COLUMNS_XML)
+
+        paragraphs = pdf_features.get_page_paragraphs(1)
+
+        self.assertEqual(
+            ["Left first Left second", "Right first Right second", "Left after gap"],
+            [paragraph.get_content(pdf_features.pages[0]) for paragraph in paragraphs],
+        )
+
+    def test_token_types_split_paragraphs(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        labels = PdfLabels(pages=[PageLabels(number=2, labels=[Label(left=72, top=50, width=300, height=12, label_type=2)])])
+
+        pdf_features.set_token_types(labels)
+
+        paragraphs = pdf_features.get_page_paragraphs(2)
+        self.assertEqual([TokenType.LIST_ITEM, TokenType.TEXT], [paragraph.token_type for paragraph in paragraphs])
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfStatistics import PdfStatistics
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestPdfStatistics(TestCase):
+    def test_pdf_modes(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+
+        self.assertEqual(3, pdf_features.pdf_modes.lines_space_mode)
+        self.assertEqual(595 - 372, pdf_features.pdf_modes.right_space_mode)
+        self.assertEqual(12, pdf_features.pdf_modes.font_size_mode)
+        self.assertEqual(12, pdf_features.pdf_modes.common_text_height)
+
+    def test_common_text_height_follows_token_types(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        for _, token in pdf_features.loop_tokens():
+            if token.bounding_box.height == 12:
+                token.token_type = TokenType.TABLE
+
+        pdf_features.set_common_text_height()
+
+        self.assertEqual(18, pdf_features.pdf_modes.common_text_height)
+
+    def test_page_at_a_time(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        statistics_by_page = [PdfStatistics.from_pages([page]) for page in pdf_features.pages]
+
+        merged_statistics = statistics_by_page[0].merge(statistics_by_page[1])
+
+        self.assertEqual(pdf_features.get_statistics(), merged_statistics)
+        self.assertEqual(pdf_features.pdf_modes, merged_statistics.get_pdf_modes())
+
+    def test_streaming_construction(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        streamed_pdf_features = PdfFeatures.get_empty()
+
+        for page in pdf_features.pages:
+            streamed_pdf_features.add_page(page.model_copy(deep=True))
+
+        self.assertEqual(pdf_features.pdf_modes, streamed_pdf_features.pdf_modes)
+        self.assertEqual(pdf_features.pages, streamed_pdf_features.pages)
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.Rectangle import Rectangle
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_token_type_labels.Label import Label
+from pdf_token_type_labels.PageLabels import PageLabels
+from pdf_token_type_labels.PdfLabels import PdfLabels
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestPdfTokenIndex(TestCase):
+    def test_queries(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        all_tokens = [token for _, token in pdf_features.loop_tokens()]
+
+        self.assertEqual(tuple(all_tokens), pdf_features.get_tokens_by_type(TokenType.TEXT))
+        self.assertEqual((), pdf_features.get_tokens_by_type(TokenType.TABLE))
+        self.assertEqual(["A title"], [token.content for token in pdf_features.get_tokens_by_font_id("1")])
+        self.assertEqual(6, len(pdf_features.get_tokens_by_font_id("0")))
+        self.assertEqual(2, pdf_features.get_page(2).page_number)
+        self.assertEqual(tuple(pdf_features.pages[1].tokens), pdf_features.get_page_tokens(2))
+        self.assertEqual((), pdf_features.get_page_tokens(3))
+        self.assertIs(pdf_features.get_tokens_by_font_id("0"), pdf_features.get_tokens_by_font_id("0"))
+
+    def test_tokens_in_region(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+
+        region = Rectangle.from_coordinates(70, 75, 200, 100)
+        tokens = pdf_features.get_tokens_in_region(1, region)
+
+        expected_tokens = [
+            token
+            for token in pdf_features.pages[0].tokens
+            if region.left < token.bounding_box.right
+            and token.bounding_box.left < region.right
+            and region.top < token.bounding_box.bottom
+            and token.bounding_box.top < region.bottom
+        ]
+        self.assertEqual(["First line of text", "Second line of example"], [token.content for token in tokens])
+        self.assertEqual(tuple(expected_tokens), tokens)
+        self.assertEqual((), pdf_features.get_tokens_in_region(3, region))
+
+    def test_invalidation(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        self.assertEqual(7, len(pdf_features.get_tokens_by_type(TokenType.TEXT)))
+
+        title_box = pdf_features.pages[0].tokens[0].bounding_box
+        labels = PdfLabels(
+            pages=[
+                PageLabels(
+                    number=1,
+                    labels=[
+                        Label(
+                            top=title_box.top,
+                            left=title_box.left,
+                            width=title_box.width,
+                            height=title_box.height,
+                            label_type=TokenType.TITLE.get_index(),
+                        )
+                    ],
+                )
+            ]
+        )
+        pdf_features.set_token_types(labels)
+
+        self.assertEqual(["A title"], [token.content for token in pdf_features.get_tokens_by_type(TokenType.TITLE)])
+        self.assertEqual(6, len(pdf_features.get_tokens_by_type(TokenType.TEXT)))
+
+    def test_page_tokens_replacement(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        self.assertEqual(5, len(pdf_features.get_page_tokens(1)))
+
+        pdf_features.pages[0].tokens = pdf_features.pages[0].tokens[:2]
+        self.assertEqual(2, len(pdf_features.get_page_tokens(1)))
+
+        pdf_features.pages[0].tokens.pop()
+        self.assertEqual(1, len(pdf_features.get_page_tokens(1)))
+
+        pdf_features.pages[1] = pdf_features.pages[1].model_copy(update={"tokens": []})
+        self.assertEqual((), pdf_features.get_page_tokens(2))
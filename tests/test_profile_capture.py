@@ -0,0 +1,62 @@
+import json
+import pstats
+import shutil
+import tempfile
+from os.path import join
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features.BatchExtraction import BatchExtraction
+from pdf_features.cli import replay_main
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.ProfileCapture import ProfileCapture
+
+
+class TestProfileCapture(TestCase):
+    def test_capture_and_replay(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            profile_capture = ProfileCapture(capture_path=tmp_directory, threshold_seconds=0)
+            file_content = Path(SAMPLE_XML_PATH).read_text()
+
+            pdf_features = profile_capture.from_poppler_etree_content(SAMPLE_XML_PATH, file_content)
+
+            captures = ProfileCapture.get_captures(tmp_directory)
+            self.assertEqual(1, len(captures))
+            self.assertTrue(captures[0].name.startswith("sample_etree-"))
+            self.assertFalse((captures[0] / "profile.prof").exists())
+
+            self.assertEqual(captures, profile_capture.profile_pending())
+            self.assertEqual([], profile_capture.profile_pending())
+            capture_info = json.loads((captures[0] / "capture.json").read_text())
+            self.assertEqual(SAMPLE_XML_PATH, capture_info["source_path"])
+            self.assertGreater(capture_info["replay_seconds"], 0)
+            self.assertGreater(pstats.Stats(str(captures[0] / "profile.prof")).total_calls, 0)
+
+            replayed_pdf_features, seconds = ProfileCapture.replay(captures[0])
+            pdf_features.set_token_styles()
+            self.assertEqual(pdf_features.pages, replayed_pdf_features.pages)
+            self.assertGreater(seconds, 0)
+            self.assertEqual(0, replay_main([tmp_directory, "--profile", "--top", "3"]))
+
+    def test_fast_documents_are_not_captured(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            profile_capture = ProfileCapture(capture_path=tmp_directory, threshold_seconds=60)
+
+            pdf_features = profile_capture.from_poppler_etree(SAMPLE_XML_PATH)
+
+            self.assertEqual(PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH), pdf_features)
+            self.assertEqual([], ProfileCapture.get_captures(tmp_directory))
+
+    def test_batch_capture(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            xml_path = Path(shutil.copy(SAMPLE_XML_PATH, join(tmp_directory, "sample.xml")))
+            capture_path = Path(tmp_directory) / "captures"
+            profile_capture = ProfileCapture(capture_path=capture_path, threshold_seconds=0)
+
+            summary = BatchExtraction(Path(tmp_directory) / "outputs", profile_capture=profile_capture).run([xml_path])
+
+            self.assertEqual(1, summary.extracted_count)
+            captures = ProfileCapture.get_captures(capture_path)
+            self.assertEqual(["sample"], [path.name.split("-")[0] for path in captures])
+            self.assertTrue((captures[0] / "profile.prof").exists())
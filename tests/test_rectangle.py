@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from pdf_features.Rectangle import Rectangle
+
+
+class TestRectangle(TestCase):
+    def setUp(self):
+        self.rectangles = [Rectangle.from_coordinates(0, 0, 10, 10), Rectangle.from_coordinates(100, 100, 120, 110)]
+        self.others = [
+            Rectangle.from_coordinates(5, 0, 15, 10),
+            Rectangle.from_coordinates(0, 5, 10, 20),
+            Rectangle.from_coordinates(110, 105, 200, 200),
+            Rectangle.from_coordinates(300, 300, 310, 310),
+        ]
+
+    def test_get_intersection_percentages(self):
+        intersection_percentages = Rectangle.get_intersection_percentages(self.rectangles, self.others)
+
+        self.assertEqual([[50, 50, 0, 0], [0, 0, 25, 0]], intersection_percentages)
+        self.assertEqual(
+            [[rectangle.get_intersection_percentage(other) for other in self.others] for rectangle in self.rectangles],
+            intersection_percentages,
+        )
+
+    def test_get_top_intersections(self):
+        top_intersections = Rectangle.get_top_intersections(self.rectangles, self.others, k=1)
+
+        self.assertEqual([[(0, 50)], [(2, 25)]], top_intersections)
+
+    def test_get_vertical_intersections_and_horizontal_distances(self):
+        vertical_intersections = Rectangle.get_vertical_intersections(self.rectangles, self.others)
+        horizontal_distances = Rectangle.get_horizontal_distances(self.rectangles, self.others)
+
+        self.assertEqual(
+            [[rectangle.get_vertical_intersection(other) for other in self.others] for rectangle in self.rectangles],
+            vertical_intersections,
+        )
+        self.assertEqual(
+            [[rectangle.get_horizontal_distance(other) for other in self.others] for rectangle in self.rectangles],
+            horizontal_distances,
+        )
+
+    def test_numpy_and_prefilter_match_pure_python(self):
+        rectangles = [Rectangle.from_width_height(37 * index % 500, 23 * index % 700, 40, 12) for index in range(60)]
+        others = [Rectangle.from_width_height(53 * index % 450, 31 * index % 650, 120, 45) for index in range(25)]
+        expected = [[rectangle.get_intersection_percentage(other) for other in others] for rectangle in rectangles]
+
+        for prefilter in [True, False]:
+            for use_numpy in [True, False]:
+                self.assertEqual(expected, Rectangle.get_intersection_percentages(rectangles, others, prefilter, use_numpy))
+                self.assertEqual(
+                    Rectangle.get_top_intersections(rectangles, others, 2, prefilter=True, use_numpy=False),
+                    Rectangle.get_top_intersections(rectangles, others, 2, prefilter, use_numpy),
+                )
+
+        for use_numpy in [True, False]:
+            self.assertEqual(
+                [[rectangle.get_vertical_intersection(other) for other in others] for rectangle in rectangles],
+                Rectangle.get_vertical_intersections(rectangles, others, use_numpy),
+            )
+            self.assertEqual(
+                [[rectangle.get_horizontal_distance(other) for other in others] for rectangle in rectangles],
+                Rectangle.get_horizontal_distances(rectangles, others, use_numpy),
+            )
+            self.assertEqual(
+                [{}, {}], Rectangle.get_sparse_intersection_percentages(rectangles[:2], [], use_numpy=use_numpy)
+            )
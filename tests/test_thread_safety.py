@@ -0,0 +1,91 @@
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features.BatchExtraction import BatchExtraction, ExtractionFormat
+from pdf_features.ConversionLimits import ConversionLimits
+from pdf_features.ConversionReport import ConversionReason
+from pdf_features.ParallelPdfFeatures import ParallelPdfFeatures
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfPageCache import PdfPageCache
+from pdf_features.configuration import SAMPLE_XML_PATH
+
+DOCUMENTS_COUNT = 48
+
+
+class TestThreadSafety(TestCase):
+    @staticmethod
+    def write_documents(directory: str) -> list[Path]:
+        content = Path(SAMPLE_XML_PATH).read_bytes()
+        paths = list()
+        for index in range(DOCUMENTS_COUNT):
+            document_content = content.replace(b"Third line", f"Line {index % 7}".encode())
+            document_content = document_content.replace(b'font="1"', f'font="{index % 3 + 1}"'.encode())
+            document_content = document_content.replace(b'id="1"', f'id="{index % 3 + 1}"'.encode())
+            paths.append(Path(directory) / f"document_{index}.xml")
+            paths[-1].write_bytes(document_content)
+        return paths
+
+    @staticmethod
+    def extract(path: Path, page_cache: PdfPageCache | None = None) -> PdfFeatures:
+        pdf_features = PdfFeatures.from_poppler_etree(path, page_cache=page_cache)
+        pdf_features.set_token_styles()
+        pdf_features.get_paragraphs()
+        return pdf_features
+
+    def test_concurrent_extraction_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            paths = self.write_documents(tmp_directory)
+            expected_pdf_features = [self.extract(path) for path in paths]
+            page_cache = PdfPageCache(max_pages=8)
+
+            for _ in range(3):
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    pdf_features_list = list(executor.map(self.extract, paths, [page_cache] * len(paths)))
+
+                self.assertEqual(expected_pdf_features, pdf_features_list)
+                self.assertEqual(
+                    [pdf_features.pdf_modes for pdf_features in expected_pdf_features],
+                    [pdf_features.pdf_modes for pdf_features in pdf_features_list],
+                )
+
+            self.assertGreater(page_cache.page_hits, 0)
+            self.assertEqual(3 * DOCUMENTS_COUNT * 2, page_cache.page_hits + page_cache.page_misses)
+
+    def test_from_paths(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            paths = self.write_documents(tmp_directory)
+
+            pdf_features_list = ParallelPdfFeatures.from_paths(paths, workers=8)
+
+            self.assertEqual([PdfFeatures.from_poppler_etree(path, path.name) for path in paths], pdf_features_list)
+
+    def test_threaded_batch_extraction(self):
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            paths = self.write_documents(tmp_directory)
+            threads_path = Path(tmp_directory) / "threads"
+            sequential_path = Path(tmp_directory) / "sequential"
+
+            summary = BatchExtraction(threads_path, ExtractionFormat.HTML, jobs=8, use_threads=True).run(paths)
+            BatchExtraction(sequential_path, ExtractionFormat.HTML).run(paths)
+
+            self.assertEqual((DOCUMENTS_COUNT, 0), (summary.extracted_count, summary.failed_count))
+            for path in paths:
+                output_name = path.with_suffix(".html").name
+                self.assertEqual((sequential_path / output_name).read_text(), (threads_path / output_name).read_text())
+
+    def test_limited_commands_in_threads(self):
+        limits = ConversionLimits(timeout_seconds=30, memory_bytes=512 << 20, cpu_seconds=10)
+        script = "import resource, sys; open(sys.argv[1], 'w').write(str(resource.getrlimit(resource.RLIMIT_AS)[0]))"
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            output_paths = [Path(tmp_directory) / f"{index}.txt" for index in range(16)]
+            commands = [[sys.executable, "-c", script, str(output_path)] for output_path in output_paths]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                reasons = list(executor.map(limits.run, commands))
+            memory_limits = [int(output_path.read_text()) for output_path in output_paths]
+
+        self.assertEqual([ConversionReason.OK] * 16, reasons)
+        self.assertEqual([512 << 20] * 16, memory_limits)
@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from pdf_features.configuration import SAMPLE_XML_PATH
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.TokenFeatureMatrix import MODE_COLUMNS, NUMERIC_COLUMNS, RAW_COLUMNS, TokenFeatureMatrix
+from pdf_token_type_labels.TokenType import TokenType
+
+
+class TestTokenFeatureMatrix(TestCase):
+    def test_feature_matrix(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        tokens = [token for _, token in pdf_features.loop_tokens()]
+        tokens[0].token_type = TokenType.TITLE
+        pdf_features.set_token_styles()
+
+        feature_matrix = TokenFeatureMatrix.from_pdf_features([pdf_features, pdf_features])
+
+        self.assertEqual(14, feature_matrix.rows_count)
+        self.assertEqual(len(feature_matrix.values), feature_matrix.rows_count * feature_matrix.columns_count)
+        self.assertEqual([0] * 7 + [1] * 7, feature_matrix.document_indexes.tolist())
+        self.assertEqual([72, 50, 272, 68], feature_matrix.get_row(0)[1:5])
+        self.assertEqual([1, 0, 0, 0, 0, 0, 0], feature_matrix.get_column("token_type_title")[:7])
+        self.assertEqual(1, feature_matrix.get_column("script_type_superscript")[2])
+        self.assertEqual(1, feature_matrix.get_column("hyperlink_type_web_url")[3])
+
+    def test_feature_matrix_without_categorical_features(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        feature_matrix = TokenFeatureMatrix.from_pdf_features([pdf_features], categorical_features=False)
+
+        self.assertEqual(NUMERIC_COLUMNS, feature_matrix.columns)
+        self.assertEqual(len(feature_matrix.values), 7 * len(NUMERIC_COLUMNS))
+        self.assertEqual([18, 12, 7, 12, 12, 12, 12], feature_matrix.get_column("height"))
+
+    def test_numpy_feature_matrix_matches_python_feature_matrix(self):
+        if not TokenFeatureMatrix.get_numpy_module():
+            self.skipTest("numpy is not installed")
+
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        pdf_features.set_token_styles()
+
+        for categorical_features in [True, False]:
+            numpy_matrix = TokenFeatureMatrix.from_pdf_features([pdf_features, pdf_features], categorical_features)
+            python_matrix = TokenFeatureMatrix.from_pdf_features(
+                [pdf_features, pdf_features], categorical_features, use_numpy=False
+            )
+            self.assertEqual(python_matrix.columns, numpy_matrix.columns)
+            self.assertEqual(python_matrix.values, numpy_matrix.values)
+            self.assertEqual(python_matrix.document_indexes, numpy_matrix.document_indexes)
+
+    def test_row_definitions_match_columns(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+        page = pdf_features.pages[0]
+
+        self.assertEqual(len(RAW_COLUMNS), len(TokenFeatureMatrix.get_raw_features(page.tokens[0], page)))
+        self.assertEqual(len(MODE_COLUMNS), len(TokenFeatureMatrix.get_mode_features(pdf_features.pdf_modes)))
+        numeric_features = TokenFeatureMatrix.get_numeric_features(page.tokens[0], page, pdf_features.pdf_modes)
+        self.assertEqual(len(NUMERIC_COLUMNS), len(numeric_features))
+
+    def test_feature_matrix_rejects_single_pdf_features(self):
+        pdf_features = PdfFeatures.from_poppler_etree(SAMPLE_XML_PATH)
+
+        with self.assertRaises(TypeError):
+            TokenFeatureMatrix.from_pdf_features(pdf_features)
+
+        with self.assertRaises(TypeError):
+            TokenFeatureMatrix.from_pdf_features([pdf_features.pages[0]])